@@ -0,0 +1,62 @@
+"""
+Generate tests/fixtures/sample_schemas_generated.py.
+
+Freezes the output of the full-schema builder in tests/fixtures/sample_schemas.py
+into a module-level tuple literal, so the test fixtures can load it without
+assembling the column list at import time.
+
+Usage (from the project root):
+    python scripts/gen_schema_fixtures.py          # regenerate the module
+    python scripts/gen_schema_fixtures.py --check  # exit 1 if it is stale
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+OUTPUT_PATH = PROJECT_ROOT / 'tests' / 'fixtures' / 'sample_schemas_generated.py'
+
+HEADER = '''"""
+Generated by scripts/gen_schema_fixtures.py -- do not edit by hand.
+
+Frozen output of create_full_schema() in sample_schemas.py.
+"""
+
+'''
+
+
+def render() -> str:
+    """Render the generated module source."""
+    sys.path.insert(0, str(PROJECT_ROOT))
+    from tests.fixtures.sample_schemas import _build_full_schema
+
+    lines = [HEADER, '_GENERATED_FULL_SCHEMA = (\n']
+    lines.extend(f'    {column!r},\n' for column in _build_full_schema())
+    lines.append(')\n')
+    return ''.join(lines)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--check', action='store_true',
+                        help='Only verify the generated module is up to date')
+    args = parser.parse_args()
+
+    source = render()
+
+    if args.check:
+        current = OUTPUT_PATH.read_text() if OUTPUT_PATH.exists() else ''
+        if current != source:
+            print(f"{OUTPUT_PATH} is out of date; rerun scripts/gen_schema_fixtures.py")
+            return 1
+        print(f"{OUTPUT_PATH} is up to date")
+        return 0
+
+    OUTPUT_PATH.write_text(source)
+    print(f"Wrote {OUTPUT_PATH}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
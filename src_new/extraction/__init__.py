@@ -16,7 +16,7 @@ Components:
 from .replay_loader import ReplayLoader
 from .state_extractor import StateExtractor, UnitTracker, BuildingTracker
 from .schema_manager import SchemaManager
-from .wide_table_builder import WideTableBuilder
+from .wide_table_builder import WideTableBuilder, ColumnarRowSink
 from .parquet_writer import ParquetWriter
 
 __all__ = [
@@ -26,5 +26,6 @@ __all__ = [
     'BuildingTracker',
     'SchemaManager',
     'WideTableBuilder',
+    'ColumnarRowSink',
     'ParquetWriter',
 ]
@@ -5,8 +5,9 @@ This component handles writing the wide-format game state data to parquet
 files with proper compression and schema handling.
 """
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterable, Optional, Tuple
 from pathlib import Path
+import itertools
 import logging
 import json
 
@@ -15,11 +16,22 @@ import pyarrow as pa
 import pyarrow.parquet as pq
 
 from .schema_manager import SchemaManager
+from .wide_table_builder import WideTableBuilder
 
 
 logger = logging.getLogger(__name__)
 
 
+# Arrow type for each schema dtype; 'object' columns other than Messages are
+# left to Arrow's type inference
+ARROW_TYPES = {
+    'int64': pa.int64(),
+    'float64': pa.float64(),
+    'string': pa.string(),
+    'bool': pa.bool_(),
+}
+
+
 class ParquetWriter:
     """
     Writes wide-format data to parquet files.
@@ -36,6 +48,11 @@ class ParquetWriter:
             compression: Compression codec ('snappy', 'gzip', 'brotli', 'zstd', None)
         """
         self.compression = compression
+
+        # (schema columns, per-column Arrow types) for write_frames(); rebuilt
+        # when the schema's column list changes
+        self._arrow_types: Optional[Tuple[List[str], List[Optional[pa.DataType]]]] = None
+
         logger.info(f"ParquetWriter initialized with {compression} compression")
 
     def write_game_state(
@@ -100,6 +117,146 @@ class ParquetWriter:
             logger.error(f"Failed to write parquet: {e}")
             raise IOError(f"Failed to write parquet: {e}")
 
+    def write_batches(
+        self,
+        batches: Iterable[pa.RecordBatch],
+        output_path: Path,
+        arrow_schema: Optional[pa.Schema] = None,
+        row_group_size: int = 65536
+    ) -> int:
+        """
+        Stream Arrow record batches to parquet.
+
+        Batches are written as they arrive through a single pq.ParquetWriter,
+        so peak memory is bounded by one batch rather than the whole file.
+        Each batch becomes at least one row group. Dictionary encoding is
+        disabled, since wide-table columns are almost all numeric.
+
+        Args:
+            batches: Record batches, all with the same schema
+            output_path: Path to output parquet file
+            arrow_schema: Schema of the batches (taken from the first batch if None)
+            row_group_size: Maximum rows per row group
+
+        Returns:
+            Total number of rows written
+
+        Raises:
+            ValueError: If there are no batches and no schema
+            IOError: If write fails
+        """
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+
+        batches = iter(batches)
+        if arrow_schema is None:
+            first = next(batches, None)
+            if first is None:
+                raise ValueError("Cannot write empty batch stream without a schema")
+            arrow_schema = first.schema
+            batches = itertools.chain([first], batches)
+
+        logger.info(f"Streaming batches to {output_path} (row_group_size={row_group_size})")
+
+        total_rows = 0
+        try:
+            with pq.ParquetWriter(
+                output_path,
+                arrow_schema,
+                compression=self.compression,
+                use_dictionary=False,
+            ) as writer:
+                for batch in batches:
+                    writer.write_batch(batch, row_group_size=row_group_size)
+                    total_rows += batch.num_rows
+
+            logger.info(f"Successfully wrote {total_rows} rows to {output_path}")
+
+        except Exception as e:
+            logger.error(f"Failed to write parquet: {e}")
+            raise IOError(f"Failed to write parquet: {e}")
+
+        return total_rows
+
+    def write_frames(
+        self,
+        extracted_states: List[Dict[str, Any]],
+        output_path: Path,
+        builder: WideTableBuilder
+    ) -> int:
+        """
+        Write extracted states to parquet without building row dictionaries.
+
+        The states are converted column by column with
+        builder.build_rows_batch_columnar(), and each column becomes an Arrow
+        array of the type given by the schema, so neither pandas nor Arrow has
+        to infer types row by row. Values are stored as in write_game_state
+        (Messages serialized the same way).
+
+        Args:
+            extracted_states: List of state dictionaries from StateExtractor
+            output_path: Path to output parquet file
+            builder: WideTableBuilder whose schema defines the columns
+
+        Returns:
+            Number of rows written
+
+        Raises:
+            ValueError: If extracted_states is empty
+            IOError: If write fails
+        """
+        if not extracted_states:
+            raise ValueError("Cannot write empty states list")
+
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+
+        logger.info(f"Writing {len(extracted_states)} frames to {output_path}")
+
+        columns = builder.build_rows_batch_columnar(extracted_states)
+        if 'Messages' in columns:
+            columns['Messages'] = [
+                self._serialize_messages_for_parquet(value) for value in columns['Messages']
+            ]
+
+        arrays = {
+            col: pa.array(columns[col], type=arrow_type, from_pandas=True)
+            for col, arrow_type in zip(*self._get_arrow_types(builder.schema))
+        }
+
+        try:
+            table = pa.Table.from_pydict(arrays)
+            pq.write_table(table, output_path, compression=self.compression)
+            logger.info(f"Successfully wrote {table.num_rows} rows to {output_path}")
+
+        except Exception as e:
+            logger.error(f"Failed to write parquet: {e}")
+            raise IOError(f"Failed to write parquet: {e}")
+
+        return table.num_rows
+
+    def _get_arrow_types(
+        self,
+        schema: SchemaManager
+    ) -> Tuple[List[str], List[Optional[pa.DataType]]]:
+        """
+        Get the schema columns and the Arrow type of each (None to infer).
+
+        Args:
+            schema: SchemaManager with column definitions
+
+        Returns:
+            Tuple of (columns, arrow types) in schema order
+        """
+        columns = schema.get_column_list()
+        if self._arrow_types is None or self._arrow_types[0] != columns:
+            arrow_types = [
+                pa.string() if col == 'Messages' else ARROW_TYPES.get(schema.get_dtype(col))
+                for col in columns
+            ]
+            self._arrow_types = (list(columns), arrow_types)
+        return self._arrow_types
+
     def write_messages(
         self,
         messages: List[Dict[str, Any]],
@@ -268,13 +425,15 @@ class ParquetWriter:
         Returns:
             NaN, string, or JSON-serialized string
         """
-        if pd.isna(value):
-            return value
-        elif isinstance(value, str):
+        # Check the common string case first; pd.isna() on a list returns an
+        # array rather than a bool
+        if isinstance(value, str):
             return value
         elif isinstance(value, list):
             # Convert list to JSON string
             return json.dumps(value)
+        elif value is None or pd.isna(value):
+            return value
         else:
             # Fallback for unexpected types
             return str(value)
@@ -291,9 +450,7 @@ class ParquetWriter:
         Returns:
             NaN, string, or list of strings
         """
-        if pd.isna(value):
-            return value
-        elif isinstance(value, str):
+        if isinstance(value, str):
             # Try to parse as JSON (it might be a list)
             if value.startswith('['):
                 try:
@@ -5,8 +5,9 @@ This component handles schema generation, column ordering, data types,
 and documentation for the wide-format parquet output.
 """
 
-from typing import List, Dict, Any, Set, Optional
+from typing import List, Dict, Any, Iterable, Set, Optional
 from pathlib import Path
+import copy
 import json
 import logging
 
@@ -16,6 +17,21 @@ import numpy as np
 logger = logging.getLogger(__name__)
 
 
+# (suffix, dtype, description) of the columns added for every unit
+UNIT_COLUMNS = [
+    ('x', 'float64', 'X-coordinate'),
+    ('y', 'float64', 'Y-coordinate'),
+    ('z', 'float64', 'Z-coordinate (height)'),
+    ('health', 'float64', 'Current health'),
+    ('health_max', 'float64', 'Maximum health'),
+    ('shields', 'float64', 'Current shields'),
+    ('shields_max', 'float64', 'Maximum shields'),
+    ('energy', 'float64', 'Current energy'),
+    ('energy_max', 'float64', 'Maximum energy'),
+    ('state', 'string', 'Unit state (built/existing/killed)'),
+]
+
+
 class SchemaManager:
     """
     Manages wide-table column schema and documentation.
@@ -26,7 +42,11 @@ class SchemaManager:
 
     def __init__(self):
         """Initialize the SchemaManager."""
-        self.columns: List[str] = []
+        self._columns: List[str] = []
+        # Membership index over _columns; rebuilt on the next lookup once
+        # stale (after the list is replaced or handed out for editing)
+        self._column_lookup: Set[str] = set()
+        self._lookup_stale = False
         self.column_docs: Dict[str, Dict[str, Any]] = {}
         self.dtypes: Dict[str, str] = {}
 
@@ -39,6 +59,52 @@ class SchemaManager:
 
         logger.info("SchemaManager initialized")
 
+    @property
+    def columns(self) -> List[str]:
+        """
+        Ordered list of column names.
+
+        The list may be edited in place; the membership index is rebuilt on
+        the next lookup after the list is handed out.
+        """
+        self._lookup_stale = True
+        return self._columns
+
+    @columns.setter
+    def columns(self, columns: List[str]) -> None:
+        self._columns = columns
+        self._lookup_stale = True
+
+    def has_column(self, col_name: str) -> bool:
+        """
+        Check whether a column is in the schema.
+
+        Args:
+            col_name: Column name
+
+        Returns:
+            True if the column exists
+        """
+        return col_name in self._lookup()
+
+    def _lookup(self) -> Set[str]:
+        """Get the membership index, rebuilding it if columns may have changed."""
+        if self._lookup_stale:
+            self._column_lookup = set(self._columns)
+            self._lookup_stale = False
+        return self._column_lookup
+
+    def _append_column(self, col_name: str) -> None:
+        """
+        Append a new column, keeping the membership index in step.
+
+        Args:
+            col_name: Column name not yet in the schema
+        """
+        lookup = self._lookup()
+        self._columns.append(col_name)
+        lookup.add(col_name)
+
     def _add_base_columns(self):
         """Add base columns that exist in every row."""
         base_columns = [
@@ -48,8 +114,8 @@ class SchemaManager:
         ]
 
         for col_name, dtype, description in base_columns:
-            if col_name not in self.columns:
-                self.columns.append(col_name)
+            if not self.has_column(col_name):
+                self._append_column(col_name)
                 self.dtypes[col_name] = dtype
                 self.column_docs[col_name] = {
                     'description': description,
@@ -107,7 +173,7 @@ class SchemaManager:
                     logger.warning(f"Error during schema scan at loop {game_loop}: {e}")
                     break
 
-        logger.info(f"Schema built with {len(self.columns)} columns")
+        logger.info(f"Schema built with {len(self._columns)} columns")
         logger.info(f"  Units discovered: {len(self._seen_units)}")
         logger.info(f"  Buildings discovered: {len(self._seen_buildings)}")
 
@@ -156,25 +222,11 @@ class SchemaManager:
         # Get unit type name for documentation
         unit_type_name = unit_data.get('unit_type_name', 'unknown')
 
-        # Define unit columns
-        unit_columns = [
-            ('x', 'float64', 'X-coordinate'),
-            ('y', 'float64', 'Y-coordinate'),
-            ('z', 'float64', 'Z-coordinate (height)'),
-            ('health', 'float64', 'Current health'),
-            ('health_max', 'float64', 'Maximum health'),
-            ('shields', 'float64', 'Current shields'),
-            ('shields_max', 'float64', 'Maximum shields'),
-            ('energy', 'float64', 'Current energy'),
-            ('energy_max', 'float64', 'Maximum energy'),
-            ('state', 'string', 'Unit state (built/existing/killed)'),
-        ]
-
-        for col_suffix, dtype, description in unit_columns:
+        for col_suffix, dtype, description in UNIT_COLUMNS:
             col_name = f'{player}_{unit_id}_{col_suffix}'
 
-            if col_name not in self.columns:
-                self.columns.append(col_name)
+            if not self.has_column(col_name):
+                self._append_column(col_name)
                 self.dtypes[col_name] = dtype
                 self.column_docs[col_name] = {
                     'description': f'{description} for {player} {unit_type_name} {unit_id}',
@@ -182,6 +234,45 @@ class SchemaManager:
                     'missing_value': 'NaN' if dtype.startswith('float') or dtype.startswith('int') else 'null',
                 }
 
+    def add_unit_columns_bulk(self, player: str, unit_type: str, indices: Iterable[int]) -> None:
+        """
+        Add columns for many units of one type in a single pass.
+
+        Equivalent to calling add_unit_columns() for unit ids
+        '<unit_type>_<index:03d>' (e.g. 'marine_001'), but the new column
+        names are formatted in one comprehension and the column list,
+        dtypes and docs are each extended once.
+
+        Args:
+            player: Player prefix (e.g., 'p1', 'p2')
+            unit_type: Unit type name (e.g., 'Marine')
+            indices: Per-type unit indices
+        """
+        unit_ids = [f'{unit_type.lower()}_{i:03d}' for i in indices]
+
+        # Name -> (dtype, description); the dict also drops repeated indices
+        candidates = {
+            f'{player}_{unit_id}_{col_suffix}': (dtype, f'{description} for {player} {unit_type} {unit_id}')
+            for unit_id in unit_ids
+            for col_suffix, dtype, description in UNIT_COLUMNS
+        }
+        lookup = self._lookup()
+        new_columns = {
+            col_name: spec for col_name, spec in candidates.items() if col_name not in lookup
+        }
+        if not new_columns:
+            return
+
+        self._columns.extend(new_columns)
+        lookup.update(new_columns)
+        for col_name, (dtype, description) in new_columns.items():
+            self.dtypes[col_name] = dtype
+            self.column_docs[col_name] = {
+                'description': description,
+                'type': dtype,
+                'missing_value': 'NaN' if dtype.startswith('float') or dtype.startswith('int') else 'null',
+            }
+
     def add_building_columns(self, player: str, building_id: str, building_data: Dict) -> None:
         """
         Add columns for a specific building.
@@ -210,8 +301,8 @@ class SchemaManager:
         for col_suffix, dtype, description in building_columns:
             col_name = f'{player}_{building_id}_{col_suffix}'
 
-            if col_name not in self.columns:
-                self.columns.append(col_name)
+            if not self.has_column(col_name):
+                self._append_column(col_name)
                 self.dtypes[col_name] = dtype
                 self.column_docs[col_name] = {
                     'description': f'{description} for {player} {building_type} {building_id}',
@@ -234,8 +325,8 @@ class SchemaManager:
             for col_suffix, dtype, description in economy_columns:
                 col_name = f'p{player_num}_{col_suffix}'
 
-                if col_name not in self.columns:
-                    self.columns.append(col_name)
+                if not self.has_column(col_name):
+                    self._append_column(col_name)
                     self.dtypes[col_name] = dtype
                     self.column_docs[col_name] = {
                         'description': f'{description} for player {player_num}',
@@ -256,8 +347,8 @@ class SchemaManager:
             for upgrade in common_upgrades:
                 col_name = f'p{player_num}_upgrade_{upgrade}'
 
-                if col_name not in self.columns:
-                    self.columns.append(col_name)
+                if not self.has_column(col_name):
+                    self._append_column(col_name)
                     self.dtypes[col_name] = 'int64'
                     self.column_docs[col_name] = {
                         'description': f'{upgrade.replace("_", " ").title()} for player {player_num}',
@@ -272,7 +363,7 @@ class SchemaManager:
         Returns:
             List of column names in order
         """
-        return self.columns.copy()
+        return self._columns.copy()
 
     def generate_documentation(self) -> Dict[str, Dict[str, Any]]:
         """
@@ -307,7 +398,7 @@ class SchemaManager:
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
         schema_data = {
-            'columns': self.columns,
+            'columns': self._columns,
             'dtypes': self.dtypes,
             'documentation': self.column_docs,
         }
@@ -336,7 +427,7 @@ class SchemaManager:
         self.dtypes = schema_data['dtypes']
         self.column_docs = schema_data['documentation']
 
-        logger.info(f"Schema loaded from {schema_path} ({len(self.columns)} columns)")
+        logger.info(f"Schema loaded from {schema_path} ({len(self._columns)} columns)")
 
     def get_dtype(self, column_name: str) -> str:
         """
@@ -377,8 +468,8 @@ class SchemaManager:
         for player_num in [1, 2]:
             col_name = f'p{player_num}_{unit_type.lower()}_count'
 
-            if col_name not in self.columns:
-                self.columns.append(col_name)
+            if not self.has_column(col_name):
+                self._append_column(col_name)
                 self.dtypes[col_name] = 'int64'
                 self.column_docs[col_name] = {
                     'description': f'Count of {unit_type} units for player {player_num}',
@@ -386,9 +477,31 @@ class SchemaManager:
                     'missing_value': '0',
                 }
 
+    def clone(self) -> 'SchemaManager':
+        """
+        Copy this schema so columns can be added without affecting it.
+
+        Column lists, dtypes, docs and seen-entity sets are copied; the
+        per-column documentation entries are shared, as they are never
+        modified in place.
+
+        Returns:
+            New SchemaManager with the same columns
+        """
+        clone = copy.copy(self)
+        clone._columns = list(self._columns)
+        clone._column_lookup = set(self._lookup())
+        clone.column_docs = dict(self.column_docs)
+        clone.dtypes = dict(self.dtypes)
+        clone._seen_units = set(self._seen_units)
+        clone._seen_buildings = set(self._seen_buildings)
+        return clone
+
     def reset(self):
         """Reset the schema manager."""
-        self.columns.clear()
+        self._columns.clear()
+        self._column_lookup.clear()
+        self._lookup_stale = False
         self.column_docs.clear()
         self.dtypes.clear()
         self._seen_units.clear()
@@ -5,9 +5,18 @@ This component orchestrates the extraction of complete game state including
 units, buildings, economy, upgrades, and messages from SC2 observations.
 """
 
-from typing import Dict, Set, List, Optional, Any
+from collections.abc import Mapping
+from typing import Dict, FrozenSet, Set, List, Optional, Any, Iterable, Iterator, Tuple
 from pathlib import Path
 import logging
+import sys
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; the NumPy lookup is used instead
+    njit = None
 
 from ..extractors.unit_extractor import UnitExtractor
 from ..extractors.building_extractor import BuildingExtractor
@@ -18,6 +27,44 @@ from ..extractors.upgrade_extractor import UpgradeExtractor
 logger = logging.getLogger(__name__)
 
 
+# Economy section of a frame with no observation data
+EMPTY_ECONOMY: Dict[str, int] = {
+    'minerals': 0,
+    'vespene': 0,
+    'supply_used': 0,
+    'supply_cap': 0,
+    'workers': 0,
+    'idle_workers': 0,
+}
+
+
+def fresh_empty_state(game_loop: int) -> Dict[str, Any]:
+    """
+    Build the extracted state of a frame with no observation data.
+
+    Every section is a new container, so callers may modify the result.
+
+    Args:
+        game_loop: Game loop of the frame
+
+    Returns:
+        State dictionary with the keys of StateExtractor.extract_observation(),
+        no units, buildings, upgrades or messages, and EMPTY_ECONOMY values
+    """
+    return {
+        'game_loop': game_loop,
+        'p1_units': {},
+        'p2_units': {},
+        'p1_buildings': {},
+        'p2_buildings': {},
+        'p1_economy': EMPTY_ECONOMY.copy(),
+        'p2_economy': EMPTY_ECONOMY.copy(),
+        'p1_upgrades': {},
+        'p2_upgrades': {},
+        'messages': [],
+    }
+
+
 class StateExtractor:
     """
     Extracts complete game state from pysc2 observations.
@@ -81,6 +128,10 @@ class StateExtractor:
 
         # TODO: Test case - Extract complete state from observation
         """
+        if obs is None or getattr(obs, 'observation', None) is None:
+            logger.warning(f"No observation data at game loop {game_loop}; using empty state")
+            return fresh_empty_state(game_loop)
+
         state = {'game_loop': game_loop}
 
         # Extract units for both players
@@ -104,6 +155,51 @@ class StateExtractor:
 
         return state
 
+    def extract_observations(self, observations: Iterable[Tuple[Any, int]]) -> List[Dict[str, Any]]:
+        """
+        Extract complete state from a sequence of observations.
+
+        Produces the same states as calling extract_observation() per frame,
+        but resolves the per-player extractors once for the whole batch
+        instead of on every frame.
+
+        Args:
+            observations: Iterable of (obs, game_loop) pairs, in game order
+
+        Returns:
+            List of state dictionaries (see extract_observation)
+        """
+        p1_units = self.unit_extractors[1].extract
+        p2_units = self.unit_extractors[2].extract
+        p1_buildings = self.building_extractors[1].extract
+        p2_buildings = self.building_extractors[2].extract
+        p1_economy = self.economy_extractors[1].extract
+        p2_economy = self.economy_extractors[2].extract
+        p1_upgrades = self.upgrade_extractors[1].extract
+        p2_upgrades = self.upgrade_extractors[2].extract
+        extract_messages = self.extract_messages
+
+        states = []
+        for obs, game_loop in observations:
+            if obs is None or getattr(obs, 'observation', None) is None:
+                logger.warning(f"No observation data at game loop {game_loop}; using empty state")
+                states.append(fresh_empty_state(game_loop))
+                continue
+            states.append({
+                'game_loop': game_loop,
+                'p1_units': p1_units(obs),
+                'p2_units': p2_units(obs),
+                'p1_buildings': p1_buildings(obs),
+                'p2_buildings': p2_buildings(obs),
+                'p1_economy': p1_economy(obs),
+                'p2_economy': p2_economy(obs),
+                'p1_upgrades': p1_upgrades(obs),
+                'p2_upgrades': p2_upgrades(obs),
+                'messages': extract_messages(obs),
+            })
+
+        return states
+
     def extract_units(self, obs, player_id: int) -> Dict[str, Dict]:
         """
         Extract all units for a player.
@@ -214,19 +310,23 @@ class StateExtractor:
 
         # TODO: Test case - Extract messages
         """
-        messages = []
-
         # Extract chat messages from observation
         # Note: Messages are in obs.observation.chat
-        if hasattr(obs.observation, 'chat'):
-            for msg in obs.observation.chat:
-                messages.append({
-                    'game_loop': obs.observation.game_loop,
-                    'player_id': msg.player_id,
-                    'message': msg.message,
-                })
-
-        return messages
+        observation = obs.observation
+        chat = getattr(observation, 'chat', None)
+        if not chat:
+            # Most frames have no chat
+            return []
+
+        game_loop = observation.game_loop
+        return [
+            {
+                'game_loop': game_loop,
+                'player_id': msg.player_id,
+                'message': msg.message,
+            }
+            for msg in chat
+        ]
 
     def reset(self):
         """Reset all extractors and trackers."""
@@ -245,6 +345,105 @@ class StateExtractor:
         logger.info("StateExtractor reset")
 
 
+# Integer unit keys pack (unit_type << UNIT_KEY_SHIFT) | id_num
+UNIT_KEY_SHIFT = 32
+UNIT_KEY_ID_MASK = (1 << UNIT_KEY_SHIFT) - 1
+
+# Structured record layout accepted by UnitTracker.process_units in place of
+# a sequence of unit objects
+RAW_UNIT_DTYPE = np.dtype([
+    ('tag', np.int64),
+    ('unit_type', np.int32),
+    ('x', np.float32),
+    ('y', np.float32),
+    ('z', np.float32),
+])
+
+
+def _isin_sorted(values: np.ndarray, sorted_ref: np.ndarray) -> np.ndarray:
+    """
+    Membership test against an already sorted reference array.
+
+    Equivalent to np.isin(values, sorted_ref) but uses binary search on the
+    existing order instead of re-sorting both inputs on every call.
+
+    Args:
+        values: Array of tags to look up (any order)
+        sorted_ref: Sorted array of tags
+
+    Returns:
+        Boolean mask, True where the value is present in sorted_ref
+    """
+    if sorted_ref.size == 0:
+        return np.zeros(values.shape, dtype=bool)
+    idx = np.searchsorted(sorted_ref, values)
+    idx[idx == sorted_ref.size] = 0
+    return sorted_ref[idx] == values
+
+
+def _lookup_rows_numpy(tags: np.ndarray, sorted_tags: np.ndarray, sorted_rows: np.ndarray) -> np.ndarray:
+    """
+    Map tags to registry rows by binary search on the sorted registry tags.
+
+    Args:
+        tags: Tags to look up (int64)
+        sorted_tags: Registered tags in ascending order (int64)
+        sorted_rows: Registry row of each entry of sorted_tags (int64)
+
+    Returns:
+        int64 array with the registry row of each tag, -1 if unregistered
+    """
+    rows = np.full(tags.shape, -1, dtype=np.int64)
+    if sorted_tags.size:
+        pos = np.searchsorted(sorted_tags, tags)
+        pos[pos == sorted_tags.size] = 0
+        found = sorted_tags[pos] == tags
+        rows[found] = sorted_rows[pos[found]]
+    return rows
+
+
+def _lookup_rows_loop(tags, sorted_tags, sorted_rows):
+    """Scalar-loop form of _lookup_rows_numpy, compiled with numba when available."""
+    n = sorted_tags.size
+    rows = np.empty(tags.size, dtype=np.int64)
+    for i in range(tags.size):
+        tag = tags[i]
+        lo = 0
+        hi = n
+        while lo < hi:
+            mid = (lo + hi) >> 1
+            if sorted_tags[mid] < tag:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < n and sorted_tags[lo] == tag:
+            rows[i] = sorted_rows[lo]
+        else:
+            rows[i] = -1
+    return rows
+
+
+# Registry lookup used by UnitTracker.process_units
+_lookup_rows = njit(cache=True)(_lookup_rows_loop) if njit is not None else _lookup_rows_numpy
+
+
+class _UnitRegistryView(Mapping):
+    """Read-only tag -> (unit_type, id_num) view of a UnitTracker's registry."""
+
+    def __init__(self, tracker: 'UnitTracker'):
+        self._tracker = tracker
+
+    def __getitem__(self, tag: int) -> Tuple[int, int]:
+        unit_key = int(self._tracker._keys[self._tracker._tag_index[tag]])
+        return unit_key >> UNIT_KEY_SHIFT, unit_key & UNIT_KEY_ID_MASK
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._tracker._tag_index)
+
+    def __len__(self) -> int:
+        return len(self._tracker._tag_index)
+
+
 class UnitTracker:
     """
     Tracks units across frames and assigns consistent IDs.
@@ -253,20 +452,68 @@ class UnitTracker:
     provides consistent ID assignment and state tracking.
     """
 
+    # Initial capacity of the registry arrays; doubled when full
+    _INITIAL_CAPACITY = 1024
+
     def __init__(self):
         """Initialize the UnitTracker."""
-        self.unit_registry: Dict[int, tuple] = {}  # tag -> (unit_type, id_num)
-        self.unit_counters: Dict[int, int] = {}    # unit_type -> max_id
-        self.previous_frame_tags: Set[int] = set()
+        self._tag_index: Dict[int, int] = {}  # tag -> registry row
+        self.unit_counters: Dict[int, int] = {}  # unit_type -> next id_num
+
+        # Registry columns, one entry per registered unit in assignment order
+        self._size = 0
+        self._tags = np.empty(self._INITIAL_CAPACITY, dtype=np.int64)
+        self._keys = np.empty(self._INITIAL_CAPACITY, dtype=np.int64)
+        self._unit_ids: List[str] = []
+        # Registry tags in ascending order and their rows; rebuilt lazily
+        # after new units are registered
+        self._sorted_tags: Optional[np.ndarray] = None
+        self._sorted_rows: Optional[np.ndarray] = None
+
+        # Sorted, unique tags seen in the previous frame
+        self._prev_tags = np.empty(0, dtype=np.int64)
 
         logger.debug("UnitTracker initialized")
 
+    @property
+    def unit_registry(self) -> Mapping:
+        """Registered units as a read-only mapping of tag -> (unit_type, id_num)."""
+        return _UnitRegistryView(self)
+
+    @property
+    def registered_tags(self) -> np.ndarray:
+        """Tags of all registered units, in assignment order (read-only view)."""
+        view = self._tags[:self._size]
+        view.flags.writeable = False
+        return view
+
+    @property
+    def registered_keys(self) -> np.ndarray:
+        """Unit keys of all registered units, aligned with registered_tags (read-only view)."""
+        view = self._keys[:self._size]
+        view.flags.writeable = False
+        return view
+
+    @property
+    def previous_frame_tags(self) -> FrozenSet[int]:
+        """
+        Tags of the units present in the previous frame.
+
+        A read-only snapshot; assign a new set to replace the tags.
+        """
+        return frozenset(self._prev_tags.tolist())
+
+    @previous_frame_tags.setter
+    def previous_frame_tags(self, tags: Set[int]) -> None:
+        self._prev_tags = np.unique(np.fromiter(tags, dtype=np.int64, count=len(tags)))
+
     def process_units(self, raw_units, game_loop: int) -> Dict[str, Dict]:
         """
         Process raw units and return tracked units with states.
 
         Args:
-            raw_units: Raw unit data from observation
+            raw_units: Raw unit data from observation, either unit objects
+                (with tag, unit_type and pos) or a RAW_UNIT_DTYPE array
             game_loop: Current game loop
 
         Returns:
@@ -285,36 +532,55 @@ class UnitTracker:
         # TODO: Test case - Detect state transitions
         """
         tracked_units = {}
-        current_tags = set()
 
-        # Process each unit
-        for unit in raw_units:
-            tag = unit.tag
-            current_tags.add(tag)
+        if isinstance(raw_units, np.ndarray):
+            # Structured records: read each field as a whole column
+            current_tags = raw_units['tag'].astype(np.int64, copy=False)
+            unit_types = raw_units['unit_type'].tolist()
+            positions = zip(
+                raw_units['x'].tolist(),
+                raw_units['y'].tolist(),
+                raw_units['z'].tolist(),
+            )
+        else:
+            units = list(raw_units)
+            current_tags = np.fromiter((unit.tag for unit in units), dtype=np.int64, count=len(units))
+            unit_types = [unit.unit_type for unit in units]
+            positions = ((pos.x, pos.y, pos.z) for pos in (unit.pos for unit in units))
+
+        # Detect states and look up registry rows for the whole frame at once
+        is_new = ~_isin_sorted(current_tags, self._prev_tags)
+        rows = self._registry_rows(current_tags)
 
+        # Process each unit
+        unit_ids = self._unit_ids
+        for tag, unit_type, (x, y, z), new, row in zip(
+            current_tags.tolist(), unit_types, positions, is_new.tolist(), rows.tolist()
+        ):
             # Assign ID if new
-            unit_id = self.assign_unit_id(tag, unit.unit_type)
-
-            # Detect state
-            state = self.detect_state(tag, current_tags)
+            if row < 0:
+                unit_id = self.assign_unit_id(tag, unit_type)
+            else:
+                unit_id = unit_ids[row]
 
             # Build tracked unit data
             tracked_units[unit_id] = {
                 'tag': tag,
-                'unit_type': unit.unit_type,
-                'x': unit.pos.x,
-                'y': unit.pos.y,
-                'z': unit.pos.z,
-                'state': state,
+                'unit_type': unit_type,
+                'x': x,
+                'y': y,
+                'z': z,
+                'state': 'built' if new else 'existing',
                 'game_loop': game_loop,
             }
 
         # Detect killed units
-        dead_tags = self.previous_frame_tags - current_tags
-        for dead_tag in dead_tags:
-            if dead_tag in self.unit_registry:
-                unit_type, id_num = self.unit_registry[dead_tag]
-                unit_id = f"unit_{unit_type}_{id_num:03d}"
+        current_sorted = np.sort(current_tags)
+        dead_tags = self._prev_tags[~_isin_sorted(self._prev_tags, current_sorted)]
+        for dead_tag in dead_tags.tolist():
+            idx = self._tag_index.get(dead_tag)
+            if idx is not None:
+                unit_id = self._unit_ids[idx]
                 tracked_units[unit_id] = {
                     'tag': dead_tag,
                     'state': 'killed',
@@ -322,10 +588,26 @@ class UnitTracker:
                 }
 
         # Update for next frame
-        self.previous_frame_tags = current_tags
+        self._prev_tags = current_sorted
 
         return tracked_units
 
+    def _registry_rows(self, tags: np.ndarray) -> np.ndarray:
+        """
+        Look up the registry rows of a frame's tags.
+
+        Args:
+            tags: int64 array of unit tags
+
+        Returns:
+            int64 array of registry rows, -1 for unregistered tags
+        """
+        if self._sorted_rows is None:
+            order = np.argsort(self._tags[:self._size], kind='stable')
+            self._sorted_rows = order.astype(np.int64, copy=False)
+            self._sorted_tags = self._tags[order]
+        return _lookup_rows(tags, self._sorted_tags, self._sorted_rows)
+
     def assign_unit_id(self, tag: int, unit_type: int) -> str:
         """
         Assign or retrieve consistent ID for unit.
@@ -337,20 +619,153 @@ class UnitTracker:
         Returns:
             Consistent unit ID string
         """
-        if tag in self.unit_registry:
-            unit_type, id_num = self.unit_registry[tag]
-            return f"unit_{unit_type}_{id_num:03d}"
+        idx = self._tag_index.get(tag)
+        if idx is None:
+            idx = self._register(tag, unit_type)
+        return self._unit_ids[idx]
+
+    def assign_unit_ids_bulk(self, tags, unit_types) -> List[str]:
+        """
+        Assign or retrieve IDs for many units in one call.
+
+        Gives the same IDs as calling assign_unit_id() for each (tag,
+        unit_type) pair in order, but registers all new units at once: the
+        per-type numbers are computed with NumPy and the registry columns are
+        filled with one slice assignment each.
+
+        Args:
+            tags: Array-like of SC2 unit tags
+            unit_types: Array-like of SC2 unit type IDs, aligned with tags
+
+        Returns:
+            Consistent unit ID strings, aligned with tags
+        """
+        tags = np.asarray(tags, dtype=np.int64)
+        unit_types = np.asarray(unit_types, dtype=np.int64)
+
+        is_new = self._registry_rows(tags) < 0
+        if is_new.any():
+            # Register in first-seen order; a tag repeated in the input counts once
+            new_tags = tags[is_new]
+            _, first = np.unique(new_tags, return_index=True)
+            first.sort()
+            self._register_bulk(new_tags[first], unit_types[is_new][first])
 
-        # New unit - assign ID
-        if unit_type not in self.unit_counters:
-            self.unit_counters[unit_type] = 1
+        unit_ids = self._unit_ids
+        return [unit_ids[row] for row in self._registry_rows(tags).tolist()]
 
-        id_num = self.unit_counters[unit_type]
-        self.unit_counters[unit_type] += 1
+    def assign_unit_key(self, tag: int, unit_type: int) -> int:
+        """
+        Assign or retrieve the integer key for a unit.
 
-        self.unit_registry[tag] = (unit_type, id_num)
+        The key packs the unit type and its per-type number as
+        (unit_type << 32) | id_num. It is cheaper to hash and compare than the
+        string ID; use format_id() to get the string form.
 
-        return f"unit_{unit_type}_{id_num:03d}"
+        Args:
+            tag: SC2 unit tag
+            unit_type: SC2 unit type ID
+
+        Returns:
+            Consistent integer unit key
+        """
+        idx = self._tag_index.get(tag)
+        if idx is None:
+            idx = self._register(tag, unit_type)
+        return int(self._keys[idx])
+
+    def _register(self, tag: int, unit_type: int) -> int:
+        """
+        Register a new unit and assign its ID.
+
+        Args:
+            tag: SC2 unit tag (not yet registered)
+            unit_type: SC2 unit type ID
+
+        Returns:
+            Registry index of the new unit
+        """
+        id_num = self.unit_counters.get(unit_type, 1)
+        self.unit_counters[unit_type] = id_num + 1
+        unit_key = (unit_type << UNIT_KEY_SHIFT) | id_num
+
+        idx = self._size
+        self._reserve(idx + 1)
+        self._tags[idx] = tag
+        self._keys[idx] = unit_key
+        # Formatted once per unit; interned so downstream dict lookups on the
+        # ID hit the identity fast path
+        self._unit_ids.append(sys.intern(self.format_id(unit_key)))
+        self._size = idx + 1
+        self._sorted_tags = self._sorted_rows = None
+
+        self._tag_index[tag] = idx
+        return idx
+
+    def _register_bulk(self, tags: np.ndarray, unit_types: np.ndarray) -> None:
+        """
+        Register many new units, numbering them as _register() would in order.
+
+        Args:
+            tags: int64 array of distinct, not yet registered tags
+            unit_types: int64 array of unit type IDs, aligned with tags
+        """
+        n = tags.size
+
+        # Rank of each unit among the new units of its type, in input order
+        types, inverse, counts = np.unique(unit_types, return_inverse=True, return_counts=True)
+        by_type = np.argsort(inverse, kind='stable')
+        rank = np.empty(n, dtype=np.int64)
+        rank[by_type] = np.arange(n) - np.repeat(np.cumsum(counts) - counts, counts)
+
+        # Per-type numbers continue from the counters
+        first_nums = np.array(
+            [self.unit_counters.get(unit_type, 1) for unit_type in types.tolist()],
+            dtype=np.int64,
+        )
+        self.unit_counters.update(zip(types.tolist(), (first_nums + counts).tolist()))
+        keys = (unit_types << UNIT_KEY_SHIFT) | (first_nums[inverse] + rank)
+
+        start = self._size
+        end = start + n
+        self._reserve(end)
+        self._tags[start:end] = tags
+        self._keys[start:end] = keys
+        self._unit_ids.extend(sys.intern(self.format_id(key)) for key in keys.tolist())
+        self._size = end
+        self._sorted_tags = self._sorted_rows = None
+
+        self._tag_index.update(zip(tags.tolist(), range(start, end)))
+
+    def _reserve(self, capacity: int) -> None:
+        """
+        Make room for at least capacity units, doubling the registry columns as needed.
+
+        Args:
+            capacity: Required number of rows
+        """
+        size = self._tags.size
+        if capacity <= size:
+            return
+        while size < capacity:
+            size *= 2
+        for name in ('_tags', '_keys'):
+            column = np.empty(size, dtype=np.int64)
+            column[:self._size] = getattr(self, name)[:self._size]
+            setattr(self, name, column)
+
+    @staticmethod
+    def format_id(unit_key: int) -> str:
+        """
+        Format an integer unit key as its unit ID string.
+
+        Args:
+            unit_key: Key from assign_unit_key()
+
+        Returns:
+            Unit ID string, e.g. 'unit_48_001'
+        """
+        return "unit_%d_%03d" % (unit_key >> UNIT_KEY_SHIFT, unit_key & UNIT_KEY_ID_MASK)
 
     def detect_state(self, tag: int, current_tags: Set[int]) -> str:
         """
@@ -363,15 +778,36 @@ class UnitTracker:
         Returns:
             State string: 'built', 'existing', or 'killed'
         """
-        if tag not in self.previous_frame_tags:
+        # Binary search in the sorted previous-frame tags
+        prev_tags = self._prev_tags
+        idx = int(np.searchsorted(prev_tags, tag))
+        if idx == prev_tags.size or prev_tags[idx] != tag:
             return 'built'
         return 'existing'
 
     def reset(self):
         """Reset the tracker."""
-        self.unit_registry.clear()
+        self._tag_index.clear()
         self.unit_counters.clear()
-        self.previous_frame_tags.clear()
+        self._size = 0
+        self._unit_ids.clear()
+        self._sorted_tags = self._sorted_rows = None
+        self._prev_tags = np.empty(0, dtype=np.int64)
+
+
+class BuildingLifecycle:
+    """
+    Lifecycle loops of one tracked building.
+
+    Slotted, since the tracker keeps one per building for the whole replay.
+    """
+
+    __slots__ = ('started_loop', 'completed_loop', 'destroyed_loop')
+
+    def __init__(self, started_loop: int):
+        self.started_loop = started_loop
+        self.completed_loop: Optional[int] = None
+        self.destroyed_loop: Optional[int] = None
 
 
 class BuildingTracker:
@@ -384,18 +820,42 @@ class BuildingTracker:
 
     def __init__(self):
         """Initialize the BuildingTracker."""
-        self.building_registry: Dict[int, Dict] = {}  # tag -> building_info
-        self.previous_frame_tags: Set[int] = set()
+        self.building_registry: Dict[int, BuildingLifecycle] = {}  # tag -> lifecycle
+        # Tags of the previous and current frame; swapped each frame so both
+        # sets are reused, and never handed out
+        self._prev_tags: Set[int] = set()
+        self._current_tags: Set[int] = set()
 
         logger.debug("BuildingTracker initialized")
 
-    def process_buildings(self, raw_buildings, game_loop: int) -> Dict[str, Dict]:
+    @property
+    def previous_frame_tags(self) -> FrozenSet[int]:
+        """
+        Tags of the buildings present in the previous frame.
+
+        A read-only snapshot; assign a new set to replace the tags.
+        """
+        return frozenset(self._prev_tags)
+
+    @previous_frame_tags.setter
+    def previous_frame_tags(self, tags: Set[int]) -> None:
+        self._prev_tags = set(tags)
+
+    def process_buildings(
+        self,
+        raw_buildings,
+        game_loop: int,
+        out: Optional[Dict[str, Dict]] = None
+    ) -> Dict[str, Dict]:
         """
         Process raw buildings and track lifecycle.
 
         Args:
             raw_buildings: Raw building data from observation
             game_loop: Current game loop
+            out: Optional dictionary to clear and fill in place instead of
+                allocating a new one each frame; callers that keep a frame's
+                result past the next call should copy it
 
         Returns:
             Dictionary mapping building IDs to building data:
@@ -415,8 +875,13 @@ class BuildingTracker:
         # TODO: Test case - Detect building completion
         # TODO: Test case - Detect building destruction
         """
-        tracked_buildings = {}
-        current_tags = set()
+        if out is None:
+            tracked_buildings = {}
+        else:
+            tracked_buildings = out
+            tracked_buildings.clear()
+        current_tags = self._current_tags
+        current_tags.clear()
 
         # Process each building
         for building in raw_buildings:
@@ -425,64 +890,63 @@ class BuildingTracker:
 
             # Initialize registry entry if new
             if tag not in self.building_registry:
-                self.building_registry[tag] = {
-                    'started_loop': game_loop,
-                    'completed_loop': None,
-                    'destroyed_loop': None,
-                }
+                self.building_registry[tag] = BuildingLifecycle(game_loop)
 
             building_info = self.building_registry[tag]
 
             # Determine status
-            if building.build_progress >= 1.0:
+            progress = building.build_progress
+            if progress >= 1.0:
                 status = 'completed'
-                if building_info['completed_loop'] is None:
-                    building_info['completed_loop'] = game_loop
-            elif building.build_progress > 0:
+                if building_info.completed_loop is None:
+                    building_info.completed_loop = game_loop
+            elif progress > 0:
                 status = 'building'
             else:
                 status = 'started'
 
             # Build tracked building data
             building_id = f"building_{tag}"
+            pos = building.pos
             tracked_buildings[building_id] = {
                 'tag': tag,
                 'building_type': building.unit_type,
-                'x': building.pos.x,
-                'y': building.pos.y,
-                'z': building.pos.z,
+                'x': pos.x,
+                'y': pos.y,
+                'z': pos.z,
                 'status': status,
-                'progress': int(building.build_progress * 100),
-                'started_loop': building_info['started_loop'],
-                'completed_loop': building_info['completed_loop'],
-                'destroyed_loop': building_info['destroyed_loop'],
+                'progress': int(progress * 100),
+                'started_loop': building_info.started_loop,
+                'completed_loop': building_info.completed_loop,
+                'destroyed_loop': building_info.destroyed_loop,
                 'game_loop': game_loop,
             }
 
         # Detect destroyed buildings
-        dead_tags = self.previous_frame_tags - current_tags
+        dead_tags = self._prev_tags - current_tags
         for dead_tag in dead_tags:
             if dead_tag in self.building_registry:
                 building_info = self.building_registry[dead_tag]
-                if building_info['destroyed_loop'] is None:
-                    building_info['destroyed_loop'] = game_loop
+                if building_info.destroyed_loop is None:
+                    building_info.destroyed_loop = game_loop
 
                 building_id = f"building_{dead_tag}"
                 tracked_buildings[building_id] = {
                     'tag': dead_tag,
                     'status': 'destroyed',
-                    'started_loop': building_info['started_loop'],
-                    'completed_loop': building_info['completed_loop'],
-                    'destroyed_loop': building_info['destroyed_loop'],
+                    'started_loop': building_info.started_loop,
+                    'completed_loop': building_info.completed_loop,
+                    'destroyed_loop': building_info.destroyed_loop,
                     'game_loop': game_loop,
                 }
 
         # Update for next frame
-        self.previous_frame_tags = current_tags
+        self._prev_tags, self._current_tags = current_tags, self._prev_tags
 
         return tracked_buildings
 
     def reset(self):
         """Reset the tracker."""
         self.building_registry.clear()
-        self.previous_frame_tags.clear()
+        self._prev_tags.clear()
+        self._current_tags.clear()
@@ -5,10 +5,16 @@ This component takes the extracted game state and converts it into wide-format
 rows suitable for parquet storage and ML pipelines.
 """
 
-from typing import Dict, Any, List
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from numbers import Real
+from typing import Dict, Any, Callable, FrozenSet, Iterable, Iterator, List, Optional, Tuple
 import logging
+import multiprocessing
 
 import numpy as np
+import pyarrow as pa
 
 from .schema_manager import SchemaManager
 
@@ -16,6 +22,79 @@ from .schema_manager import SchemaManager
 logger = logging.getLogger(__name__)
 
 
+# SC2 "faster" game speed runs 22.4 game loops per second
+GAME_LOOPS_PER_SECOND = 22.4
+SECONDS_PER_GAME_LOOP = 1.0 / GAME_LOOPS_PER_SECOND
+
+# Per-entity attributes written to '<player>_<entity_id>_<attr>' columns
+UNIT_ATTRS = (
+    'x', 'y', 'z',
+    'health', 'health_max',
+    'shields', 'shields_max',
+    'energy', 'energy_max',
+    'state',
+)
+
+BUILDING_ATTRS = (
+    'x', 'y', 'z',
+    'status', 'progress',
+    'started_loop', 'completed_loop', 'destroyed_loop',
+)
+
+# Per-player attributes written to '<player>_<attr>' columns
+ECONOMY_ATTRS = (
+    'minerals', 'vespene',
+    'supply_used', 'supply_cap',
+    'workers', 'idle_workers',
+)
+
+# Per-player upgrades written to '<player>_upgrade_<attr>' columns
+UPGRADE_ATTRS = ('attack_level', 'armor_level', 'shield_level')
+
+
+class ColumnarRowSink:
+    """
+    Accumulates wide-format rows column by column for Arrow output.
+
+    Rows are appended as dictionaries (as produced by WideTableBuilder.build_row)
+    but stored as one value list per column, so the data can be handed to
+    Arrow as columns without a row-to-column transpose. Columns are expected
+    to hold scalar values; NaN and None become nulls.
+    """
+
+    def __init__(self, columns: List[str]):
+        """
+        Initialize the sink.
+
+        Args:
+            columns: Ordered column names of the output batch
+        """
+        self.columns = list(columns)
+        self._values: Dict[str, List[Any]] = {col: [] for col in self.columns}
+        self.num_rows = 0
+
+    def append(self, row: Dict[str, Any]) -> None:
+        """
+        Append one row; columns absent from the row are stored as null.
+
+        Args:
+            row: Row dictionary
+        """
+        for col, values in self._values.items():
+            values.append(row.get(col))
+        self.num_rows += 1
+
+    def to_record_batch(self) -> pa.RecordBatch:
+        """
+        Convert the accumulated columns to an Arrow record batch.
+
+        Returns:
+            RecordBatch with one column per sink column, in order
+        """
+        arrays = [pa.array(self._values[col], from_pandas=True) for col in self.columns]
+        return pa.RecordBatch.from_arrays(arrays, names=self.columns)
+
+
 class WideTableBuilder:
     """
     Transforms extracted state into wide-format rows.
@@ -32,14 +111,45 @@ class WideTableBuilder:
             schema: SchemaManager instance defining columns
         """
         self.schema = schema
+
+        # All-missing row for the current schema columns; copied per row
+        self._template_columns: Optional[List[str]] = None
+        self._row_template: Dict[str, Any] = {}
+        self._schema_set: FrozenSet[str] = frozenset()
+
+        # (player, entity_id) -> ((attr, column_name), ...), so column names
+        # are formatted once per entity rather than once per frame
+        self._unit_col_cache: Dict[Tuple[str, str], Tuple[Tuple[str, str], ...]] = {}
+        self._building_col_cache: Dict[Tuple[str, str], Tuple[Tuple[str, str], ...]] = {}
+
+        # Straight-line filler generated by compile_row_builder(), and the
+        # player -> entity ids it covers
+        self._compiled_fill: Optional[Callable[[Dict[str, Any], Dict[str, Any]], None]] = None
+        self._compiled_unit_ids: Dict[str, FrozenSet[str]] = {}
+        self._compiled_building_ids: Dict[str, FrozenSet[str]] = {}
+
+        # Straight-line economy/upgrade filler generated per schema by
+        # _compile_section_fill()
+        self._section_fill: Optional[Callable[[Dict[str, Any], Dict[str, Any]], None]] = None
+
+        # Column -> (kind, section, attr, default, missing) for
+        # build_rows_batch_columnar(); rebuilt when the schema changes
+        self._col_dispatch: Optional[Dict[str, Tuple[str, Optional[str], Optional[str], Any, Any]]] = None
+
         logger.info("WideTableBuilder initialized")
 
-    def build_row(self, extracted_state: Dict[str, Any]) -> Dict[str, Any]:
+    def build_row(
+        self,
+        extracted_state: Dict[str, Any],
+        timestamp_seconds: Optional[float] = None
+    ) -> Dict[str, Any]:
         """
         Transform extracted state to wide-format row.
 
         Args:
             extracted_state: State dictionary from StateExtractor.extract_observation()
+            timestamp_seconds: Precomputed timestamp (as passed by build_rows_batch);
+                derived from game_loop when None
 
         Returns:
             Dictionary with all columns, NaN for missing values:
@@ -56,44 +166,43 @@ class WideTableBuilder:
         # TODO: Test case - Validate row has all schema columns
         """
         # Initialize row with all columns as missing values
-        row = {}
-        for col in self.schema.get_column_list():
-            row[col] = self.schema.get_missing_value(col)
+        row = self._get_row_template().copy()
 
         # Add base columns
         game_loop = extracted_state.get('game_loop', 0)
         row['game_loop'] = game_loop
-        row['timestamp_seconds'] = game_loop / 22.4  # Convert to seconds
+        if timestamp_seconds is None:
+            timestamp_seconds = game_loop * SECONDS_PER_GAME_LOOP  # Convert to seconds
+        row['timestamp_seconds'] = timestamp_seconds
+
+        # Entities covered by compile_row_builder() are filled in one call
+        if self._compiled_fill is not None:
+            self._compiled_fill(row, extracted_state)
 
         # Add units for both players
         for player_num in [1, 2]:
-            units_key = f'p{player_num}_units'
+            player = f'p{player_num}'
+            units_key = f'{player}_units'
             if units_key in extracted_state:
                 units = extracted_state[units_key]
-                for unit_id, unit_data in units.items():
-                    self.add_unit_to_row(row, f'p{player_num}', unit_id, unit_data)
+                compiled_ids = self._compiled_unit_ids.get(player)
+                unit_ids = units.keys() - compiled_ids if compiled_ids else units.keys()
+                for unit_id in unit_ids:
+                    self.add_unit_to_row(row, player, unit_id, units[unit_id])
 
         # Add buildings for both players
         for player_num in [1, 2]:
-            buildings_key = f'p{player_num}_buildings'
+            player = f'p{player_num}'
+            buildings_key = f'{player}_buildings'
             if buildings_key in extracted_state:
                 buildings = extracted_state[buildings_key]
-                for building_id, building_data in buildings.items():
-                    self.add_building_to_row(row, f'p{player_num}', building_id, building_data)
-
-        # Add economy for both players
-        for player_num in [1, 2]:
-            economy_key = f'p{player_num}_economy'
-            if economy_key in extracted_state:
-                economy = extracted_state[economy_key]
-                self.add_economy_to_row(row, f'p{player_num}', economy)
+                compiled_ids = self._compiled_building_ids.get(player)
+                building_ids = buildings.keys() - compiled_ids if compiled_ids else buildings.keys()
+                for building_id in building_ids:
+                    self.add_building_to_row(row, player, building_id, buildings[building_id])
 
-        # Add upgrades for both players
-        for player_num in [1, 2]:
-            upgrades_key = f'p{player_num}_upgrades'
-            if upgrades_key in extracted_state:
-                upgrades = extracted_state[upgrades_key]
-                self.add_upgrades_to_row(row, f'p{player_num}', upgrades)
+        # Add economy and upgrades for both players
+        self._section_fill(row, extracted_state)
 
         # Add unit counts
         for player_num in [1, 2]:
@@ -110,6 +219,185 @@ class WideTableBuilder:
 
         return row
 
+    def _sync_schema(self) -> None:
+        """
+        Refresh the cached row template and column set from the schema.
+
+        They are only rebuilt when the schema's column list changes (e.g. unit
+        count columns added mid-replay).
+        """
+        columns = self.schema.get_column_list()
+        if columns != self._template_columns:
+            self._template_columns = columns
+            self._row_template = self._build_row_template(columns)
+            self._schema_set = frozenset(columns)
+            self._col_dispatch = None
+            self._compile_section_fill()
+            if self._compiled_fill is not None:
+                self._compile_fill()
+
+    def _build_row_template(self, columns: List[str]) -> Dict[str, Any]:
+        """
+        Build the all-missing row for the given columns.
+
+        Most columns share the NaN missing value, so the row is created in one
+        dict.fromkeys() pass with that shared value and only the columns with
+        a different missing value (e.g. None for strings) are overwritten.
+
+        Args:
+            columns: Schema columns in order
+
+        Returns:
+            Dictionary mapping each column to its missing value
+        """
+        template = dict.fromkeys(columns, np.nan)
+        for col, missing in zip(columns, map(self.schema.get_missing_value, columns)):
+            if missing is not np.nan:
+                template[col] = missing
+        return template
+
+    def compile_row_builder(
+        self,
+        unit_ids_by_player: Dict[str, List[str]],
+        building_ids_by_player: Dict[str, List[str]]
+    ) -> None:
+        """
+        Generate a specialized filler for a replay's known units and buildings.
+
+        Once a replay's entity roster is known (e.g. after a first pass), the
+        per-attribute loops of add_unit_to_row/add_building_to_row can be
+        replaced by one generated function with a straight-line assignment
+        per column. build_row() then uses it for these entities and falls back
+        to the generic path for any others. The filler is regenerated
+        automatically if the schema's columns change.
+
+        Args:
+            unit_ids_by_player: Player prefix -> unit ids, e.g. {'p1': ['marine_001']}
+            building_ids_by_player: Player prefix -> building ids
+        """
+        self._compiled_unit_ids = {
+            player: frozenset(ids) for player, ids in unit_ids_by_player.items()
+        }
+        self._compiled_building_ids = {
+            player: frozenset(ids) for player, ids in building_ids_by_player.items()
+        }
+        self._sync_schema()
+        self._compile_fill()
+
+        logger.info(
+            f"Compiled row builder for "
+            f"{sum(map(len, self._compiled_unit_ids.values()))} units, "
+            f"{sum(map(len, self._compiled_building_ids.values()))} buildings"
+        )
+
+    def _compile_fill(self) -> None:
+        """Generate self._compiled_fill for the compiled ids and current schema."""
+        schema_columns = self._schema_set
+        defaults: Dict[str, Any] = {}
+
+        def default_name(col_name: str) -> str:
+            # Missing values are bound into the function's namespace by name
+            name = f'_d{len(defaults)}'
+            defaults[name] = self.schema.get_missing_value(col_name)
+            return name
+
+        lines = ['def _fill(row, state):']
+
+        for player, unit_ids in sorted(self._compiled_unit_ids.items()):
+            lines.append(f'    units = state.get({player + "_units"!r})')
+            lines.append('    if units:')
+            for unit_id in sorted(unit_ids):
+                state_col = f'{player}_{unit_id}_state'
+                lines.append(f'        u = units.get({unit_id!r})')
+                lines.append('        if u is not None:')
+                lines.append("            if u.get('state') == 'killed':")
+                if state_col in schema_columns:
+                    lines.append(f"                row[{state_col!r}] = 'killed'")
+                else:
+                    lines.append('                pass')
+                lines.append('            else:')
+                body = [
+                    f'                row[{col!r}] = u.get({attr!r}, {default_name(col)})'
+                    for attr, col in self._entity_columns(
+                        self._unit_col_cache, UNIT_ATTRS, player, unit_id
+                    )
+                    if col in schema_columns
+                ]
+                lines.extend(body or ['                pass'])
+
+        for player, building_ids in sorted(self._compiled_building_ids.items()):
+            lines.append(f'    buildings = state.get({player + "_buildings"!r})')
+            lines.append('    if buildings:')
+            for building_id in sorted(building_ids):
+                lines.append(f'        b = buildings.get({building_id!r})')
+                lines.append('        if b is not None:')
+                body = [
+                    f'            row[{col!r}] = b.get({attr!r}, {default_name(col)})'
+                    for attr, col in self._entity_columns(
+                        self._building_col_cache, BUILDING_ATTRS, player, building_id
+                    )
+                    if col in schema_columns
+                ]
+                lines.extend(body or ['            pass'])
+
+        lines.append('    return None')
+
+        namespace = dict(defaults)
+        exec(compile('\n'.join(lines), '<WideTableBuilder row filler>', 'exec'), namespace)
+        self._compiled_fill = namespace['_fill']
+
+    def _compile_section_fill(self) -> None:
+        """
+        Generate self._section_fill for the current schema.
+
+        The economy and upgrade columns present in the schema are known once
+        the schema is, so instead of formatting and probing every candidate
+        column name per row (as add_economy_to_row/add_upgrades_to_row do),
+        one function is generated with a direct assignment per column.
+        """
+        schema_columns = self._schema_set
+        defaults: Dict[str, Any] = {}
+        lines = ['def _fill_sections(row, state):']
+
+        for player in ('p1', 'p2'):
+            body = []
+            for attr in ECONOMY_ATTRS:
+                col = f'{player}_{attr}'
+                if col in schema_columns:
+                    name = f'_d{len(defaults)}'
+                    defaults[name] = self.schema.get_missing_value(col)
+                    body.append(f'        row[{col!r}] = e.get({attr!r}, {name})')
+            if body:
+                lines.append(f'    if {player + "_economy"!r} in state:')
+                lines.append(f'        e = state[{player + "_economy"!r}]')
+                lines.extend(body)
+
+            body = []
+            for upgrade_name in UPGRADE_ATTRS:
+                col = f'{player}_upgrade_{upgrade_name}'
+                if col in schema_columns:
+                    body.append(f'        row[{col!r}] = u.get({upgrade_name!r}, 0)')
+            if body:
+                lines.append(f'    if {player + "_upgrades"!r} in state:')
+                lines.append(f'        u = state[{player + "_upgrades"!r}]')
+                lines.extend(body)
+
+        lines.append('    return None')
+
+        namespace = dict(defaults)
+        exec(compile('\n'.join(lines), '<WideTableBuilder section filler>', 'exec'), namespace)
+        self._section_fill = namespace['_fill_sections']
+
+    def _get_row_template(self) -> Dict[str, Any]:
+        """
+        Get the row with every schema column set to its missing value.
+
+        Returns:
+            Template row dictionary (shared; copy before modifying)
+        """
+        self._sync_schema()
+        return self._row_template
+
     def add_unit_to_row(
         self,
         row: Dict[str, Any],
@@ -137,16 +425,8 @@ class WideTableBuilder:
             return
 
         # Add all unit attributes
-        unit_columns = [
-            'x', 'y', 'z',
-            'health', 'health_max',
-            'shields', 'shields_max',
-            'energy', 'energy_max',
-            'state',
-        ]
-
-        for attr in unit_columns:
-            col_name = f'{player}_{unit_id}_{attr}'
+        columns = self._entity_columns(self._unit_col_cache, UNIT_ATTRS, player, unit_id)
+        for attr, col_name in columns:
             if col_name in row:
                 row[col_name] = unit_data.get(attr, self.schema.get_missing_value(col_name))
 
@@ -168,17 +448,40 @@ class WideTableBuilder:
 
         # TODO: Test case - Add building lifecycle data
         """
-        building_columns = [
-            'x', 'y', 'z',
-            'status', 'progress',
-            'started_loop', 'completed_loop', 'destroyed_loop',
-        ]
+        columns = self._entity_columns(
+            self._building_col_cache, BUILDING_ATTRS, player, building_id
+        )
 
-        for attr in building_columns:
-            col_name = f'{player}_{building_id}_{attr}'
+        for attr, col_name in columns:
             if col_name in row:
                 row[col_name] = building_data.get(attr, self.schema.get_missing_value(col_name))
 
+    @staticmethod
+    def _entity_columns(
+        cache: Dict[Tuple[str, str], Tuple[Tuple[str, str], ...]],
+        attrs: Tuple[str, ...],
+        player: str,
+        entity_id: str
+    ) -> Tuple[Tuple[str, str], ...]:
+        """
+        Get (attr, column_name) pairs for an entity, formatting them on first use.
+
+        Args:
+            cache: Per-builder cache for this entity kind
+            attrs: Attribute names for this entity kind
+            player: Player prefix
+            entity_id: Unit or building identifier
+
+        Returns:
+            Tuple of (attr, column_name) pairs in attrs order
+        """
+        key = (player, entity_id)
+        columns = cache.get(key)
+        if columns is None:
+            columns = tuple((attr, f'{player}_{entity_id}_{attr}') for attr in attrs)
+            cache[key] = columns
+        return columns
+
     def add_economy_to_row(
         self,
         row: Dict[str, Any],
@@ -193,13 +496,7 @@ class WideTableBuilder:
             player: Player prefix
             economy_data: Economy data dictionary
         """
-        economy_columns = [
-            'minerals', 'vespene',
-            'supply_used', 'supply_cap',
-            'workers', 'idle_workers',
-        ]
-
-        for attr in economy_columns:
+        for attr in ECONOMY_ATTRS:
             col_name = f'{player}_{attr}'
             if col_name in row:
                 row[col_name] = economy_data.get(attr, self.schema.get_missing_value(col_name))
@@ -218,14 +515,8 @@ class WideTableBuilder:
             player: Player prefix
             upgrades_data: Upgrades data dictionary
         """
-        # Map upgrade names to column names
-        upgrade_mapping = {
-            'attack_level': f'{player}_upgrade_attack_level',
-            'armor_level': f'{player}_upgrade_armor_level',
-            'shield_level': f'{player}_upgrade_shield_level',
-        }
-
-        for upgrade_name, col_name in upgrade_mapping.items():
+        for upgrade_name in UPGRADE_ATTRS:
+            col_name = f'{player}_upgrade_{upgrade_name}'
             if col_name in row:
                 row[col_name] = upgrades_data.get(upgrade_name, 0)
 
@@ -261,19 +552,15 @@ class WideTableBuilder:
 
         # TODO: Test case - Calculate unit counts correctly
         """
-        counts = {}
-
-        for unit_id, unit_data in units.items():
-            # Skip killed units
-            if unit_data.get('state') == 'killed':
-                continue
-
-            # Get unit type
-            unit_type_name = unit_data.get('unit_type_name')
-            if unit_type_name:
-                counts[unit_type_name] = counts.get(unit_type_name, 0) + 1
+        # Skip killed units
+        type_names = (
+            unit_data.get('unit_type_name')
+            for unit_data in units.values()
+            if unit_data.get('state') != 'killed'
+        )
+        counts = Counter(name for name in type_names if name)
 
-        return counts
+        return dict(counts)
 
     def build_rows_batch(self, extracted_states: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
@@ -285,16 +572,230 @@ class WideTableBuilder:
         Returns:
             List of row dictionaries
         """
-        rows = []
-        for state in extracted_states:
+        timestamps = self._batch_timestamps(
+            [state.get('game_loop', 0) for state in extracted_states]
+        )
+
+        return list(self._iter_rows(extracted_states, timestamps))
+
+    @staticmethod
+    def _batch_timestamps(game_loops: List[Any]) -> List[Optional[float]]:
+        """
+        Convert game loops to seconds in one vectorized pass.
+
+        Non-numeric game loops (e.g. None) map to None rather than NaN, so
+        build_row converts them itself and a bad state fails inside the
+        caller's per-state error handling.
+
+        Args:
+            game_loops: game_loop value of each state
+
+        Returns:
+            Timestamp in seconds (or None) for each state
+        """
+        numeric = [isinstance(loop, Real) for loop in game_loops]
+        if all(numeric):
+            return (np.asarray(game_loops, dtype=np.float64) * SECONDS_PER_GAME_LOOP).tolist()
+
+        values = np.asarray(
+            [loop if ok else 0 for loop, ok in zip(game_loops, numeric)], dtype=np.float64
+        )
+        seconds = (values * SECONDS_PER_GAME_LOOP).tolist()
+        return [t if ok else None for t, ok in zip(seconds, numeric)]
+
+    def build_rows_batch_columnar(
+        self,
+        extracted_states: List[Dict[str, Any]]
+    ) -> Dict[str, List[Any]]:
+        """
+        Build a batch of rows as one value list per schema column.
+
+        Base, economy and upgrade columns are read straight from the known
+        state sections with one comprehension per column, so the result can
+        be passed to pd.DataFrame() without building a dict per row. Columns
+        that need the full row logic (units, buildings, unit counts) are
+        taken from rows built with build_row(). Unlike build_rows_batch, a
+        state that fails to convert raises instead of being skipped, so every
+        column has one value per state.
+
+        Args:
+            extracted_states: List of state dictionaries
+
+        Returns:
+            Dictionary mapping each schema column (in order) to its values
+        """
+        dispatch = self._get_col_dispatch()
+
+        game_loops = [state.get('game_loop', 0) for state in extracted_states]
+        timestamps = self._batch_timestamps(game_loops)
+        if None in timestamps:
+            bad = game_loops[timestamps.index(None)]
+            raise TypeError(f"game_loop must be a number, got {bad!r}")
+
+        rows: Optional[List[Dict[str, Any]]] = None
+        columns: Dict[str, List[Any]] = {}
+
+        for col, (kind, section, attr, default, missing) in dispatch.items():
+            if kind == 'game_loop':
+                columns[col] = list(game_loops)
+            elif kind == 'timestamp':
+                columns[col] = list(timestamps)
+            elif kind == 'messages':
+                columns[col] = [
+                    self._format_messages(state.get('messages', []))
+                    for state in extracted_states
+                ]
+            elif kind == 'section':
+                columns[col] = [
+                    state[section].get(attr, default) if section in state else missing
+                    for state in extracted_states
+                ]
+            else:
+                if rows is None:
+                    rows = [
+                        self.build_row(state, timestamp)
+                        for state, timestamp in zip(extracted_states, timestamps)
+                    ]
+                columns[col] = [row[col] for row in rows]
+
+        return columns
+
+    def build_rows_batch_parallel(
+        self,
+        extracted_states: List[Dict[str, Any]],
+        workers: Optional[int] = None
+    ) -> Dict[str, List[Any]]:
+        """
+        Build a columnar batch across worker processes.
+
+        The states are split into one contiguous chunk per worker. Each worker
+        builds its own WideTableBuilder over a copy of the schema once (in
+        the pool initializer) and runs build_rows_batch_columnar() on its
+        chunk; the per-chunk columns are concatenated in order. Rows are
+        built on the generic path, so a filler from compile_row_builder() is
+        not used by the workers.
+
+        Args:
+            extracted_states: List of state dictionaries
+            workers: Number of worker processes (default: CPU count); with one
+                worker, or no more states than workers, the batch is built in
+                this process
+
+        Returns:
+            Dictionary mapping each schema column (in order) to its values,
+            as returned by build_rows_batch_columnar()
+        """
+        workers = workers or multiprocessing.cpu_count()
+        if workers <= 1 or len(extracted_states) <= workers:
+            return self.build_rows_batch_columnar(extracted_states)
+
+        chunk_size = -(-len(extracted_states) // workers)
+        chunks = [
+            extracted_states[start:start + chunk_size]
+            for start in range(0, len(extracted_states), chunk_size)
+        ]
+
+        self._sync_schema()
+        columns: Dict[str, List[Any]] = {col: [] for col in self._template_columns}
+
+        with ProcessPoolExecutor(
+            max_workers=len(chunks),
+            initializer=_init_worker_builder,
+            initargs=(self.schema,),
+        ) as executor:
+            for chunk_columns in executor.map(_worker_build_columns, chunks):
+                for col, values in chunk_columns.items():
+                    columns[col].extend(values)
+
+        return columns
+
+    def _get_col_dispatch(self) -> Dict[str, Tuple[str, Optional[str], Optional[str], Any, Any]]:
+        """
+        Get the per-column dispatch used by build_rows_batch_columnar().
+
+        Each column name is parsed once per schema into
+        (kind, section, attr, default, missing), where section/attr locate
+        the value in the extracted state, default is used when the section
+        lacks attr, and missing when the state lacks the section.
+
+        Returns:
+            Ordered dictionary of column -> dispatch tuple
+        """
+        self._sync_schema()
+        if self._col_dispatch is not None:
+            return self._col_dispatch
+
+        dispatch = {}
+        for col in self._template_columns:
+            missing = self._row_template[col]
+            entry = ('row', None, None, None, missing)
+
+            if col == 'game_loop':
+                entry = ('game_loop', None, None, None, missing)
+            elif col == 'timestamp_seconds':
+                entry = ('timestamp', None, None, None, missing)
+            elif col == 'Messages':
+                entry = ('messages', None, None, None, missing)
+            else:
+                player, _, attr = col.partition('_')
+                if player in ('p1', 'p2'):
+                    if attr in ECONOMY_ATTRS:
+                        entry = ('section', f'{player}_economy', attr, missing, missing)
+                    elif attr.startswith('upgrade_') and attr[8:] in UPGRADE_ATTRS:
+                        entry = ('section', f'{player}_upgrades', attr[8:], 0, missing)
+
+            dispatch[col] = entry
+
+        self._col_dispatch = dispatch
+        return dispatch
+
+    def iter_rows_batch(self, extracted_states: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily build rows from a stream of extracted states.
+
+        Unlike build_rows_batch, only one row is held at a time, so callers
+        can write rows out as they are produced.
+
+        Args:
+            extracted_states: Iterable of state dictionaries
+
+        Yields:
+            Row dictionaries (states that fail to convert are logged and skipped)
+        """
+        return self._iter_rows(extracted_states, repeat(None))
+
+    def _iter_rows(
+        self,
+        extracted_states: Iterable[Dict[str, Any]],
+        timestamps: Iterable[Optional[float]]
+    ) -> Iterator[Dict[str, Any]]:
+        """Build rows one at a time, logging and skipping states that fail."""
+        for state, timestamp_seconds in zip(extracted_states, timestamps):
             try:
-                row = self.build_row(state)
-                rows.append(row)
+                yield self.build_row(state, timestamp_seconds)
             except Exception as e:
                 logger.error(f"Error building row for game_loop {state.get('game_loop', '?')}: {e}")
                 # Continue with next state
 
-        return rows
+    def build_record_batch(self, extracted_states: Iterable[Dict[str, Any]]) -> pa.RecordBatch:
+        """
+        Build rows from a batch of extracted states directly into Arrow columns.
+
+        Rows are streamed into a ColumnarRowSink, so no list of row
+        dictionaries is kept. Failing states are logged and skipped as in
+        build_rows_batch.
+
+        Args:
+            extracted_states: Iterable of state dictionaries
+
+        Returns:
+            RecordBatch with one column per schema column
+        """
+        self._sync_schema()
+        sink = ColumnarRowSink(self._template_columns)
+        for row in self.iter_rows_batch(extracted_states):
+            sink.append(row)
+        return sink.to_record_batch()
 
     def validate_row(self, row: Dict[str, Any]) -> bool:
         """
@@ -306,11 +807,15 @@ class WideTableBuilder:
         Returns:
             True if valid, False otherwise
         """
-        schema_columns = set(self.schema.get_column_list())
-        row_columns = set(row.keys())
+        self._sync_schema()
+        schema_columns = self._schema_set
 
-        missing_columns = schema_columns - row_columns
-        extra_columns = row_columns - schema_columns
+        # Fast path: dict keys compare against the cached set without copying
+        if len(row) == len(schema_columns) and row.keys() == schema_columns:
+            return True
+
+        missing_columns = schema_columns - row.keys()
+        extra_columns = row.keys() - schema_columns
 
         if missing_columns:
             logger.warning(f"Row missing {len(missing_columns)} columns: {list(missing_columns)[:10]}")
@@ -360,7 +865,8 @@ class WideTableBuilder:
             'game_loop': row.get('game_loop'),
             'timestamp_seconds': row.get('timestamp_seconds'),
             'total_columns': len(row),
-            'missing_values': sum(1 for v in row.values() if v is None or (isinstance(v, float) and np.isnan(v))),
+            # NaN is the only value not equal to itself; avoids a NumPy call per cell
+            'missing_values': sum(1 for v in row.values() if v is None or (isinstance(v, float) and v != v)),
             'p1_minerals': row.get('p1_minerals'),
             'p2_minerals': row.get('p2_minerals'),
             'p1_supply_used': row.get('p1_supply_used'),
@@ -368,3 +874,31 @@ class WideTableBuilder:
         }
 
         return summary
+
+
+# Per-process builder used by build_rows_batch_parallel() workers
+_worker_builder: Optional[WideTableBuilder] = None
+
+
+def _init_worker_builder(schema: SchemaManager) -> None:
+    """
+    Pool initializer: build the worker's WideTableBuilder once.
+
+    Args:
+        schema: Schema shared by all chunks
+    """
+    global _worker_builder
+    _worker_builder = WideTableBuilder(schema)
+
+
+def _worker_build_columns(extracted_states: List[Dict[str, Any]]) -> Dict[str, List[Any]]:
+    """
+    Worker function for build_rows_batch_parallel().
+
+    Args:
+        extracted_states: Chunk of state dictionaries
+
+    Returns:
+        Columns for the chunk (see build_rows_batch_columnar)
+    """
+    return _worker_builder.build_rows_batch_columnar(extracted_states)
@@ -264,15 +264,16 @@ class BuildingExtractor:
             destroyed_loop = self.destruction_timestamps.get(tag, None)
 
             # Extract building data
+            pos = unit.pos
             building_data = {
                 'tag': tag,
                 'unit_type_id': unit.unit_type,
                 'unit_type_name': get_building_type_name(unit.unit_type),
 
                 # Position
-                'x': unit.pos.x,
-                'y': unit.pos.y,
-                'z': unit.pos.z,
+                'x': pos.x,
+                'y': pos.y,
+                'z': pos.z,
                 'facing': unit.facing,
 
                 # Vitals
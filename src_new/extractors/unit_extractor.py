@@ -188,15 +188,16 @@ class UnitExtractor:
             state = self._determine_state(tag, unit)
 
             # Extract unit data
+            pos = unit.pos
             unit_data = {
                 'tag': tag,
                 'unit_type_id': unit.unit_type,
                 'unit_type_name': get_unit_type_name(unit.unit_type),
 
                 # Position
-                'x': unit.pos.x,
-                'y': unit.pos.y,
-                'z': unit.pos.z,
+                'x': pos.x,
+                'y': pos.y,
+                'z': pos.z,
                 'facing': unit.facing,
 
                 # Vitals
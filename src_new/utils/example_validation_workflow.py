@@ -122,10 +122,10 @@ def example_3_generate_validation_report():
         if parquet_files:
             print(f"\nValidating {len(parquet_files)} files...")
 
-            for parquet_file in parquet_files[:3]:  # Limit to first 3 for example
+            parquet_files = parquet_files[:3]  # Limit to first 3 for example
+            for parquet_file in parquet_files:
                 print(f"  - {parquet_file.name}")
-                report = validator.validate_game_state_parquet(parquet_file)
-                validations.append(report)
+            validations = validator.validate_many(parquet_files, quick=False)
         else:
             print(f"\n[SKIP] No game state parquet files found in {data_dir}")
             print("This is an example. Process replays first to generate parquet files.")
@@ -5,17 +5,61 @@ This module provides comprehensive validation of extracted parquet files,
 checking for data integrity, schema compliance, and logical consistency.
 """
 
-from typing import Dict, Any, List, Optional, Set
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import copy
+from typing import Dict, Any, List, Optional, Set, Tuple
 from pathlib import Path
 import logging
+import multiprocessing
+import re
 
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
 import pyarrow.parquet as pq
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional; the NumPy progress scan is used instead
+    njit = None
+
 
 logger = logging.getLogger(__name__)
 
+# Number of file versions a caching OutputValidator keeps reports for
+_REPORT_CACHE_SIZE = 1024
+
+# Individual unit _x columns (p{player}_{unit_type}_..._x), used as a proxy
+# for unit existence by the unit count check
+_UNIT_X_COLUMN = re.compile(r'p([12])_([a-z]+)_(?:.*_)?x')
+
+# Fixed text of the markdown validation report
+_REPORT_HEADER = "# SC2 Replay Extraction Validation Report\n"
+_REPORT_EMPTY = "# Validation Report\n\nNo validations performed.\n"
+_STATUS_PASS = "✅ PASS"
+_STATUS_FAIL = "❌ FAIL"
+_ALL_PASSED_LINE = "**Status**: ✅ All validations passed\n"
+_NO_ISSUES_LINE = "✅ No issues found. All validations passed successfully.\n"
+
+# Per-report templates, filled with str.format once per section
+_SUMMARY_TMPL = (
+    "**Total Files Validated**: {total}\n\n"
+    "## Summary\n\n"
+    "- **Valid Files**: {valid}/{total}\n"
+    "- **Total Errors**: {errors}\n"
+    "- **Total Warnings**: {warnings}\n"
+)
+_FAILED_STATUS_TMPL = "**Status**: ❌ {failed} file(s) failed validation\n"
+_FILE_HEADING_TMPL = "### {index}. {name} - {status}\n"
+_FILE_INFO_TMPL = (
+    "**File Info**:\n"
+    "- Rows: {rows}\n"
+    "- Columns: {columns}\n"
+    "- Size: {size_kb:.2f} KB\n"
+    "- Compression: {compression}\n"
+)
+
 
 class OutputValidator:
     """
@@ -31,8 +75,36 @@ class OutputValidator:
     - Unit count consistency
     """
 
-    def __init__(self):
-        """Initialize the OutputValidator."""
+    # Resource columns that must never be negative
+    RESOURCE_COLS = (
+        'p1_minerals', 'p1_vespene', 'p1_supply_cap',
+        'p2_minerals', 'p2_vespene', 'p2_supply_cap',
+    )
+
+    # Columns every game state / messages file must have
+    REQUIRED_GAME_STATE_COLS = frozenset({'game_loop', 'timestamp_seconds'})
+    REQUIRED_MESSAGE_COLS = frozenset({'game_loop', 'player_id', 'message'})
+
+    # Unit types whose _count columns are checked against unit columns
+    COUNT_CHECK_UNITS = ('marine', 'scv', 'zealot', 'probe', 'zergling', 'drone')
+
+    def __init__(self, memory_pool: Optional[pa.MemoryPool] = None, cache_reports: bool = False):
+        """
+        Initialize the OutputValidator.
+
+        Args:
+            memory_pool: Arrow memory pool for the allocations the checks
+                make (compute kernels, casts and pandas conversions), shared
+                by every validation this instance runs (default:
+                pa.default_memory_pool()). Parquet decoding always uses
+                Arrow's default pool.
+            cache_reports: Memoize validate_game_state_parquet reports for
+                files on disk (default: False); see that method
+        """
+        self.memory_pool = memory_pool if memory_pool is not None else pa.default_memory_pool()
+        self.cache_reports = cache_reports
+        # (resolved path, mtime_ns, size) -> report of a file that passed
+        self._report_cache: Dict[Tuple[str, int, int], dict] = {}
         logger.info("OutputValidator initialized")
 
     def validate_game_state_parquet(self, parquet_path: Path) -> dict:
@@ -51,7 +123,8 @@ class OutputValidator:
         - Required columns present
 
         Args:
-            parquet_path: Path to game state parquet file
+            parquet_path: Path to game state parquet file, or a readable
+                binary file-like object (e.g. io.BytesIO) holding one
 
         Returns:
             Validation report dictionary:
@@ -70,10 +143,338 @@ class OutputValidator:
         # TODO: Test case - Detect invalid state transitions
         # TODO: Test case - Detect unit count mismatches
         # TODO: Test case - Detect non-monotonic building progress
+
+        If the validator was created with cache_reports=True, reports of
+        files on disk that pass validation are memoized on this instance by
+        (resolved path, modification time, size), so re-validating an
+        unchanged file returns a copy of the earlier report. Reports with
+        errors are never cached.
+        """
+        if hasattr(parquet_path, 'read'):
+            return self._validate_game_state_source(parquet_path, '<in-memory buffer>')
+
+        parquet_path = Path(parquet_path)
+        cache_key = self._validation_cache_key(parquet_path)
+        if cache_key is None:
+            return self._validate_game_state_source(parquet_path, str(parquet_path))
+
+        report = self._report_cache.get(cache_key)
+        if report is None:
+            report = self._validate_game_state_source(parquet_path, str(parquet_path))
+            if not report['valid']:
+                return report
+            if len(self._report_cache) >= _REPORT_CACHE_SIZE:
+                # Evict the oldest entry (dicts keep insertion order)
+                del self._report_cache[next(iter(self._report_cache))]
+            self._report_cache[cache_key] = report
+
+        report = copy.deepcopy(report)
+        report['file_path'] = str(parquet_path)
+        return report
+
+    def _validation_cache_key(self, parquet_path: Path) -> Optional[Tuple[str, int, int]]:
+        """
+        Build the memoization key for a game state file.
+
+        Args:
+            parquet_path: Path to game state parquet file
+
+        Returns:
+            (resolved path, st_mtime_ns, st_size), or None if caching is
+            disabled or the file cannot be stat-ed
+        """
+        if not self.cache_reports:
+            return None
+        try:
+            resolved = parquet_path.resolve()
+            stat = resolved.stat()
+        except OSError:
+            return None
+        return str(resolved), stat.st_mtime_ns, stat.st_size
+
+    def _validate_game_state_source(self, parquet_path, file_path: str) -> dict:
+        """
+        Validate a game state parquet path or buffer (uncached).
+
+        Args:
+            parquet_path: Path or readable binary file-like object
+            file_path: Path reported in the 'file_path' field
+
+        Returns:
+            Validation report dictionary
+        """
+        is_buffer = hasattr(parquet_path, 'read')
+
+        logger.info(f"Validating game state parquet: {file_path}")
+
+        try:
+            # Check file exists
+            if not is_buffer and not parquet_path.exists():
+                return self._failed_report(file_path, f"File not found: {parquet_path}")
+
+            # Phase 1: schema and footer only
+            parquet_file = pq.ParquetFile(parquet_path)
+            metadata = parquet_file.metadata
+            schema = parquet_file.schema_arrow
+            file_info = {
+                'file_size_kb': self._source_size(parquet_path) / 1024,
+                'compression': metadata.row_group(0).column(0).compression,
+            }
+
+            # Empty files and missing base columns fail without reading any
+            # data pages
+            report = self._precheck_report(metadata.num_rows, schema, file_path)
+            if not report['valid']:
+                report['info'].update(file_info)
+                return report
+
+            # Phase 2: read only the columns the checks look at; NaN rates
+            # for the other columns come from footer null counts, or from
+            # one-column reads for floating point columns
+            columns = self._columns_to_read(schema.names)
+            table = parquet_file.read(columns=columns)
+            loaded = set(columns)
+            unread = [name for name in schema.names if name not in loaded]
+            missing_counts = self._statistics_null_counts(parquet_file, unread)
+
+        except Exception as e:
+            logger.error(f"Validation error: {e}", exc_info=True)
+            return self._failed_report(file_path, f"Validation exception: {e}")
+
+        report = self._validate_game_state(
+            table, schema, file_path, missing_counts=missing_counts
+        )
+        report['info'].update(file_info)
+        return report
+
+    def validate_game_state_table(self, table: pa.Table, file_path: Optional[str] = None) -> dict:
+        """
+        Validate game state data already held in memory as an Arrow table.
+
+        Runs the same checks as validate_game_state_parquet, for callers that
+        have just built the table (e.g. before or instead of writing it) and
+        would otherwise write it out only to read it back.
+
+        Args:
+            table: Game state table (one row per game loop)
+            file_path: Path reported in the 'file_path' field (defaults to
+                '<in-memory table>')
+
+        Returns:
+            Validation report dictionary (same structure as
+            validate_game_state_parquet, without the file size and
+            compression info)
+        """
+        return self._validate_game_state(
+            table,
+            table.schema,
+            file_path if file_path is not None else '<in-memory table>',
+        )
+
+    def _validate_game_state(
+        self,
+        table: pa.Table,
+        schema: pa.Schema,
+        file_path: str,
+        missing_counts: Optional[Dict[str, int]] = None
+    ) -> dict:
+        """
+        Run the game state checks.
+
+        Args:
+            table: Game state data; for a parquet file only the columns
+                from _columns_to_read
+            schema: Full schema of the data (column names and types)
+            file_path: Path reported in the 'file_path' field
+            missing_counts: Null counts for columns in schema but not in
+                table
+
+        Returns:
+            Validation report dictionary
+        """
+        # Cheapest checks first; an empty table or missing base columns
+        # fails the file without running the data checks
+        report = self._precheck_report(table.num_rows, schema, file_path)
+        if not report['valid']:
+            return report
+
+        try:
+            # Run validation checks
+            self._check_duplicate_game_loops(table, report)
+            self._check_column_types(schema, report)
+            self._check_resource_validity(table, report)
+
+            # Row-wise checks go through pandas, on just their columns
+            row_cols = self._row_check_columns(schema.names)
+            df = table.select(row_cols).to_pandas(memory_pool=self.memory_pool)
+            self._check_building_progress_monotonic(df, report)
+            self._check_unit_count_consistency(df, report)
+            self._check_state_transitions(df, report)
+
+            self._check_nan_patterns(table, report, missing_counts)
+
+            # Generate statistics
+            self._generate_stats(table, schema, report)
+
+            # Set overall validity
+            report['valid'] = len(report['errors']) == 0
+
+            if report['valid']:
+                logger.info(f"Validation passed with {len(report['warnings'])} warnings")
+            else:
+                logger.warning(f"Validation failed with {len(report['errors'])} errors")
+
+        except Exception as e:
+            logger.error(f"Validation error: {e}", exc_info=True)
+            report['errors'].append(f"Validation exception: {e}")
+            report['valid'] = False
+
+        return report
+
+    def _precheck_report(self, num_rows: int, schema: pa.Schema, file_path: str) -> dict:
+        """
+        Start a game state report with the checks that need no column data.
+
+        Runs the row count and required column checks, which for a parquet
+        file come from the footer and schema alone.
+
+        Args:
+            num_rows: Number of rows
+            schema: Full schema of the data
+            file_path: Path reported in the 'file_path' field
+
+        Returns:
+            Validation report dictionary; 'valid' is False if either check
+            failed, in which case no further checks should be run
+        """
+        report = {
+            'valid': True,
+            'file_path': file_path,
+            'errors': [],
+            'warnings': [],
+            'info': {
+                'num_rows': num_rows,
+                'num_columns': len(schema),
+            },
+            'checks': {},
+            'stats': {},
+        }
+
+        self._check_row_count(num_rows, report)
+        self._check_required_columns(schema.names, report)
+
+        if report['errors']:
+            report['valid'] = False
+            logger.warning(f"Validation failed with {len(report['errors'])} errors")
+        return report
+
+    def _columns_to_read(self, names: List[str]) -> List[str]:
+        """
+        Select the columns the game state checks read values from.
+
+        Args:
+            names: All column names in the file
+
+        Returns:
+            Column names, in file order
+        """
+        needed = {*self.REQUIRED_GAME_STATE_COLS, *self.RESOURCE_COLS,
+                  'p1_supply_used', 'p2_supply_used'}
+        needed.update(self._row_check_columns(names))
+        return [name for name in names if name in needed]
+
+    def _row_check_columns(self, names: List[str]) -> List[str]:
+        """
+        Select the columns used by the pandas row-wise checks.
+
+        These are building progress columns, state/status columns, and the
+        count and unit _x columns compared by _check_unit_count_consistency.
+
+        Args:
+            names: All column names
+
+        Returns:
+            Column names, in the given order
+        """
+        count_cols = self._count_columns(names)
+        count_names = set(count_cols.values())
+        unit_cols = {
+            col
+            for key, cols in self._unit_x_columns(names).items()
+            if key in count_cols
+            for col in cols
+        }
+        return [
+            name for name in names
+            if name.endswith(('_progress', '_state', '_status'))
+            or name in unit_cols or name in count_names
+        ]
+
+    def _count_columns(self, names) -> Dict[Tuple[int, str], str]:
+        """Map (player, unit_type) to the _count column present in names."""
+        present = set(names)
+        return {
+            (player, unit_type): f'p{player}_{unit_type}_count'
+            for player in [1, 2]
+            for unit_type in self.COUNT_CHECK_UNITS
+            if f'p{player}_{unit_type}_count' in present
+        }
+
+    @staticmethod
+    def _unit_x_columns(names) -> Dict[Tuple[int, str], List[str]]:
+        """Group individual unit _x columns by (player, unit_type), in one pass."""
+        groups: Dict[Tuple[int, str], List[str]] = {}
+        for name in names:
+            match = _UNIT_X_COLUMN.fullmatch(name)
+            if match:
+                groups.setdefault((int(match.group(1)), match.group(2)), []).append(name)
+        return groups
+
+    @staticmethod
+    def _source_size(source) -> int:
+        """Size in bytes of a parquet path or seekable file-like object."""
+        if hasattr(source, 'read'):
+            position = source.tell()
+            size = source.seek(0, 2)
+            source.seek(position)
+            return size
+        return source.stat().st_size
+
+    @staticmethod
+    def _failed_report(file_path: str, error: str) -> dict:
+        """Build the report for a file that could not be opened or read."""
+        return {
+            'valid': False,
+            'file_path': file_path,
+            'errors': [error],
+            'warnings': [],
+            'info': {},
+            'checks': {},
+            'stats': {},
+        }
+
+    def validate_game_state_metadata(self, parquet_path: Path) -> dict:
+        """
+        Quickly validate a game state parquet file from its footer.
+
+        A lighter alternative to validate_game_state_parquet for large files.
+        Column presence and row count come from the file metadata, and
+        resource bounds from the per-row-group column statistics, so no data
+        pages are decoded for them. Only the game_loop column is read (for
+        duplicates), plus any resource column whose statistics are missing or
+        inconclusive. Checks that need whole rows (unit counts, building
+        progress, state values, NaN patterns) are not performed.
+
+        Args:
+            parquet_path: Path to game state parquet file
+
+        Returns:
+            Validation report dictionary (same structure as
+            validate_game_state_parquet, with only the checks listed above)
         """
         parquet_path = Path(parquet_path)
 
-        logger.info(f"Validating game state parquet: {parquet_path}")
+        logger.info(f"Validating game state parquet metadata: {parquet_path}")
 
         # Initialize report
         report = {
@@ -93,41 +494,50 @@ class OutputValidator:
                 report['valid'] = False
                 return report
 
-            # Get file info
             parquet_file = pq.ParquetFile(parquet_path)
             metadata = parquet_file.metadata
+            names = parquet_file.schema_arrow.names
 
             report['info'] = {
                 'num_rows': metadata.num_rows,
                 'num_columns': metadata.num_columns,
                 'file_size_kb': parquet_path.stat().st_size / 1024,
-                'compression': metadata.row_group(0).column(0).compression,
+                'compression': metadata.row_group(0).column(0).compression if metadata.num_row_groups else None,
             }
 
-            # Load data
-            df = pd.read_parquet(parquet_path)
+            # Row count and required columns
+            self._check_row_count(metadata.num_rows, report)
+            self._check_required_columns(names, report)
 
-            # Run validation checks
-            self._check_row_count(df, report)
-            self._check_required_columns(df, report)
-            self._check_duplicate_game_loops(df, report)
-            self._check_column_types(df, report)
-            self._check_resource_validity(df, report)
-            self._check_building_progress_monotonic(df, report)
-            self._check_unit_count_consistency(df, report)
-            self._check_state_transitions(df, report)
-            self._check_nan_patterns(df, report)
+            # Duplicate game loops (projection read of one column)
+            if 'game_loop' in names and metadata.num_rows > 0:
+                game_loops = parquet_file.read(columns=['game_loop']).column('game_loop')
+                duplicate_count = len(game_loops) - pc.count_distinct(
+                    game_loops, memory_pool=self.memory_pool
+                ).as_py()
+                if duplicate_count > 0:
+                    report['errors'].append(f"Found {duplicate_count} duplicate game_loop values")
+                    report['checks']['no_duplicate_game_loops'] = False
+                else:
+                    report['checks']['no_duplicate_game_loops'] = True
+                report['stats']['game_loop_range'] = (
+                    pc.min(game_loops, memory_pool=self.memory_pool).as_py(),
+                    pc.max(game_loops, memory_pool=self.memory_pool).as_py(),
+                )
 
-            # Generate statistics
-            self._generate_stats(df, report)
+            # Resource bounds from column statistics
+            self._check_resource_statistics(parquet_file, names, report)
+
+            report['stats']['total_rows'] = metadata.num_rows
+            report['stats']['total_columns'] = metadata.num_columns
 
             # Set overall validity
             report['valid'] = len(report['errors']) == 0
 
             if report['valid']:
-                logger.info(f"Validation passed with {len(report['warnings'])} warnings")
+                logger.info(f"Metadata validation passed with {len(report['warnings'])} warnings")
             else:
-                logger.warning(f"Validation failed with {len(report['errors'])} errors")
+                logger.warning(f"Metadata validation failed with {len(report['errors'])} errors")
 
         except Exception as e:
             logger.error(f"Validation error: {e}", exc_info=True)
@@ -136,6 +546,55 @@ class OutputValidator:
 
         return report
 
+    def validate_many(
+        self,
+        parquet_paths: List[Path],
+        quick: bool = True,
+        workers: Optional[int] = None
+    ) -> List[dict]:
+        """
+        Validate several game state parquet files in parallel.
+
+        By default each file gets the footer-based validate_game_state_metadata
+        checks, which answer row count, required columns and resource bounds
+        from the parquet footers and read at most a few columns. The files are
+        validated independently rather than as a single pyarrow dataset: game
+        state files have different unit columns, so their schemas do not
+        unify.
+
+        Quick validation is mostly parquet I/O, which releases the GIL, so it
+        runs on a thread pool with this validator, and its memory_pool. Full
+        validation also runs the pandas/NumPy checks and uses worker
+        processes; a memory pool cannot be shared across processes, so each
+        worker validates with a new OutputValidator on Arrow's default pool,
+        and with report caching off.
+
+        Args:
+            parquet_paths: Paths to game state parquet files
+            quick: Use validate_game_state_metadata (True) or the full
+                validate_game_state_parquet (False)
+            workers: Number of worker threads/processes (default: CPU count);
+                with one worker, or a single file, files are validated in
+                this thread
+
+        Returns:
+            List of validation report dictionaries, in the order of
+            parquet_paths (suitable for generate_validation_report)
+        """
+        parquet_paths = list(parquet_paths)
+        workers = min(workers or multiprocessing.cpu_count(), len(parquet_paths))
+
+        if workers <= 1:
+            validate = self.validate_game_state_metadata if quick else self.validate_game_state_parquet
+            return [validate(path) for path in parquet_paths]
+
+        if quick:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                return list(executor.map(self.validate_game_state_metadata, parquet_paths))
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(_validate_game_state_file, parquet_paths))
+
     def validate_messages_parquet(self, parquet_path: Path) -> dict:
         """
         Validate messages parquet file.
@@ -193,11 +652,10 @@ class OutputValidator:
             }
 
             # Load data
-            df = pd.read_parquet(parquet_path)
+            df = _read_parquet(parquet_path)
 
             # Check required columns
-            required_cols = ['game_loop', 'player_id', 'message']
-            missing_cols = [col for col in required_cols if col not in df.columns]
+            missing_cols = self._missing_columns(self.REQUIRED_MESSAGE_COLS, df.columns)
 
             if missing_cols:
                 report['errors'].append(f"Missing required columns: {missing_cols}")
@@ -280,28 +738,28 @@ class OutputValidator:
         # TODO: Test case - Verify markdown formatting
         """
         if not validations:
-            return "# Validation Report\n\nNo validations performed.\n"
+            return _REPORT_EMPTY
 
         # Build report sections
-        lines = []
-        lines.append("# SC2 Replay Extraction Validation Report\n")
-        lines.append(f"**Total Files Validated**: {len(validations)}\n")
+        lines = [_REPORT_HEADER]
 
         # Summary statistics
         total_valid = sum(1 for v in validations if v['valid'])
         total_errors = sum(len(v['errors']) for v in validations)
         total_warnings = sum(len(v['warnings']) for v in validations)
 
-        lines.append("## Summary\n")
-        lines.append(f"- **Valid Files**: {total_valid}/{len(validations)}")
-        lines.append(f"- **Total Errors**: {total_errors}")
-        lines.append(f"- **Total Warnings**: {total_warnings}\n")
+        lines.append(_SUMMARY_TMPL.format(
+            total=len(validations),
+            valid=total_valid,
+            errors=total_errors,
+            warnings=total_warnings,
+        ))
 
         # Overall status
         if total_valid == len(validations):
-            lines.append("**Status**: ✅ All validations passed\n")
+            lines.append(_ALL_PASSED_LINE)
         else:
-            lines.append(f"**Status**: ❌ {len(validations) - total_valid} file(s) failed validation\n")
+            lines.append(_FAILED_STATUS_TMPL.format(failed=len(validations) - total_valid))
 
         # Individual file results
         lines.append("## File Validation Results\n")
@@ -310,37 +768,35 @@ class OutputValidator:
             file_path = validation.get('file_path', 'Unknown')
             file_name = Path(file_path).name
 
-            status = "✅ PASS" if validation['valid'] else "❌ FAIL"
-            lines.append(f"### {i}. {file_name} - {status}\n")
+            status = _STATUS_PASS if validation['valid'] else _STATUS_FAIL
+            lines.append(_FILE_HEADING_TMPL.format(index=i, name=file_name, status=status))
 
             # File info
             if 'info' in validation and validation['info']:
                 info = validation['info']
-                lines.append("**File Info**:")
-                lines.append(f"- Rows: {info.get('num_rows', 'N/A')}")
-                lines.append(f"- Columns: {info.get('num_columns', 'N/A')}")
-                lines.append(f"- Size: {info.get('file_size_kb', 0):.2f} KB")
-                lines.append(f"- Compression: {info.get('compression', 'N/A')}\n")
+                lines.append(_FILE_INFO_TMPL.format(
+                    rows=info.get('num_rows', 'N/A'),
+                    columns=info.get('num_columns', 'N/A'),
+                    size_kb=info.get('file_size_kb', 0),
+                    compression=info.get('compression', 'N/A'),
+                ))
 
             # Errors
             if validation['errors']:
                 lines.append("**Errors**:")
-                for error in validation['errors']:
-                    lines.append(f"- ❌ {error}")
+                lines.extend(f"- ❌ {error}" for error in validation['errors'])
                 lines.append("")
 
             # Warnings
             if validation['warnings']:
                 lines.append("**Warnings**:")
-                for warning in validation['warnings']:
-                    lines.append(f"- ⚠️ {warning}")
+                lines.extend(f"- ⚠️ {warning}" for warning in validation['warnings'])
                 lines.append("")
 
             # Statistics
             if 'stats' in validation and validation['stats']:
                 lines.append("**Statistics**:")
-                for key, value in validation['stats'].items():
-                    lines.append(f"- {key}: {value}")
+                lines.extend(f"- {key}: {value}" for key, value in validation['stats'].items())
                 lines.append("")
 
         # Recommendations
@@ -375,24 +831,28 @@ class OutputValidator:
             lines.append("")
 
         if total_errors == 0 and total_warnings == 0:
-            lines.append("✅ No issues found. All validations passed successfully.\n")
+            lines.append(_NO_ISSUES_LINE)
 
         return "\n".join(lines)
 
     # Helper methods for validation checks
 
-    def _check_row_count(self, df: pd.DataFrame, report: dict) -> None:
-        """Check that DataFrame has at least one row."""
-        if len(df) == 0:
+    def _check_row_count(self, num_rows: int, report: dict) -> None:
+        """Check that the data has at least one row."""
+        if num_rows == 0:
             report['errors'].append("Parquet file is empty (0 rows)")
             report['checks']['row_count'] = False
         else:
             report['checks']['row_count'] = True
 
-    def _check_required_columns(self, df: pd.DataFrame, report: dict) -> None:
+    @staticmethod
+    def _missing_columns(required: frozenset, names) -> List[str]:
+        """Return the required columns absent from names, sorted."""
+        return sorted(required.difference(names))
+
+    def _check_required_columns(self, names: List[str], report: dict) -> None:
         """Check that required base columns are present."""
-        required_cols = ['game_loop', 'timestamp_seconds']
-        missing_cols = [col for col in required_cols if col not in df.columns]
+        missing_cols = self._missing_columns(self.REQUIRED_GAME_STATE_COLS, names)
 
         if missing_cols:
             report['errors'].append(f"Missing required columns: {missing_cols}")
@@ -400,13 +860,17 @@ class OutputValidator:
         else:
             report['checks']['required_columns'] = True
 
-    def _check_duplicate_game_loops(self, df: pd.DataFrame, report: dict) -> None:
+    def _check_duplicate_game_loops(self, table: pa.Table, report: dict) -> None:
         """Check for duplicate game_loop values."""
-        if 'game_loop' not in df.columns:
+        if 'game_loop' not in table.column_names:
             return
 
-        duplicates = df['game_loop'].duplicated()
-        duplicate_count = duplicates.sum()
+        # mode='all' counts nulls (and NaNs) as one value each, matching
+        # pandas' duplicated() semantics
+        game_loops = table.column('game_loop')
+        duplicate_count = len(game_loops) - pc.count_distinct(
+            game_loops, mode='all', memory_pool=self.memory_pool
+        ).as_py()
 
         if duplicate_count > 0:
             report['errors'].append(f"Found {duplicate_count} duplicate game_loop values")
@@ -414,9 +878,16 @@ class OutputValidator:
         else:
             report['checks']['no_duplicate_game_loops'] = True
 
-    def _check_column_types(self, df: pd.DataFrame, report: dict) -> None:
-        """Validate column data types match expected schema."""
+    def _check_column_types(self, schema: pa.Schema, report: dict) -> None:
+        """
+        Validate column data types match expected schema.
+
+        Types are the pandas dtypes the schema converts to (so nullable
+        columns written from pandas keep their Int64 dtype), taken from an
+        empty table rather than converting any data.
+        """
         type_issues = []
+        df = schema.empty_table().to_pandas(memory_pool=self.memory_pool)
 
         # Check base columns
         if 'game_loop' in df.columns:
@@ -450,7 +921,7 @@ class OutputValidator:
         else:
             report['checks']['column_types'] = True
 
-    def _check_resource_validity(self, df: pd.DataFrame, report: dict) -> None:
+    def _check_resource_validity(self, table: pa.Table, report: dict) -> None:
         """
         Verify resources (minerals, gas, supply) are non-negative.
 
@@ -459,8 +930,128 @@ class OutputValidator:
         - Vespene gas >= 0
         - Supply used <= supply max
         - Supply max >= 0
+
+        The resource columns are stacked into one (rows x columns) block so
+        each check is a single comparison; null values become NaN and are
+        not counted.
         """
         issues = []
+        names = table.column_names
+
+        # Negative counts for every resource column present
+        present = [col for col in self.RESOURCE_COLS if col in names]
+        negative_counts = {}
+        if present:
+            block = self._numeric_block(table, present)
+            negative_counts = dict(zip(present, np.count_nonzero(block < 0, axis=0).tolist()))
+
+        # supply_used > supply_cap for every player with both columns, from
+        # one comparison of a (rows x players) used block against the caps
+        supply_players = [
+            player for player in [1, 2]
+            if f'p{player}_supply_used' in names and f'p{player}_supply_cap' in names
+        ]
+        over_cap_counts = {}
+        if supply_players:
+            used = self._numeric_block(table, [f'p{player}_supply_used' for player in supply_players])
+            cap = self._numeric_block(table, [f'p{player}_supply_cap' for player in supply_players])
+            over_cap_counts = dict(zip(supply_players, np.count_nonzero(used > cap, axis=0).tolist()))
+
+        for player in [1, 2]:
+            minerals_col = f'p{player}_minerals'
+            vespene_col = f'p{player}_vespene'
+            supply_cap_col = f'p{player}_supply_cap'
+
+            # Check minerals
+            count = negative_counts.get(minerals_col)
+            if count:
+                issues.append(f"Player {player} has negative minerals in {count} rows")
+
+            # Check vespene
+            count = negative_counts.get(vespene_col)
+            if count:
+                issues.append(f"Player {player} has negative vespene in {count} rows")
+
+            # Check supply
+            if player in over_cap_counts:
+                count = over_cap_counts[player]
+                if count:
+                    issues.append(f"Player {player} has supply_used > supply_cap in {count} rows")
+
+                count = negative_counts.get(supply_cap_col)
+                if count:
+                    issues.append(f"Player {player} has negative supply_cap in {count} rows")
+
+        if issues:
+            for issue in issues:
+                report['errors'].append(f"Resource constraint violation: {issue}")
+            report['checks']['resource_validity'] = False
+        else:
+            report['checks']['resource_validity'] = True
+
+    def _numeric_block(self, table: pa.Table, columns: List[str]) -> np.ndarray:
+        """
+        Stack numeric columns into one contiguous (rows x columns) array.
+
+        When every column is an integer column without nulls, the block is
+        int32 (half the bytes of the default int64) if all values fit; the
+        Arrow cast checks for overflow, and the original width is kept if
+        any value does not fit. Any null turns the block into float64 with
+        NaN in its place.
+
+        Args:
+            table: Source table
+            columns: Column names, all present in table
+
+        Returns:
+            2D array with one column per name
+        """
+        arrays = [table.column(col) for col in columns]
+        if all(pa.types.is_integer(array.type) and array.null_count == 0 for array in arrays):
+            try:
+                arrays = [pc.cast(array, pa.int32(), memory_pool=self.memory_pool) for array in arrays]
+            except pa.ArrowInvalid:
+                pass
+        return np.column_stack([array.to_numpy() for array in arrays])
+
+    def _check_resource_statistics(
+        self,
+        parquet_file: pq.ParquetFile,
+        names: List[str],
+        report: dict
+    ) -> None:
+        """
+        Verify resource constraints using parquet column statistics.
+
+        Same checks and messages as _check_resource_validity. Per-column
+        bounds come from row group min/max statistics; a column is only read
+        when its statistics are missing, or (for supply) when the bounds
+        alone cannot rule out supply_used > supply_cap.
+        """
+        issues = []
+        # Leaf column index by path; list columns add leaves, so schema
+        # positions and leaf indices can differ
+        schema = parquet_file.schema
+        leaf_index = {schema.column(j).path: j for j in range(len(schema))}
+        bounds_cache: Dict[str, Optional[Tuple[Any, Any]]] = {}
+
+        def bounds(col: str) -> Optional[Tuple[Any, Any]]:
+            if col not in bounds_cache:
+                j = leaf_index.get(col)
+                bounds_cache[col] = None if j is None else self._statistics_min_max(parquet_file, j)
+            return bounds_cache[col]
+
+        def read(*cols: str):
+            table = parquet_file.read(columns=list(cols))
+            return [table.column(col) for col in cols]
+
+        def count_negative(col: str) -> int:
+            col_bounds = bounds(col)
+            if col_bounds is not None and col_bounds[0] >= 0:
+                return 0
+            (values,) = read(col)
+            less = pc.less(values, 0, memory_pool=self.memory_pool)
+            return pc.sum(less, memory_pool=self.memory_pool).as_py() or 0
 
         for player in [1, 2]:
             minerals_col = f'p{player}_minerals'
@@ -469,25 +1060,31 @@ class OutputValidator:
             supply_cap_col = f'p{player}_supply_cap'
 
             # Check minerals
-            if minerals_col in df.columns:
-                if (df[minerals_col] < 0).any():
-                    count = (df[minerals_col] < 0).sum()
+            if minerals_col in names:
+                count = count_negative(minerals_col)
+                if count:
                     issues.append(f"Player {player} has negative minerals in {count} rows")
 
             # Check vespene
-            if vespene_col in df.columns:
-                if (df[vespene_col] < 0).any():
-                    count = (df[vespene_col] < 0).sum()
+            if vespene_col in names:
+                count = count_negative(vespene_col)
+                if count:
                     issues.append(f"Player {player} has negative vespene in {count} rows")
 
             # Check supply
-            if supply_used_col in df.columns and supply_cap_col in df.columns:
-                if (df[supply_used_col] > df[supply_cap_col]).any():
-                    count = (df[supply_used_col] > df[supply_cap_col]).sum()
-                    issues.append(f"Player {player} has supply_used > supply_cap in {count} rows")
-
-                if (df[supply_cap_col] < 0).any():
-                    count = (df[supply_cap_col] < 0).sum()
+            if supply_used_col in names and supply_cap_col in names:
+                used_bounds = bounds(supply_used_col)
+                cap_bounds = bounds(supply_cap_col)
+                if used_bounds is None or cap_bounds is None or used_bounds[1] > cap_bounds[0]:
+                    # Bounds overlap; only the rows can tell
+                    used, cap = read(supply_used_col, supply_cap_col)
+                    over = pc.greater(used, cap, memory_pool=self.memory_pool)
+                    count = pc.sum(over, memory_pool=self.memory_pool).as_py() or 0
+                    if count:
+                        issues.append(f"Player {player} has supply_used > supply_cap in {count} rows")
+
+                count = count_negative(supply_cap_col)
+                if count:
                     issues.append(f"Player {player} has negative supply_cap in {count} rows")
 
         if issues:
@@ -497,6 +1094,75 @@ class OutputValidator:
         else:
             report['checks']['resource_validity'] = True
 
+    @staticmethod
+    def _statistics_min_max(parquet_file: pq.ParquetFile, column_index: int) -> Optional[Tuple[Any, Any]]:
+        """
+        Get a column's overall (min, max) from its row group statistics.
+
+        Args:
+            parquet_file: Open parquet file
+            column_index: Leaf column index in the parquet schema
+
+        Returns:
+            (min, max) tuple, or None if any row group lacks statistics
+        """
+        metadata = parquet_file.metadata
+        col_min = col_max = None
+        for i in range(metadata.num_row_groups):
+            stats = metadata.row_group(i).column(column_index).statistics
+            if stats is None or not stats.has_min_max:
+                return None
+            col_min = stats.min if col_min is None else min(col_min, stats.min)
+            col_max = stats.max if col_max is None else max(col_max, stats.max)
+        if col_min is None:
+            return None
+        return col_min, col_max
+
+    def _statistics_null_counts(self, parquet_file: pq.ParquetFile, names: List[str]) -> Dict[str, int]:
+        """
+        Get per-column missing value counts without loading the columns together.
+
+        Null counts come from row group statistics. Statistics do not count
+        floating point NaN values stored as non-null, so floating point
+        columns, and columns whose statistics lack a null count, are read
+        one at a time instead and counted like the loaded columns.
+
+        Args:
+            parquet_file: Open parquet file
+            names: Column names to count
+
+        Returns:
+            Dictionary mapping column name to null (plus NaN) count
+        """
+        schema = parquet_file.schema
+        arrow_schema = parquet_file.schema_arrow
+        leaf_index = {schema.column(j).path: j for j in range(len(schema))}
+        metadata = parquet_file.metadata
+
+        counts = {}
+        to_read = []
+        for name in names:
+            if pa.types.is_floating(arrow_schema.field(name).type):
+                to_read.append(name)
+                continue
+            j = leaf_index.get(name)
+            total = 0
+            for i in range(metadata.num_row_groups):
+                stats = None if j is None else metadata.row_group(i).column(j).statistics
+                if stats is None or not stats.has_null_count:
+                    total = None
+                    break
+                total += stats.null_count
+            if total is None:
+                to_read.append(name)
+            else:
+                counts[name] = total
+
+        for name in to_read:
+            column = parquet_file.read(columns=[name]).column(name)
+            counts[name] = self._missing_count(column)
+        return counts
+
     def _check_building_progress_monotonic(self, df: pd.DataFrame, report: dict) -> None:
         """
         Verify building progress is monotonically increasing (never decreases).
@@ -511,17 +1177,21 @@ class OutputValidator:
         # Find all building progress columns
         progress_cols = [col for col in df.columns if col.endswith('_progress')]
 
-        for col in progress_cols:
-            # Check range
-            if (df[col] < 0).any() or (df[col] > 100).any():
-                issues.append(f"{col} has values outside range [0, 100]")
+        if progress_cols:
+            # One (rows x columns) block for every progress column; missing
+            # values become NaN, so steps into or out of a gap never count
+            progress = np.ascontiguousarray(
+                df[progress_cols].to_numpy(dtype=np.float64, na_value=np.nan)
+            )
 
-            # Check monotonicity (progress should never decrease)
-            diff = df[col].diff()
-            decreases = (diff < 0).sum()
+            # Check range and monotonicity (progress should never decrease)
+            out_of_range, decreases = _scan_progress(progress)
 
-            if decreases > 0:
-                issues.append(f"{col} decreases {decreases} times (should be monotonic)")
+            for col, bad_range, count in zip(progress_cols, out_of_range, decreases.tolist()):
+                if bad_range:
+                    issues.append(f"{col} has values outside range [0, 100]")
+                if count > 0:
+                    issues.append(f"{col} decreases {count} times (should be monotonic)")
 
         if issues:
             for issue in issues[:10]:  # Limit to first 10
@@ -542,32 +1212,25 @@ class OutputValidator:
         # This is a complex check - we'll implement a simplified version
         # that checks for common unit types
 
-        common_units = ['marine', 'scv', 'zealot', 'probe', 'zergling', 'drone']
+        # Individual unit columns for every type, found in one pass
+        # (_x is used as proxy for unit existence)
+        unit_x_cols = self._unit_x_columns(df.columns)
 
-        for player in [1, 2]:
-            for unit_type in common_units:
-                count_col = f'p{player}_{unit_type}_count'
-
-                if count_col not in df.columns:
-                    continue
+        for (player, unit_type), count_col in self._count_columns(df.columns).items():
+            unit_cols = unit_x_cols.get((player, unit_type))
 
-                # Find all individual unit columns for this type
-                unit_cols = [col for col in df.columns
-                            if col.startswith(f'p{player}_{unit_type}_')
-                            and col.endswith('_x')]  # Use _x as proxy for unit existence
+            if unit_cols:
+                # Count non-NaN values in unit columns
+                actual_counts = df[unit_cols].notna().sum(axis=1)
+                expected_counts = df[count_col].fillna(0)
 
-                if unit_cols:
-                    # Count non-NaN values in unit columns
-                    actual_counts = df[unit_cols].notna().sum(axis=1)
-                    expected_counts = df[count_col].fillna(0)
+                # Allow small discrepancies due to timing
+                mismatches = (actual_counts != expected_counts).sum()
 
-                    # Allow small discrepancies due to timing
-                    mismatches = (actual_counts != expected_counts).sum()
-
-                    if mismatches > len(df) * 0.1:  # More than 10% mismatch
-                        issues.append(
-                            f"{count_col} mismatches individual unit columns in {mismatches}/{len(df)} rows"
-                        )
+                if mismatches > len(df) * 0.1:  # More than 10% mismatch
+                    issues.append(
+                        f"{count_col} mismatches individual unit columns in {mismatches}/{len(df)} rows"
+                    )
 
         if issues:
             for issue in issues[:10]:  # Limit to first 10
@@ -616,13 +1279,48 @@ class OutputValidator:
         else:
             report['checks']['state_transitions'] = True
 
-    def _check_nan_patterns(self, df: pd.DataFrame, report: dict) -> None:
-        """Check for unexpected NaN patterns."""
-        # Calculate NaN percentage per column
-        nan_percentages = (df.isna().sum() / len(df)) * 100
+    def _missing_count(self, column: pa.ChunkedArray) -> int:
+        """Count nulls plus, for floating point columns, NaN values."""
+        missing = column.null_count
+        if pa.types.is_floating(column.type):
+            is_nan = pc.is_nan(column, memory_pool=self.memory_pool)
+            missing += pc.sum(is_nan, memory_pool=self.memory_pool).as_py() or 0
+        return missing
+
+    def _check_nan_patterns(
+        self,
+        table: pa.Table,
+        report: dict,
+        missing_counts: Optional[Dict[str, int]] = None
+    ) -> None:
+        """
+        Check for unexpected NaN patterns.
+
+        Args:
+            table: Game state data
+            report: Report to update
+            missing_counts: Null counts for columns not loaded in table
+        """
+        missing_counts = dict(missing_counts or {})
+        float_cols = []
+        for name, column in zip(table.column_names, table.columns):
+            if pa.types.is_floating(column.type):
+                float_cols.append(name)
+            else:
+                missing_counts[name] = column.null_count
+
+        if float_cols:
+            # Nulls become NaN in the block, so one isnan pass over all
+            # floating point columns counts both
+            block = self._numeric_block(table, float_cols)
+            missing_counts.update(zip(float_cols, np.count_nonzero(np.isnan(block), axis=0).tolist()))
 
         # Report columns with high NaN rates (but this might be expected for units)
-        high_nan_cols = nan_percentages[nan_percentages > 95].index.tolist()
+        num_rows = table.num_rows
+        high_nan_cols = [
+            name for name, missing in missing_counts.items()
+            if num_rows and missing * 100 / num_rows > 95
+        ]
 
         if high_nan_cols:
             report['warnings'].append(
@@ -632,35 +1330,110 @@ class OutputValidator:
         # Check base columns shouldn't have NaN
         base_cols = ['game_loop', 'timestamp_seconds']
         for col in base_cols:
-            if col in df.columns and df[col].isna().any():
+            if missing_counts.get(col, 0) > 0:
                 report['errors'].append(f"Base column {col} has NaN values")
                 report['checks']['no_nan_in_base_columns'] = False
                 return
 
         report['checks']['no_nan_in_base_columns'] = True
 
-    def _generate_stats(self, df: pd.DataFrame, report: dict) -> None:
+    def _generate_stats(self, table: pa.Table, schema: pa.Schema, report: dict) -> None:
         """Generate statistics about the data."""
+        names = schema.names
         stats = {
-            'total_rows': len(df),
-            'total_columns': len(df.columns),
+            'total_rows': table.num_rows,
+            'total_columns': len(names),
         }
 
         # Game loop range
-        if 'game_loop' in df.columns:
-            stats['game_loop_range'] = (int(df['game_loop'].min()), int(df['game_loop'].max()))
-            stats['game_duration_seconds'] = float(df['timestamp_seconds'].max() if 'timestamp_seconds' in df.columns else 0)
+        if 'game_loop' in names:
+            game_loop_range = pc.min_max(table.column('game_loop'), memory_pool=self.memory_pool)
+            stats['game_loop_range'] = (int(game_loop_range['min'].as_py()), int(game_loop_range['max'].as_py()))
+            stats['game_duration_seconds'] = float(
+                pc.max(table.column('timestamp_seconds'), memory_pool=self.memory_pool).as_py()
+                if 'timestamp_seconds' in names else 0
+            )
 
         # Column categories
-        unit_cols = [col for col in df.columns if any(x in col for x in ['_x', '_y', '_health', '_state'])]
-        economy_cols = [col for col in df.columns if any(x in col for x in ['minerals', 'vespene', 'supply'])]
-        building_cols = [col for col in df.columns if any(x in col for x in ['_status', '_progress'])]
+        unit_cols = [col for col in names if any(x in col for x in ['_x', '_y', '_health', '_state'])]
+        economy_cols = [col for col in names if any(x in col for x in ['minerals', 'vespene', 'supply'])]
+        building_cols = [col for col in names if any(x in col for x in ['_status', '_progress'])]
 
         stats['unit_columns'] = len(unit_cols)
         stats['economy_columns'] = len(economy_cols)
         stats['building_columns'] = len(building_cols)
 
-        # Memory usage
-        stats['memory_usage_mb'] = float(df.memory_usage(deep=True).sum() / 1024 / 1024)
+        # Memory usage (Arrow buffers of the loaded columns)
+        stats['memory_usage_mb'] = float(table.nbytes / 1024 / 1024)
 
         report['stats'] = stats
+
+
+def _scan_progress_numpy(progress: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Find range violations and count decreases in each progress column.
+
+    Args:
+        progress: (rows x columns) float64 block, NaN for missing values
+
+    Returns:
+        Tuple of (bool array: column has a value outside [0, 100],
+        int64 array: number of row-to-row decreases per column)
+    """
+    out_of_range = ((progress < 0) | (progress > 100)).any(axis=0)
+    decreases = np.count_nonzero(np.diff(progress, axis=0) < 0, axis=0).astype(np.int64)
+    return out_of_range, decreases
+
+
+def _scan_progress_loop(progress):
+    """Single-pass loop form of _scan_progress_numpy, compiled with numba when available."""
+    n, k = progress.shape
+    out_of_range = np.zeros(k, dtype=np.bool_)
+    decreases = np.zeros(k, dtype=np.int64)
+    for i in range(n):
+        for j in range(k):
+            value = progress[i, j]
+            if value < 0 or value > 100:
+                out_of_range[j] = True
+            if i > 0 and value < progress[i - 1, j]:
+                decreases[j] += 1
+    return out_of_range, decreases
+
+
+# Progress scan used by _check_building_progress_monotonic; the loop form
+# needs no (rows - 1) x columns np.diff temporary
+_scan_progress = njit(cache=True)(_scan_progress_loop) if njit is not None else _scan_progress_numpy
+
+
+def _read_parquet(parquet_path: Path, columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """
+    Read a parquet file into pandas with the multi-threaded pyarrow decoder.
+
+    Columns keep their default numpy-backed dtypes (not dtype_backend='pyarrow'),
+    since the type checks compare against numpy/nullable dtype names.
+
+    Args:
+        parquet_path: Path to parquet file
+        columns: Columns to read (default: all)
+
+    Returns:
+        DataFrame with the requested columns
+    """
+    return pd.read_parquet(parquet_path, columns=columns, engine='pyarrow', use_threads=True)
+
+
+def _validate_game_state_file(parquet_path: Path) -> dict:
+    """
+    Fully validate one game state file (worker process entry point).
+
+    Runs in a ProcessPoolExecutor worker, where the calling validator's
+    memory pool is not available, so a new OutputValidator with the default
+    pool is used.
+
+    Args:
+        parquet_path: Path to game state parquet file
+
+    Returns:
+        Validation report dictionary
+    """
+    return OutputValidator().validate_game_state_parquet(parquet_path)
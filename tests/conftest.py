@@ -8,14 +8,20 @@ This module provides:
 - Test configuration
 """
 
+import copy
+import io
 import pytest
 import tempfile
 import shutil
 from pathlib import Path
+from time import perf_counter_ns
+from types import SimpleNamespace
 from typing import Dict, Any, List
-from unittest.mock import MagicMock, Mock
+from unittest.mock import MagicMock
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
 
 
 # ============================================================================
@@ -70,9 +76,46 @@ def mock_config() -> Dict[str, Any]:
 # Mock pysc2 observation fixtures
 # ============================================================================
 
+class _Pos:
+    """Unit position (x, y, z)."""
+
+    __slots__ = ('x', 'y', 'z')
+
+    def __init__(self, x: float, y: float, z: float):
+        self.x = x
+        self.y = y
+        self.z = z
+
+
+# Defaults for MockUnit attributes that can be overridden through **kwargs
+_UNIT_DEFAULTS = {
+    'facing': 0.0,
+    'is_flying': False,
+    'is_burrowed': False,
+    'is_hallucination': False,
+    'weapon_cooldown': 0.0,
+    'attack_upgrade_level': 0,
+    'armor_upgrade_level': 0,
+    'shield_upgrade_level': 0,
+    'radius': 0.5,
+    'cargo_space_taken': 0,
+    'cargo_space_max': 0,
+    'orders': (),
+}
+
+
 class MockUnit:
     """Mock SC2 unit for testing."""
 
+    __slots__ = (
+        'tag', 'unit_type', 'owner', 'pos', 'facing',
+        'health', 'health_max', 'shield', 'shield_max', 'energy', 'energy_max',
+        'build_progress', 'is_flying', 'is_burrowed', 'is_hallucination',
+        'weapon_cooldown', 'attack_upgrade_level', 'armor_upgrade_level',
+        'shield_upgrade_level', 'radius', 'cargo_space_taken', 'cargo_space_max',
+        'orders',
+    )
+
     def __init__(
         self,
         tag: int,
@@ -90,16 +133,15 @@ class MockUnit:
         build_progress: float = 1.0,
         **kwargs
     ):
+        merged = {**_UNIT_DEFAULTS, **kwargs}
+
         self.tag = tag
         self.unit_type = unit_type
         self.owner = owner
 
         # Position
-        self.pos = Mock()
-        self.pos.x = x
-        self.pos.y = y
-        self.pos.z = z
-        self.facing = kwargs.get('facing', 0.0)
+        self.pos = _Pos(x, y, z)
+        self.facing = merged['facing']
 
         # Vitals
         self.health = health
@@ -111,46 +153,48 @@ class MockUnit:
 
         # State
         self.build_progress = build_progress
-        self.is_flying = kwargs.get('is_flying', False)
-        self.is_burrowed = kwargs.get('is_burrowed', False)
-        self.is_hallucination = kwargs.get('is_hallucination', False)
+        self.is_flying = merged['is_flying']
+        self.is_burrowed = merged['is_burrowed']
+        self.is_hallucination = merged['is_hallucination']
 
         # Combat
-        self.weapon_cooldown = kwargs.get('weapon_cooldown', 0.0)
-        self.attack_upgrade_level = kwargs.get('attack_upgrade_level', 0)
-        self.armor_upgrade_level = kwargs.get('armor_upgrade_level', 0)
-        self.shield_upgrade_level = kwargs.get('shield_upgrade_level', 0)
+        self.weapon_cooldown = merged['weapon_cooldown']
+        self.attack_upgrade_level = merged['attack_upgrade_level']
+        self.armor_upgrade_level = merged['armor_upgrade_level']
+        self.shield_upgrade_level = merged['shield_upgrade_level']
 
         # Additional
-        self.radius = kwargs.get('radius', 0.5)
-        self.cargo_space_taken = kwargs.get('cargo_space_taken', 0)
-        self.cargo_space_max = kwargs.get('cargo_space_max', 0)
-        self.orders = kwargs.get('orders', [])
+        self.radius = merged['radius']
+        self.cargo_space_taken = merged['cargo_space_taken']
+        self.cargo_space_max = merged['cargo_space_max']
+        self.orders = merged['orders']
 
 
 class MockRawData:
     """Mock raw data from SC2 observation."""
 
     def __init__(self, units: List[MockUnit] = None, player_minerals: int = 50,
-                 player_vespene: int = 0):
+                 player_vespene: int = 0, dead_units: List[int] = None):
         self.units = units or []
 
         # Player resources
-        self.player = Mock()
-        self.player.minerals = player_minerals
-        self.player.vespene = player_vespene
-        self.player.food_used = 12
-        self.player.food_cap = 15
-        self.player.food_army = 6
-        self.player.food_workers = 6
-        self.player.idle_worker_count = 0
-        self.player.army_count = 3
-        self.player.warp_gate_count = 0
-        self.player.larva_count = 0
-
-        # Event data
-        self.event = Mock()
-        self.event.dead_units = []
+        self.player = SimpleNamespace(
+            minerals=player_minerals,
+            vespene=player_vespene,
+            food_used=12,
+            food_cap=15,
+            food_army=6,
+            food_workers=6,
+            idle_worker_count=0,
+            army_count=3,
+            warp_gate_count=0,
+            larva_count=0,
+        )
+
+        # Event data (dead unit tags as an int64 array)
+        self.event = SimpleNamespace(
+            dead_units=np.asarray([] if dead_units is None else dead_units, dtype=np.int64)
+        )
 
 
 class MockObservation:
@@ -163,17 +207,21 @@ class MockObservation:
         player_minerals: int = 50,
         player_vespene: int = 0
     ):
-        self.observation = Mock()
-        self.observation.game_loop = game_loop
-        self.observation.raw_data = MockRawData(units, player_minerals, player_vespene)
-        self.observation.chat = []
-        self.observation.player_common = Mock()
-        self.observation.player_common.player_id = 1
+        self.observation = SimpleNamespace(
+            game_loop=game_loop,
+            raw_data=MockRawData(units, player_minerals, player_vespene),
+            chat=[],
+            player_common=SimpleNamespace(player_id=1),
+        )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_observation() -> MockObservation:
-    """Create a basic mock observation with a few units."""
+    """
+    Create a basic mock observation with a few units.
+
+    Module-scoped and shared between tests; tests must not modify it.
+    """
     units = [
         MockUnit(tag=1000, unit_type=48, owner=1, x=30.0, y=30.0),  # Marine
         MockUnit(tag=1001, unit_type=48, owner=1, x=32.0, y=30.0),  # Marine
@@ -182,8 +230,25 @@ def mock_observation() -> MockObservation:
     return MockObservation(game_loop=100, units=units)
 
 
-@pytest.fixture
-def mock_observation_sequence() -> List[MockObservation]:
+# Frame wrappers only differ in game_loop and raw_data, so sequence frames
+# are shallow copies of one prototype rather than fresh MockObservations.
+_OBS_PROTO = MockObservation(game_loop=0, units=[])
+
+
+def _observation_frame(game_loop: int, units: List[MockUnit],
+                       dead_units: List[int] = None) -> MockObservation:
+    """Clone the prototype observation for a single frame."""
+    obs = copy.copy(_OBS_PROTO)
+    obs.observation = copy.copy(_OBS_PROTO.observation)
+    obs.observation.game_loop = game_loop
+    obs.observation.raw_data = MockRawData(units, dead_units=dead_units)
+    # Mutable members are per frame, so no two frames share them
+    obs.observation.chat = []
+    obs.observation.player_common = copy.copy(_OBS_PROTO.observation.player_common)
+    return obs
+
+
+def _build_mock_observation_sequence() -> List[MockObservation]:
     """Create a sequence of mock observations showing unit lifecycle."""
     observations = []
 
@@ -191,93 +256,131 @@ def mock_observation_sequence() -> List[MockObservation]:
     units_frame_0 = [
         MockUnit(tag=1000, unit_type=48, owner=1, x=30.0, y=30.0),  # Marine
     ]
-    observations.append(MockObservation(game_loop=0, units=units_frame_0))
+    observations.append(_observation_frame(0, units_frame_0))
 
     # Frame 100: New unit appears
     units_frame_100 = [
         MockUnit(tag=1000, unit_type=48, owner=1, x=31.0, y=30.0),  # Marine (moved)
         MockUnit(tag=1001, unit_type=48, owner=1, x=32.0, y=30.0, build_progress=0.5),  # Marine (building)
     ]
-    observations.append(MockObservation(game_loop=100, units=units_frame_100))
+    observations.append(_observation_frame(100, units_frame_100))
 
     # Frame 200: Unit completed
     units_frame_200 = [
         MockUnit(tag=1000, unit_type=48, owner=1, x=32.0, y=30.0),  # Marine
         MockUnit(tag=1001, unit_type=48, owner=1, x=32.0, y=30.0),  # Marine (completed)
     ]
-    observations.append(MockObservation(game_loop=200, units=units_frame_200))
+    observations.append(_observation_frame(200, units_frame_200))
 
     # Frame 300: Unit dies
     units_frame_300 = [
         MockUnit(tag=1001, unit_type=48, owner=1, x=32.0, y=30.0),  # Marine (survivor)
     ]
-    obs_300 = MockObservation(game_loop=300, units=units_frame_300)
-    obs_300.observation.raw_data.event.dead_units = [1000]  # First marine died
-    observations.append(obs_300)
+    observations.append(_observation_frame(300, units_frame_300, dead_units=[1000]))  # First marine died
 
     return observations
 
 
+# Built once at import; frames are shared read-only between tests
+_SEQ = _build_mock_observation_sequence()
+
+
+@pytest.fixture(scope="module")
+def mock_observation_sequence() -> List[MockObservation]:
+    """Sequence of mock observations showing unit lifecycle (frames 0-300)."""
+    return _SEQ
+
+
+@pytest.fixture(
+    params=range(len(_SEQ)),
+    ids=[f"loop_{obs.observation.game_loop}" for obs in _SEQ],
+)
+def mock_observation_frame(request) -> MockObservation:
+    """Single frame of mock_observation_sequence, parametrized over every frame."""
+    return _SEQ[request.param]
+
+
 # ============================================================================
 # Sample data fixtures
 # ============================================================================
 
+# Sample extracted state, built once; each test gets its own deep copy
+_EXTRACTED_STATE = {
+    'game_loop': 100,
+    'p1_units': {
+        'p1_marine_001': {
+            'tag': 1000,
+            'unit_type_id': 48,
+            'unit_type_name': 'Marine',
+            'x': 30.0,
+            'y': 30.0,
+            'z': 8.0,
+            'health': 45.0,
+            'health_max': 45.0,
+            'shields': 0.0,
+            'shields_max': 0.0,
+            'energy': 0.0,
+            'energy_max': 0.0,
+            'state': 'existing',
+        },
+    },
+    'p2_units': {},
+    'p1_buildings': {},
+    'p2_buildings': {},
+    'p1_economy': {
+        'minerals': 150,
+        'vespene': 50,
+        'supply_used': 12,
+        'supply_cap': 15,
+        'workers': 6,
+        'idle_workers': 0,
+    },
+    'p2_economy': {
+        'minerals': 200,
+        'vespene': 75,
+        'supply_used': 10,
+        'supply_cap': 15,
+        'workers': 8,
+        'idle_workers': 1,
+    },
+    'p1_upgrades': {
+        'attack_level': 0,
+        'armor_level': 0,
+        'shield_level': 0,
+    },
+    'p2_upgrades': {
+        'attack_level': 1,
+        'armor_level': 0,
+        'shield_level': 0,
+    },
+    'messages': [],
+}
+
+
 @pytest.fixture
 def sample_extracted_state() -> Dict[str, Any]:
-    """Sample extracted state dictionary from StateExtractor."""
-    return {
-        'game_loop': 100,
-        'p1_units': {
-            'p1_marine_001': {
-                'tag': 1000,
-                'unit_type_id': 48,
-                'unit_type_name': 'Marine',
-                'x': 30.0,
-                'y': 30.0,
-                'z': 8.0,
-                'health': 45.0,
-                'health_max': 45.0,
-                'shields': 0.0,
-                'shields_max': 0.0,
-                'energy': 0.0,
-                'energy_max': 0.0,
-                'state': 'existing',
-            },
-        },
-        'p2_units': {},
-        'p1_buildings': {},
-        'p2_buildings': {},
-        'p1_economy': {
-            'minerals': 150,
-            'vespene': 50,
-            'supply_used': 12,
-            'supply_cap': 15,
-            'workers': 6,
-            'idle_workers': 0,
-        },
-        'p2_economy': {
-            'minerals': 200,
-            'vespene': 75,
-            'supply_used': 10,
-            'supply_cap': 15,
-            'workers': 8,
-            'idle_workers': 1,
-        },
-        'p1_upgrades': {
-            'attack_level': 0,
-            'armor_level': 0,
-            'shield_level': 0,
-        },
-        'p2_upgrades': {
-            'attack_level': 1,
-            'armor_level': 0,
-            'shield_level': 0,
-        },
-        'messages': [],
-    }
+    """Sample extracted state dictionary from StateExtractor (private deep copy)."""
+    return copy.deepcopy(_EXTRACTED_STATE)
+
+
+@pytest.fixture(scope="session")
+def base_schema():
+    """SchemaManager with base, economy and upgrade columns (shared; do not modify)."""
+    from src_new.extraction.schema_manager import SchemaManager
+
+    schema = SchemaManager()
+    schema._add_economy_columns()
+    schema._add_upgrade_columns()
+    return schema
 
 
 @pytest.fixture
+def base_schema_mut(base_schema):
+    """Private clone of base_schema for tests that add columns."""
+    return base_schema.clone()
+
+
+@pytest.fixture(scope="module")
 def sample_wide_row() -> Dict[str, Any]:
     """Sample wide-format row from WideTableBuilder."""
     return {
@@ -299,29 +402,43 @@ def sample_wide_row() -> Dict[str, Any]:
     }
 
 
-@pytest.fixture
+# Built once at import from typed arrays so neither pandas nor Arrow has to
+# infer dtypes. Ints stay int64 and floats float64 to match the schema that
+# ParquetWriter produces.
+_SAMPLE_COLUMNS = {
+    'game_loop': np.array([0, 100, 200, 300], dtype=np.int64),
+    'timestamp_seconds': np.array([0.0, 4.464, 8.929, 13.393], dtype=np.float64),
+    'p1_minerals': np.array([50, 150, 250, 300], dtype=np.int64),
+    'p1_vespene': np.array([0, 50, 100, 150], dtype=np.int64),
+    'p1_supply_used': np.array([12, 12, 15, 18], dtype=np.int64),
+    'p1_supply_cap': np.array([15, 15, 23, 23], dtype=np.int64),
+    'p2_minerals': np.array([50, 200, 300, 400], dtype=np.int64),
+    'p2_vespene': np.array([0, 75, 125, 175], dtype=np.int64),
+    # Marine dies at frame 300
+    'p1_marine_001_x': np.array([30.0, 30.5, 31.0, np.nan], dtype=np.float64),
+    'p1_marine_001_health': np.array([45.0, 40.0, 35.0, np.nan], dtype=np.float64),
+}
+_SAMPLE_DF = pd.DataFrame(_SAMPLE_COLUMNS, copy=False)
+_SAMPLE_TABLE = pa.table({name: pa.array(values) for name, values in _SAMPLE_COLUMNS.items()})
+
+
+@pytest.fixture(scope="module")
 def sample_parquet_dataframe() -> pd.DataFrame:
     """Sample DataFrame for parquet writing tests."""
-    data = {
-        'game_loop': [0, 100, 200, 300],
-        'timestamp_seconds': [0.0, 4.464, 8.929, 13.393],
-        'p1_minerals': [50, 150, 250, 300],
-        'p1_vespene': [0, 50, 100, 150],
-        'p1_supply_used': [12, 12, 15, 18],
-        'p1_supply_cap': [15, 15, 23, 23],
-        'p2_minerals': [50, 200, 300, 400],
-        'p2_vespene': [0, 75, 125, 175],
-        'p1_marine_001_x': [30.0, 30.5, 31.0, np.nan],  # Marine dies at frame 300
-        'p1_marine_001_health': [45.0, 40.0, 35.0, np.nan],
-    }
-    return pd.DataFrame(data)
+    return _SAMPLE_DF.copy(deep=False)
+
+
+@pytest.fixture(scope="session")
+def sample_parquet_table() -> pa.Table:
+    """Sample data as an Arrow table, for writing with pyarrow directly (immutable; shared)."""
+    return _SAMPLE_TABLE
 
 
 # ============================================================================
 # Mock schema fixtures
 # ============================================================================
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_schema_columns() -> List[str]:
     """Sample schema column list."""
     return [
@@ -365,22 +482,64 @@ def assert_parquet_valid():
             return False
 
         try:
-            df = pd.read_parquet(parquet_path)
-            return len(df) > 0
+            # Row count lives in the footer; no column data needs decoding
+            return pq.ParquetFile(parquet_path).metadata.num_rows > 0
         except Exception:
             return False
 
     return _validate
 
 
+@pytest.fixture
+def bench_clock():
+    """Helper to time a side-effect-free callable in nanoseconds."""
+    def _measure(fn, repeat: int = 3) -> int:
+        """Run fn once to warm up, then return the fastest of `repeat` timed runs."""
+        fn()
+        best = None
+        for _ in range(repeat):
+            t0 = perf_counter_ns()
+            fn()
+            elapsed_ns = perf_counter_ns() - t0
+            if best is None or elapsed_ns < best:
+                best = elapsed_ns
+        return best
+
+    return _measure
+
+
+# Small pages and dictionary encoding suit the tiny tables tests write.
+# Uncompressed by default: tmp_path is usually tmpfs, where compression only
+# costs CPU
+_MOCK_PARQUET_WRITE_OPTIONS = {
+    'compression': None,
+    'use_dictionary': True,
+    'data_page_size': 8192,
+}
+
+
 @pytest.fixture
 def create_mock_parquet(temp_output_dir):
     """Helper to create mock parquet files for testing."""
-    def _create(filename: str, data: Dict[str, list]) -> Path:
-        """Create a parquet file with given data."""
-        df = pd.DataFrame(data)
+    def _create(filename: str, data, compression=None) -> Path:
+        """Create a parquet file from a dict of columns or a pyarrow Table."""
         output_path = temp_output_dir / filename
-        df.to_parquet(output_path, compression='snappy', index=False)
+        table = data if isinstance(data, pa.Table) else pa.Table.from_pydict(data)
+        pq.write_table(table, output_path, **{**_MOCK_PARQUET_WRITE_OPTIONS, 'compression': compression})
         return output_path
 
     return _create
+
+
+@pytest.fixture
+def create_mock_parquet_buffer():
+    """Helper to create mock parquet data in memory, without touching disk."""
+    def _create(data, compression=None) -> io.BytesIO:
+        """Serialize a dict of columns or a pyarrow Table to a parquet buffer."""
+        table = data if isinstance(data, pa.Table) else pa.Table.from_pydict(data)
+        buffer = io.BytesIO()
+        pq.write_table(table, buffer, **{**_MOCK_PARQUET_WRITE_OPTIONS, 'compression': compression})
+        buffer.seek(0)
+        return buffer
+
+    return _create
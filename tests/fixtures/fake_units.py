@@ -0,0 +1,33 @@
+"""
+Lightweight raw-unit records for UnitTracker benchmarks.
+
+Unlike the Mock-based units in mock_observations, these are plain NumPy
+structured records, so benchmarks measure the tracker rather than Mock
+attribute access.
+"""
+
+import numpy as np
+
+from src_new.extraction.state_extractor import RAW_UNIT_DTYPE
+
+
+def make_units(n: int, unit_type: int = 48, grid_width: int = 100) -> np.ndarray:
+    """
+    Create n raw unit records laid out on a grid.
+
+    Args:
+        n: Number of units; tags are 0..n-1
+        unit_type: SC2 unit type ID for every unit (default Marine)
+        grid_width: Units per grid row (x = i % grid_width, y = i // grid_width)
+
+    Returns:
+        Array of RAW_UNIT_DTYPE records
+    """
+    units = np.empty(n, dtype=RAW_UNIT_DTYPE)
+    index = np.arange(n)
+    units['tag'] = index
+    units['unit_type'] = unit_type
+    units['x'] = index % grid_width
+    units['y'] = index // grid_width
+    units['z'] = 8.0
+    return units
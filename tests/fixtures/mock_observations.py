@@ -4,30 +4,58 @@ Mock pysc2 observation structures for testing.
 This module provides realistic mock observations without requiring pysc2 to be installed.
 """
 
-from typing import List, Dict, Any
+from enum import IntEnum
+from functools import lru_cache
+from types import SimpleNamespace
+from typing import List, Dict, Any, Iterable, Optional, Sequence, Tuple, Union
 from unittest.mock import Mock
 
+import numpy as np
+
+
+class UnitType(IntEnum):
+    """SC2 Unit Type IDs (from pysc2)."""
+    Marine = 48
+    Marauder = 51
+    SCV = 45
+    Zealot = 73
+    Probe = 84
+    Zergling = 105
+    Drone = 104
+    CommandCenter = 18
+    Barracks = 21
+    Nexus = 59
+    Gateway = 62
+    Hatchery = 86
+
+
+# Name -> id mapping, kept for callers that look types up by string
+UNIT_TYPES = {unit_type.name: unit_type.value for unit_type in UnitType}
+
+# Default vitals for units whose stats the fixtures rely on
+_DEFAULT_VITALS = {
+    # name: (health, shields)
+    'Marine': (45.0, 0.0),
+    'Marauder': (125.0, 0.0),
+    'SCV': (45.0, 0.0),
+    'Zealot': (100.0, 50.0),
+    'Probe': (20.0, 20.0),
+    'Zergling': (35.0, 0.0),
+    'Drone': (40.0, 0.0),
+}
 
-# SC2 Unit Type IDs (from pysc2)
-UNIT_TYPES = {
-    'Marine': 48,
-    'Marauder': 51,
-    'SCV': 45,
-    'Zealot': 73,
-    'Probe': 84,
-    'Zergling': 105,
-    'Drone': 104,
-    'CommandCenter': 18,
-    'Barracks': 21,
-    'Nexus': 59,
-    'Gateway': 62,
-    'Hatchery': 86,
+# name -> (unit_type_id, default_health, default_shields), one lookup per unit
+_UNIT_SPEC = {
+    name: (type_id, *_DEFAULT_VITALS.get(name, (100.0, 0.0)))
+    for name, type_id in UNIT_TYPES.items()
 }
+_SPEC_BY_ID = {spec[0]: spec for spec in _UNIT_SPEC.values()}
+_UNKNOWN_UNIT_SPEC = (1, 100.0, 0.0)
 
 
 def create_mock_unit(
     tag: int,
-    unit_type: str,
+    unit_type: Union[UnitType, str],
     owner: int,
     x: float,
     y: float,
@@ -48,7 +76,8 @@ def create_mock_unit(
 
     Args:
         tag: Unique unit tag
-        unit_type: Unit type name (e.g., 'Marine', 'SCV')
+        unit_type: UnitType member or type id (preferred), or unit type name
+            (e.g., 'Marine', 'SCV')
         owner: Player ID (1 or 2)
         x, y, z: Position coordinates
         health: Current health (defaults to health_max)
@@ -65,40 +94,57 @@ def create_mock_unit(
     Returns:
         Mock unit object
     """
-    unit_type_id = UNIT_TYPES.get(unit_type, 1)
-
-    # Set default health values based on unit type
-    default_health = {
-        'Marine': 45.0,
-        'Marauder': 125.0,
-        'SCV': 45.0,
-        'Zealot': 100.0,
-        'Probe': 20.0,
-        'Zergling': 35.0,
-        'Drone': 40.0,
-    }
+    unit_type_id, default_health, default_shields = _resolve_unit_spec(unit_type)
 
     if health_max is None:
-        health_max = default_health.get(unit_type, 100.0)
+        health_max = default_health
     if health is None:
         health = health_max
 
     # Protoss units have shields
-    if unit_type in ['Zealot', 'Probe'] and shields_max == 0.0:
-        shields_max = 50.0 if unit_type == 'Zealot' else 20.0
+    if default_shields and shields_max == 0.0:
+        shields_max = default_shields
         if shields == 0.0:
             shields = shields_max
 
-    unit = Mock()
+    return _make_mock_unit(
+        tag, unit_type_id, owner, x, y, z,
+        health, health_max, shields, shields_max, energy, energy_max,
+        build_progress, is_flying, is_burrowed, kwargs,
+    )
+
+
+def _resolve_unit_spec(unit_type: Union[UnitType, str]) -> Tuple[int, float, float]:
+    """Look up (unit_type_id, default_health, default_shields) for a unit type."""
+    if isinstance(unit_type, int):
+        return _SPEC_BY_ID.get(unit_type, (int(unit_type), 100.0, 0.0))
+    return _UNIT_SPEC.get(unit_type, _UNKNOWN_UNIT_SPEC)
+
+
+def _make_mock_unit(
+    tag, unit_type_id, owner, x, y, z,
+    health, health_max, shields, shields_max, energy, energy_max,
+    build_progress, is_flying, is_burrowed, kwargs, plain=False,
+) -> Union[Mock, SimpleNamespace]:
+    """
+    Assemble a mock unit from fully resolved attribute values.
+
+    With plain=True the unit (and its pos) is a SimpleNamespace instead of a
+    Mock, for sequences where Mock attribute access would dominate.
+    """
+    unit = SimpleNamespace() if plain else Mock()
     unit.tag = tag
     unit.unit_type = unit_type_id
     unit.owner = owner
 
     # Position
-    unit.pos = Mock()
-    unit.pos.x = x
-    unit.pos.y = y
-    unit.pos.z = z
+    if plain:
+        unit.pos = SimpleNamespace(x=x, y=y, z=z)
+    else:
+        unit.pos = Mock()
+        unit.pos.x = x
+        unit.pos.y = y
+        unit.pos.z = z
     unit.facing = kwargs.get('facing', 0.0)
 
     # Vitals
@@ -131,9 +177,62 @@ def create_mock_unit(
     return unit
 
 
+def create_mock_units_batch(
+    tags: Sequence[int],
+    unit_types: Sequence[Union[UnitType, str]],
+    owners: Sequence[int],
+    xs: Sequence[float],
+    ys: Sequence[float],
+    zs: Optional[Sequence[float]] = None,
+    healths: Optional[Sequence[float]] = None,
+    plain: bool = False,
+    **shared_kwargs
+) -> List[Union[Mock, SimpleNamespace]]:
+    """
+    Create many mock units from parallel sequences in one call.
+
+    Default vitals are resolved once per distinct unit type rather than once
+    per unit. Units get the same values create_mock_unit would give them.
+
+    Args:
+        tags: Unit tags
+        unit_types: UnitType members, type ids or type names
+        owners: Player IDs
+        xs, ys: Position coordinates
+        zs: Heights (defaults to 8.0 for every unit)
+        healths: Current health values (defaults to each type's max health)
+        plain: Build SimpleNamespace units instead of Mocks
+        **shared_kwargs: Additional attributes applied to every unit
+
+    Returns:
+        List of mock unit objects, in input order
+    """
+    n = len(tags)
+    if zs is None:
+        zs = [8.0] * n
+
+    specs = {}
+    units = []
+    for i in range(n):
+        unit_type = unit_types[i]
+        spec = specs.get(unit_type)
+        if spec is None:
+            spec = specs[unit_type] = _resolve_unit_spec(unit_type)
+        unit_type_id, default_health, default_shields = spec
+
+        units.append(_make_mock_unit(
+            tags[i], unit_type_id, owners[i], xs[i], ys[i], zs[i],
+            healths[i] if healths is not None else default_health, default_health,
+            default_shields, default_shields, 0.0, 0.0,
+            1.0, False, False, shared_kwargs, plain,
+        ))
+
+    return units
+
+
 def create_mock_observation(
     game_loop: int,
-    units: List[Mock],
+    units: Iterable[Union[Mock, SimpleNamespace]],
     player_id: int = 1,
     minerals: int = 50,
     vespene: int = 0,
@@ -143,13 +242,14 @@ def create_mock_observation(
     idle_workers: int = 0,
     dead_units: List[int] = None,
     messages: List[Dict[str, Any]] = None
-) -> Mock:
+) -> SimpleNamespace:
     """
     Create a mock observation with all required attributes.
 
     Args:
         game_loop: Current game loop number
-        units: List of mock units
+        units: Mock units, as any iterable; stored as a list, since the
+            extractors and trackers iterate raw_data.units more than once
         player_id: Current player ID
         minerals: Player minerals
         vespene: Player vespene gas
@@ -157,161 +257,166 @@ def create_mock_observation(
         supply_cap: Maximum food/supply
         workers: Worker count
         idle_workers: Idle worker count
-        dead_units: List of dead unit tags
+        dead_units: Dead unit tags, as a list or array (stored as an int64 array)
         messages: List of chat messages
 
     Returns:
-        Mock observation object
+        Observation object (SimpleNamespace tree)
     """
-    obs = Mock()
-
-    # Main observation wrapper
-    obs.observation = Mock()
-    obs.observation.game_loop = game_loop
-
-    # Raw data
-    obs.observation.raw_data = Mock()
-    obs.observation.raw_data.units = units
-
-    # Player data
-    obs.observation.raw_data.player = Mock()
-    obs.observation.raw_data.player.minerals = minerals
-    obs.observation.raw_data.player.vespene = vespene
-    obs.observation.raw_data.player.food_used = supply_used
-    obs.observation.raw_data.player.food_cap = supply_cap
-    obs.observation.raw_data.player.food_army = supply_used - workers
-    obs.observation.raw_data.player.food_workers = workers
-    obs.observation.raw_data.player.idle_worker_count = idle_workers
-    obs.observation.raw_data.player.army_count = supply_used - workers
-    obs.observation.raw_data.player.warp_gate_count = 0
-    obs.observation.raw_data.player.larva_count = 0
-
-    # Event data
-    obs.observation.raw_data.event = Mock()
-    obs.observation.raw_data.event.dead_units = dead_units or []
+    # Plain attribute bags; nothing here is asserted on as a mock
+    player = SimpleNamespace(
+        minerals=minerals,
+        vespene=vespene,
+        food_used=supply_used,
+        food_cap=supply_cap,
+        food_army=supply_used - workers,
+        food_workers=workers,
+        idle_worker_count=idle_workers,
+        army_count=supply_used - workers,
+        warp_gate_count=0,
+        larva_count=0,
+    )
+
+    raw_data = SimpleNamespace(
+        units=list(units),
+        player=player,
+        event=SimpleNamespace(
+            dead_units=np.asarray([] if dead_units is None else dead_units, dtype=np.int64)
+        ),
+    )
 
     # Chat messages
-    obs.observation.chat = []
-    if messages:
-        for msg in messages:
-            chat_msg = Mock()
-            chat_msg.player_id = msg.get('player_id', player_id)
-            chat_msg.message = msg.get('message', '')
-            obs.observation.chat.append(chat_msg)
-
-    # Player common info
-    obs.observation.player_common = Mock()
-    obs.observation.player_common.player_id = player_id
+    chat = [
+        SimpleNamespace(
+            player_id=msg.get('player_id', player_id),
+            message=msg.get('message', ''),
+        )
+        for msg in (messages or ())
+    ]
+
+    obs = SimpleNamespace(observation=SimpleNamespace(
+        game_loop=game_loop,
+        raw_data=raw_data,
+        chat=chat,
+        player_common=SimpleNamespace(player_id=player_id),
+    ))
 
     return obs
 
 
-def create_marine_rush_sequence() -> List[Mock]:
+# Marine rush as a structure-of-arrays panel: one row per frame, one column
+# per unit. Tests that only need aggregate numbers (total health, units
+# alive) can read these directly instead of walking Mock units.
+_NAN = np.nan
+MARINE_RUSH_LOOPS = np.array([0, 500, 1000, 1500], dtype=np.int64)
+MARINE_RUSH_TAGS = np.array(
+    [1001, 1002, 1003, 1004, 1005, 1006, 2001, 2002, 2003, 2004], dtype=np.int64
+)
+MARINE_RUSH_X = np.array([
+    # SCV 1001-1006                      Marine 2001-2004
+    [30.0, 31.0, 32.0, 30.0, 31.0, 32.0, 35.0, _NAN, _NAN, _NAN],  # Game start
+    [30.0, 31.0, 32.0, 30.0, 31.0, 32.0, 40.0, 41.0, 42.0, 43.0],  # 3 more marines
+    [30.0, 31.0, 32.0, 30.0, 31.0, 32.0, 50.0, 51.0, 52.0, 53.0],  # Combat
+    [30.0, 31.0, 32.0, 30.0, 31.0, 32.0, _NAN, 51.0, 52.0, 53.0],  # Marine 2001 dead
+])
+MARINE_RUSH_Y = np.array([
+    [30.0, 30.0, 30.0, 31.0, 31.0, 31.0, 35.0, _NAN, _NAN, _NAN],
+    [30.0, 30.0, 30.0, 31.0, 31.0, 31.0, 40.0, 40.0, 40.0, 40.0],
+    [30.0, 30.0, 30.0, 31.0, 31.0, 31.0, 50.0, 50.0, 50.0, 50.0],
+    [30.0, 30.0, 30.0, 31.0, 31.0, 31.0, _NAN, 50.0, 50.0, 50.0],
+])
+MARINE_RUSH_HEALTH = np.array([
+    [45.0, 45.0, 45.0, 45.0, 45.0, 45.0, 45.0, 0.0, 0.0, 0.0],
+    [45.0, 45.0, 45.0, 45.0, 45.0, 45.0, 45.0, 45.0, 45.0, 45.0],
+    [45.0, 45.0, 45.0, 45.0, 45.0, 45.0, 30.0, 45.0, 45.0, 45.0],  # 2001 damaged
+    [45.0, 45.0, 45.0, 45.0, 45.0, 45.0, 0.0, 35.0, 45.0, 45.0],  # 2002 damaged
+])
+MARINE_RUSH_ALIVE = ~np.isnan(MARINE_RUSH_X)
+
+# Per-frame economy / event arguments for create_mock_observation
+_MARINE_RUSH_FRAME_ARGS = (
+    {'minerals': 50, 'workers': 6},
+    {'minerals': 200, 'supply_used': 16, 'workers': 6},
+    {'minerals': 350, 'supply_used': 16, 'workers': 6},
+    {'minerals': 500, 'supply_used': 14, 'workers': 6, 'dead_units': [2001]},
+)
+_MARINE_RUSH_WORKERS = 6  # Leading panel columns are SCVs, the rest marines
+
+# Starting worker line shared by every marine rush frame; the SCVs never
+# move, so the same unit objects are reused instead of rebuilt per frame.
+_SCVS = tuple(create_mock_units_batch(
+    tags=[int(tag) for tag in MARINE_RUSH_TAGS[:_MARINE_RUSH_WORKERS]],
+    unit_types=[UnitType.SCV] * _MARINE_RUSH_WORKERS,
+    owners=[1] * _MARINE_RUSH_WORKERS,
+    xs=MARINE_RUSH_X[0, :_MARINE_RUSH_WORKERS].tolist(),
+    ys=MARINE_RUSH_Y[0, :_MARINE_RUSH_WORKERS].tolist(),
+    plain=True,
+))
+
+
+def create_marine_rush_sequence() -> List[SimpleNamespace]:
     """
     Create a realistic sequence of observations showing a marine rush.
 
+    The observations are built once from the MARINE_RUSH_* panel and cached;
+    each call returns a new list over the shared frames. Units are plain
+    SimpleNamespace objects rather than Mocks.
+
     Returns:
         List of mock observations showing unit creation and combat
     """
-    observations = []
+    return list(_marine_rush_sequence())
 
-    # Frame 0: Game start - 6 SCVs and 1 Marine
-    units_0 = [
-        create_mock_unit(1001, 'SCV', 1, 30.0, 30.0),
-        create_mock_unit(1002, 'SCV', 1, 31.0, 30.0),
-        create_mock_unit(1003, 'SCV', 1, 32.0, 30.0),
-        create_mock_unit(1004, 'SCV', 1, 30.0, 31.0),
-        create_mock_unit(1005, 'SCV', 1, 31.0, 31.0),
-        create_mock_unit(1006, 'SCV', 1, 32.0, 31.0),
-        create_mock_unit(2001, 'Marine', 1, 35.0, 35.0),
-    ]
-    observations.append(create_mock_observation(
-        game_loop=0,
-        units=units_0,
-        minerals=50,
-        workers=6,
-    ))
-
-    # Frame 500: Built 3 more marines
-    units_500 = [
-        create_mock_unit(1001, 'SCV', 1, 30.0, 30.0),
-        create_mock_unit(1002, 'SCV', 1, 31.0, 30.0),
-        create_mock_unit(1003, 'SCV', 1, 32.0, 30.0),
-        create_mock_unit(1004, 'SCV', 1, 30.0, 31.0),
-        create_mock_unit(1005, 'SCV', 1, 31.0, 31.0),
-        create_mock_unit(1006, 'SCV', 1, 32.0, 31.0),
-        create_mock_unit(2001, 'Marine', 1, 40.0, 40.0),
-        create_mock_unit(2002, 'Marine', 1, 41.0, 40.0),
-        create_mock_unit(2003, 'Marine', 1, 42.0, 40.0),
-        create_mock_unit(2004, 'Marine', 1, 43.0, 40.0),
-    ]
-    observations.append(create_mock_observation(
-        game_loop=500,
-        units=units_500,
-        minerals=200,
-        supply_used=16,
-        workers=6,
-    ))
-
-    # Frame 1000: Combat - one marine takes damage
-    units_1000 = [
-        create_mock_unit(1001, 'SCV', 1, 30.0, 30.0),
-        create_mock_unit(1002, 'SCV', 1, 31.0, 30.0),
-        create_mock_unit(1003, 'SCV', 1, 32.0, 30.0),
-        create_mock_unit(1004, 'SCV', 1, 30.0, 31.0),
-        create_mock_unit(1005, 'SCV', 1, 31.0, 31.0),
-        create_mock_unit(1006, 'SCV', 1, 32.0, 31.0),
-        create_mock_unit(2001, 'Marine', 1, 50.0, 50.0, health=30.0),  # Damaged
-        create_mock_unit(2002, 'Marine', 1, 51.0, 50.0),
-        create_mock_unit(2003, 'Marine', 1, 52.0, 50.0),
-        create_mock_unit(2004, 'Marine', 1, 53.0, 50.0),
-    ]
-    observations.append(create_mock_observation(
-        game_loop=1000,
-        units=units_1000,
-        minerals=350,
-        supply_used=16,
-        workers=6,
-    ))
 
-    # Frame 1500: Combat - marine dies
-    units_1500 = [
-        create_mock_unit(1001, 'SCV', 1, 30.0, 30.0),
-        create_mock_unit(1002, 'SCV', 1, 31.0, 30.0),
-        create_mock_unit(1003, 'SCV', 1, 32.0, 30.0),
-        create_mock_unit(1004, 'SCV', 1, 30.0, 31.0),
-        create_mock_unit(1005, 'SCV', 1, 31.0, 31.0),
-        create_mock_unit(1006, 'SCV', 1, 32.0, 31.0),
-        # Marine 2001 is dead
-        create_mock_unit(2002, 'Marine', 1, 51.0, 50.0, health=35.0),  # Damaged
-        create_mock_unit(2003, 'Marine', 1, 52.0, 50.0),
-        create_mock_unit(2004, 'Marine', 1, 53.0, 50.0),
-    ]
-    observations.append(create_mock_observation(
-        game_loop=1500,
-        units=units_1500,
-        minerals=500,
-        supply_used=14,
-        workers=6,
-        dead_units=[2001],  # Marine 1 died
-    ))
-
-    return observations
-
-
-def create_building_construction_sequence() -> List[Mock]:
+@lru_cache(maxsize=1)
+def _marine_rush_sequence() -> Tuple[SimpleNamespace, ...]:
+    """Build the marine rush frames (cached by create_marine_rush_sequence)."""
+    observations = []
+    columns = slice(_MARINE_RUSH_WORKERS, None)
+    marine_tags = MARINE_RUSH_TAGS[columns]
+
+    for frame, game_loop in enumerate(MARINE_RUSH_LOOPS):
+        alive = MARINE_RUSH_ALIVE[frame, columns]
+        marines = create_mock_units_batch(
+            tags=marine_tags[alive].tolist(),
+            unit_types=[UnitType.Marine] * int(alive.sum()),
+            owners=[1] * int(alive.sum()),
+            xs=MARINE_RUSH_X[frame, columns][alive].tolist(),
+            ys=MARINE_RUSH_Y[frame, columns][alive].tolist(),
+            healths=MARINE_RUSH_HEALTH[frame, columns][alive].tolist(),
+            plain=True,
+        )
+        observations.append(create_mock_observation(
+            game_loop=int(game_loop),
+            units=[*_SCVS, *marines],
+            **_MARINE_RUSH_FRAME_ARGS[frame],
+        ))
+
+    return tuple(observations)
+
+
+def create_building_construction_sequence() -> List[SimpleNamespace]:
     """
     Create a sequence showing building construction lifecycle.
 
+    The observations are built once and cached; each call returns a new list
+    over the shared frames.
+
     Returns:
         List of mock observations showing building construction
     """
+    return list(_building_construction_sequence())
+
+
+@lru_cache(maxsize=1)
+def _building_construction_sequence() -> Tuple[SimpleNamespace, ...]:
+    """Build the construction frames (cached by create_building_construction_sequence)."""
     observations = []
 
     # Frame 0: Construction starts
     units_0 = [
-        create_mock_unit(1001, 'SCV', 1, 30.0, 30.0),
-        create_mock_unit(5001, 'Barracks', 1, 40.0, 40.0, build_progress=0.0),  # Just started
+        create_mock_unit(1001, UnitType.SCV, 1, 30.0, 30.0),
+        create_mock_unit(5001, UnitType.Barracks, 1, 40.0, 40.0, build_progress=0.0),  # Just started
     ]
     observations.append(create_mock_observation(
         game_loop=0,
@@ -321,8 +426,8 @@ def create_building_construction_sequence() -> List[Mock]:
 
     # Frame 500: Construction in progress
     units_500 = [
-        create_mock_unit(1001, 'SCV', 1, 40.0, 40.0),  # Building
-        create_mock_unit(5001, 'Barracks', 1, 40.0, 40.0, build_progress=0.5),  # 50%
+        create_mock_unit(1001, UnitType.SCV, 1, 40.0, 40.0),  # Building
+        create_mock_unit(5001, UnitType.Barracks, 1, 40.0, 40.0, build_progress=0.5),  # 50%
     ]
     observations.append(create_mock_observation(
         game_loop=500,
@@ -331,9 +436,10 @@ def create_building_construction_sequence() -> List[Mock]:
     ))
 
     # Frame 1000: Construction complete
+    parked_scv = create_mock_unit(1001, UnitType.SCV, 1, 41.0, 40.0)
     units_1000 = [
-        create_mock_unit(1001, 'SCV', 1, 41.0, 40.0),  # Moved away
-        create_mock_unit(5001, 'Barracks', 1, 40.0, 40.0, build_progress=1.0),  # Complete
+        parked_scv,  # Moved away
+        create_mock_unit(5001, UnitType.Barracks, 1, 40.0, 40.0, build_progress=1.0),  # Complete
     ]
     observations.append(create_mock_observation(
         game_loop=1000,
@@ -343,7 +449,7 @@ def create_building_construction_sequence() -> List[Mock]:
 
     # Frame 2000: Building destroyed
     units_2000 = [
-        create_mock_unit(1001, 'SCV', 1, 41.0, 40.0),
+        parked_scv,  # Same position as frame 1000
         # Barracks is gone
     ]
     observations.append(create_mock_observation(
@@ -353,28 +459,35 @@ def create_building_construction_sequence() -> List[Mock]:
         dead_units=[5001],
     ))
 
-    return observations
+    return tuple(observations)
+
+
+# (tag, unit_type, owner, x, y) for the multi-race observation
+_MULTI_RACE_UNITS = (
+    # Terran (Player 1)
+    (1001, UnitType.SCV, 1, 30.0, 30.0),
+    (1002, UnitType.Marine, 1, 35.0, 35.0),
+    (1003, UnitType.Marauder, 1, 36.0, 35.0),
 
+    # Protoss (Player 2)
+    (2001, UnitType.Probe, 2, 130.0, 130.0),
+    (2002, UnitType.Zealot, 2, 135.0, 135.0),
 
-def create_multi_race_observation() -> Mock:
+    # Note: In a real game, you wouldn't have multiple races,
+    # but this is useful for testing extractor flexibility
+)
+
+
+def create_multi_race_observation() -> SimpleNamespace:
     """
     Create an observation with units from all three races.
 
     Returns:
-        Mock observation with diverse unit types
+        Observation (SimpleNamespace tree) with diverse unit types
     """
     units = [
-        # Terran (Player 1)
-        create_mock_unit(1001, 'SCV', 1, 30.0, 30.0),
-        create_mock_unit(1002, 'Marine', 1, 35.0, 35.0),
-        create_mock_unit(1003, 'Marauder', 1, 36.0, 35.0),
-
-        # Protoss (Player 2)
-        create_mock_unit(2001, 'Probe', 2, 130.0, 130.0),
-        create_mock_unit(2002, 'Zealot', 2, 135.0, 135.0),
-
-        # Note: In a real game, you wouldn't have multiple races,
-        # but this is useful for testing extractor flexibility
+        create_mock_unit(tag, unit_type, owner, x, y)
+        for tag, unit_type, owner, x, y in _MULTI_RACE_UNITS
     ]
 
     return create_mock_observation(
@@ -4,228 +4,544 @@ Sample extracted game state data for testing.
 Provides realistic game state dictionaries that would be output by StateExtractor.
 """
 
-from typing import Dict, Any, List
+from __future__ import annotations
 
+import sys
+from collections import ChainMap
+from collections.abc import Mapping as MappingABC
+from dataclasses import dataclass, replace
+from enum import Enum
+from functools import lru_cache
+from operator import itemgetter
+from types import MappingProxyType
+from typing import Dict, Any, Callable, Final, Iterator, List, Mapping, Optional, Sequence, Tuple, TypedDict
 
-def create_sample_game_state(game_loop: int = 100) -> Dict[str, Any]:
+import numpy as np
+
+
+# ============================================================================
+# Typed records
+# ============================================================================
+# The fixtures describe their entities with slotted records and convert them
+# to the plain dicts StateExtractor emits only when building a state. The
+# TypedDicts describe those emitted dict shapes for type checkers. State and
+# status values are named by str-valued enums; the dicts hold the plain
+# .value strings, which compare equal to the enum members.
+
+class UnitState(str, Enum):
+    """Unit 'state' values emitted by StateExtractor."""
+
+    BUILT = 'built'
+    EXISTING = 'existing'
+    KILLED = 'killed'
+
+
+class BuildingStatus(str, Enum):
+    """Building 'status' values emitted by StateExtractor."""
+
+    STARTED = 'started'
+    BUILDING = 'building'
+    COMPLETED = 'completed'
+    DESTROYED = 'destroyed'
+
+
+class UnitDict(TypedDict, total=False):
+    """Unit entry as emitted by StateExtractor (killed units carry only tag/state)."""
+
+    tag: int
+    unit_type_id: int
+    unit_type_name: str
+    x: float
+    y: float
+    z: float
+    facing: float
+    health: float
+    health_max: float
+    shields: float
+    shields_max: float
+    energy: float
+    energy_max: float
+    state: str
+    build_progress: float
+    is_flying: bool
+    is_burrowed: bool
+    is_hallucination: bool
+    weapon_cooldown: float
+    attack_upgrade_level: int
+    armor_upgrade_level: int
+    shield_upgrade_level: int
+    radius: float
+    cargo_space_taken: int
+    cargo_space_max: int
+    order_count: int
+
+
+class BuildingDict(TypedDict):
+    """Building entry as emitted by StateExtractor."""
+
+    tag: int
+    building_type: int
+    x: float
+    y: float
+    z: float
+    status: str
+    progress: int
+    started_loop: int
+    completed_loop: Optional[int]
+    destroyed_loop: Optional[int]
+    game_loop: int
+
+
+class EconomyDict(TypedDict):
+    """Player economy entry."""
+
+    minerals: int
+    vespene: int
+    supply_used: int
+    supply_cap: int
+    workers: int
+    idle_workers: int
+
+
+class UpgradesDict(TypedDict):
+    """Player upgrade levels entry."""
+
+    attack_level: int
+    armor_level: int
+    shield_level: int
+
+
+class GameStateDict(TypedDict):
+    """Full extracted state for one game loop."""
+
+    game_loop: int
+    p1_units: Dict[str, UnitDict]
+    p2_units: Dict[str, UnitDict]
+    p1_buildings: Dict[str, BuildingDict]
+    p2_buildings: Dict[str, BuildingDict]
+    p1_economy: EconomyDict
+    p2_economy: EconomyDict
+    p1_upgrades: UpgradesDict
+    p2_upgrades: UpgradesDict
+    messages: List[Dict[str, Any]]
+
+
+class _Record:
+    """Base for slotted fixture records."""
+
+    __slots__ = ()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the record as the dict StateExtractor would emit."""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+@dataclass
+class UnitRecord(_Record):
+    """Per-unit state as extracted for a single frame."""
+
+    __slots__ = (
+        'tag', 'unit_type_id', 'unit_type_name', 'x', 'y', 'z', 'facing',
+        'health', 'health_max', 'shields', 'shields_max', 'energy', 'energy_max',
+        'state', 'build_progress', 'is_flying', 'is_burrowed', 'is_hallucination',
+        'weapon_cooldown', 'attack_upgrade_level', 'armor_upgrade_level',
+        'shield_upgrade_level', 'radius', 'cargo_space_taken', 'cargo_space_max',
+        'order_count',
+    )
+
+    tag: int
+    unit_type_id: int
+    unit_type_name: str
+    x: float
+    y: float
+    z: float
+    facing: float
+    health: float
+    health_max: float
+    shields: float
+    shields_max: float
+    energy: float
+    energy_max: float
+    state: str
+    build_progress: float
+    is_flying: bool
+    is_burrowed: bool
+    is_hallucination: bool
+    weapon_cooldown: float
+    attack_upgrade_level: int
+    armor_upgrade_level: int
+    shield_upgrade_level: int
+    radius: float
+    cargo_space_taken: int
+    cargo_space_max: int
+    order_count: int
+
+
+@dataclass
+class BuildingRecord(_Record):
+    """Per-building lifecycle state as extracted for a single frame."""
+
+    __slots__ = (
+        'tag', 'building_type', 'x', 'y', 'z', 'status', 'progress',
+        'started_loop', 'completed_loop', 'destroyed_loop', 'game_loop',
+    )
+
+    tag: int
+    building_type: int
+    x: float
+    y: float
+    z: float
+    status: str
+    progress: int
+    started_loop: int
+    completed_loop: Optional[int]
+    destroyed_loop: Optional[int]
+    game_loop: int
+
+
+@dataclass
+class EconomyRecord(_Record):
+    """Player economy snapshot."""
+
+    __slots__ = ('minerals', 'vespene', 'supply_used', 'supply_cap', 'workers', 'idle_workers')
+
+    minerals: int
+    vespene: int
+    supply_used: int
+    supply_cap: int
+    workers: int
+    idle_workers: int
+
+
+@dataclass
+class UpgradesRecord(_Record):
+    """Player upgrade levels."""
+
+    __slots__ = ('attack_level', 'armor_level', 'shield_level')
+
+    attack_level: int
+    armor_level: int
+    shield_level: int
+
+
+def _interned(obj: Any) -> Any:
+    """Return obj with every string key and string value passed through sys.intern."""
+    if isinstance(obj, dict):
+        return {
+            (sys.intern(k) if isinstance(k, str) else k): _interned(v)
+            for k, v in obj.items()
+        }
+    if isinstance(obj, list):
+        return [_interned(v) for v in obj]
+    if isinstance(obj, str):
+        return sys.intern(obj)
+    return obj
+
+
+def _frozen(obj: Any) -> Any:
+    """Return a read-only copy of obj: dicts become MappingProxyType, lists tuples."""
+    if isinstance(obj, dict):
+        return MappingProxyType({k: _frozen(v) for k, v in obj.items()})
+    if isinstance(obj, list):
+        return tuple(_frozen(v) for v in obj)
+    return obj
+
+
+def _copy_state(template: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Copy a state template deep enough that every container is fresh.
+
+    Entity and economy entries only hold immutable primitives, so copying
+    each container level directly is enough; no deepcopy walk is needed.
+    """
+    state = {}
+    for key, value in template.items():
+        if key.endswith(('_units', '_buildings')):
+            state[key] = {entity_id: dict(entry) for entity_id, entry in value.items()}
+        elif isinstance(value, dict):
+            state[key] = dict(value)
+        elif isinstance(value, list):
+            state[key] = [dict(item) for item in value]
+        else:
+            state[key] = value
+    return state
+
+
+# ============================================================================
+# State templates
+# ============================================================================
+# Built once at import; the create_* functions hand out copies (_copy_state)
+# so callers can modify their state freely. Strings are interned once here and
+# stay shared by the copies, so consumers' key lookups hit the identity fast
+# path.
+
+_BASE_MARINE: Final = UnitRecord(
+    tag=1000, unit_type_id=48, unit_type_name='Marine',
+    x=30.0, y=30.0, z=8.0, facing=0.0,
+    health=45.0, health_max=45.0, shields=0.0, shields_max=0.0,
+    energy=0.0, energy_max=0.0,
+    state=UnitState.EXISTING.value, build_progress=1.0,
+    is_flying=False, is_burrowed=False, is_hallucination=False,
+    weapon_cooldown=0.0,
+    attack_upgrade_level=0, armor_upgrade_level=0, shield_upgrade_level=0,
+    radius=0.5, cargo_space_taken=0, cargo_space_max=0, order_count=0,
+)
+
+_BASE_ZEALOT: Final = UnitRecord(
+    tag=2000, unit_type_id=73, unit_type_name='Zealot',
+    x=130.0, y=130.0, z=8.0, facing=3.14,
+    health=100.0, health_max=100.0, shields=50.0, shields_max=50.0,
+    energy=0.0, energy_max=0.0,
+    state=UnitState.EXISTING.value, build_progress=1.0,
+    is_flying=False, is_burrowed=False, is_hallucination=False,
+    weapon_cooldown=0.0,
+    attack_upgrade_level=0, armor_upgrade_level=0, shield_upgrade_level=0,
+    radius=0.5, cargo_space_taken=0, cargo_space_max=0, order_count=1,
+)
+
+_BASE_BARRACKS: Final = BuildingRecord(
+    tag=5001, building_type=21,
+    x=40.0, y=40.0, z=8.0,
+    status=BuildingStatus.COMPLETED.value, progress=100,
+    started_loop=0, completed_loop=500, destroyed_loop=None,
+    game_loop=100,
+)
+
+_NO_UPGRADES: Final = UpgradesRecord(attack_level=0, armor_level=0, shield_level=0)
+_START_ECONOMY: Final = EconomyRecord(
+    minerals=50, vespene=0, supply_used=12, supply_cap=15, workers=12, idle_workers=0,
+)
+
+_BASE_STATE_TEMPLATE: Final[Dict[str, Any]] = _interned({
+    'game_loop': 100,
+    'p1_units': {'p1_marine_001': _BASE_MARINE.to_dict()},
+    'p2_units': {'p2_zealot_001': _BASE_ZEALOT.to_dict()},
+    'p1_buildings': {'building_5001': _BASE_BARRACKS.to_dict()},
+    'p2_buildings': {},
+    'p1_economy': EconomyRecord(
+        minerals=150, vespene=50, supply_used=12, supply_cap=15, workers=6, idle_workers=0,
+    ).to_dict(),
+    'p2_economy': EconomyRecord(
+        minerals=200, vespene=75, supply_used=10, supply_cap=15, workers=8, idle_workers=1,
+    ).to_dict(),
+    'p1_upgrades': _NO_UPGRADES.to_dict(),
+    'p2_upgrades': UpgradesRecord(attack_level=1, armor_level=0, shield_level=0).to_dict(),
+    'messages': [],
+})
+
+_EMPTY_STATE_TEMPLATE: Final[Dict[str, Any]] = _interned({
+    'game_loop': 0,
+    'p1_units': {},
+    'p2_units': {},
+    'p1_buildings': {},
+    'p2_buildings': {},
+    'p1_economy': _START_ECONOMY.to_dict(),
+    'p2_economy': _START_ECONOMY.to_dict(),
+    'p1_upgrades': _NO_UPGRADES.to_dict(),
+    'p2_upgrades': _NO_UPGRADES.to_dict(),
+    'messages': [],
+})
+
+# Compact unit shape used by the complex state: every unit shares these
+# values unless overridden. The template units layer their own fields over
+# this one read-only base (ChainMap), so the shared zero vitals are stored
+# once; _copy_state flattens them into plain dicts for callers.
+_UNIT_DEFAULTS: Final[Mapping[str, Any]] = MappingProxyType(_interned({
+    'z': 8.0,
+    'shields': 0.0,
+    'shields_max': 0.0,
+    'energy': 0.0,
+    'energy_max': 0.0,
+    'state': UnitState.EXISTING.value,
+}))
+
+
+def _make_unit(**kw) -> ChainMap:
+    """Build a compact unit mapping from overrides layered over _UNIT_DEFAULTS."""
+    return ChainMap(_interned(kw), _UNIT_DEFAULTS)
+
+
+# Complex state units, one row per unit:
+# (unit_id, tag, type_id, name, x, y, health, health_max, shields, shields_max)
+_COMPLEX_P1_UNITS: Final = (
+    ('p1_marine_001', 1001, 48, 'Marine', 30.0, 30.0, 45.0, 45.0, 0.0, 0.0),
+    ('p1_marine_002', 1002, 48, 'Marine', 31.0, 30.0, 40.0, 45.0, 0.0, 0.0),
+    ('p1_marauder_001', 1003, 51, 'Marauder', 32.0, 30.0, 125.0, 125.0, 0.0, 0.0),
+    ('p1_scv_001', 1004, 45, 'SCV', 25.0, 25.0, 45.0, 45.0, 0.0, 0.0),
+)
+_COMPLEX_P2_UNITS: Final = (
+    ('p2_zealot_001', 2001, 73, 'Zealot', 130.0, 130.0, 100.0, 100.0, 50.0, 50.0),
+    ('p2_zealot_002', 2002, 73, 'Zealot', 131.0, 130.0, 80.0, 100.0, 30.0, 50.0),
+    ('p2_probe_001', 2003, 84, 'Probe', 125.0, 125.0, 20.0, 20.0, 20.0, 20.0),
+)
+
+# Numeric unit fields of the complex state as contiguous float32 matrices
+# (one row per unit), for tests that sweep over units with NumPy
+COMPLEX_UNIT_NUMERIC_COLUMNS: Final = (
+    'x', 'y', 'z', 'health', 'health_max', 'shields', 'shields_max', 'energy', 'energy_max',
+)
+
+
+def _numeric_unit_matrix(rows: Sequence[tuple]) -> np.ndarray:
+    """Pack complex-state unit rows into a read-only float32 matrix."""
+    matrix = np.array(
+        [
+            (x, y, 8.0, health, health_max, shields, shields_max, 0.0, 0.0)
+            for _, _, _, _, x, y, health, health_max, shields, shields_max in rows
+        ],
+        dtype=np.float32,
+    )
+    matrix.flags.writeable = False
+    return matrix
+
+
+_COMPLEX_P1_UNIT_MATRIX: Final = _numeric_unit_matrix(_COMPLEX_P1_UNITS)
+_COMPLEX_P2_UNIT_MATRIX: Final = _numeric_unit_matrix(_COMPLEX_P2_UNITS)
+
+_COMPLEX_STATE_TEMPLATE: Final[Dict[str, Any]] = _interned({
+    'game_loop': 2000,
+    'p1_units': {
+        unit_id: _make_unit(
+            tag=tag, unit_type_id=type_id, unit_type_name=name, x=x, y=y,
+            health=health, health_max=health_max, shields=shields, shields_max=shields_max,
+        )
+        for unit_id, tag, type_id, name, x, y, health, health_max, shields, shields_max
+        in _COMPLEX_P1_UNITS
+    },
+    'p2_units': {
+        unit_id: _make_unit(
+            tag=tag, unit_type_id=type_id, unit_type_name=name, x=x, y=y,
+            health=health, health_max=health_max, shields=shields, shields_max=shields_max,
+        )
+        for unit_id, tag, type_id, name, x, y, health, health_max, shields, shields_max
+        in _COMPLEX_P2_UNITS
+    },
+    'p1_buildings': {
+        'building_5001': {
+            'tag': 5001, 'building_type': 18,
+            'x': 28.0, 'y': 28.0, 'z': 8.0,
+            'status': BuildingStatus.COMPLETED.value, 'progress': 100,
+            'started_loop': 0, 'completed_loop': 100, 'destroyed_loop': None,
+            'game_loop': 2000,
+        },
+        'building_5002': {
+            'tag': 5002, 'building_type': 21,
+            'x': 35.0, 'y': 35.0, 'z': 8.0,
+            'status': BuildingStatus.COMPLETED.value, 'progress': 100,
+            'started_loop': 500, 'completed_loop': 1000, 'destroyed_loop': None,
+            'game_loop': 2000,
+        },
+    },
+    'p2_buildings': {
+        'building_6001': {
+            'tag': 6001, 'building_type': 59,
+            'x': 128.0, 'y': 128.0, 'z': 8.0,
+            'status': BuildingStatus.COMPLETED.value, 'progress': 100,
+            'started_loop': 0, 'completed_loop': 100, 'destroyed_loop': None,
+            'game_loop': 2000,
+        },
+    },
+    'p1_economy': EconomyRecord(
+        minerals=500, vespene=250, supply_used=24, supply_cap=30, workers=16, idle_workers=2,
+    ).to_dict(),
+    'p2_economy': EconomyRecord(
+        minerals=600, vespene=300, supply_used=22, supply_cap=30, workers=18, idle_workers=1,
+    ).to_dict(),
+    'p1_upgrades': UpgradesRecord(attack_level=1, armor_level=1, shield_level=0).to_dict(),
+    'p2_upgrades': UpgradesRecord(attack_level=2, armor_level=1, shield_level=1).to_dict(),
+    'messages': [],
+})
+
+
+@lru_cache(maxsize=None)
+def create_sample_game_state(game_loop: int = 100) -> Mapping[str, Any]:
     """
     Create a sample game state dictionary.
 
+    The result is cached per game_loop and frozen at every level (nested
+    dicts are read-only views, lists are tuples); use
+    create_sample_game_state_mutable() for a copy that can be modified.
+
+    Args:
+        game_loop: Game loop number
+
+    Returns:
+        Game state dictionary as output by StateExtractor (read-only)
+    """
+    return _frozen(create_sample_game_state_mutable(game_loop))
+
+
+def create_sample_game_state_mutable(game_loop: int = 100) -> GameStateDict:
+    """
+    Create a fresh, modifiable copy of the sample game state.
+
     Args:
         game_loop: Game loop number
 
     Returns:
         Game state dictionary as output by StateExtractor
     """
-    return {
-        'game_loop': game_loop,
-        'p1_units': {
-            'p1_marine_001': {
-                'tag': 1000,
-                'unit_type_id': 48,
-                'unit_type_name': 'Marine',
-                'x': 30.0,
-                'y': 30.0,
-                'z': 8.0,
-                'facing': 0.0,
-                'health': 45.0,
-                'health_max': 45.0,
-                'shields': 0.0,
-                'shields_max': 0.0,
-                'energy': 0.0,
-                'energy_max': 0.0,
-                'state': 'existing',
-                'build_progress': 1.0,
-                'is_flying': False,
-                'is_burrowed': False,
-                'is_hallucination': False,
-                'weapon_cooldown': 0.0,
-                'attack_upgrade_level': 0,
-                'armor_upgrade_level': 0,
-                'shield_upgrade_level': 0,
-                'radius': 0.5,
-                'cargo_space_taken': 0,
-                'cargo_space_max': 0,
-                'order_count': 0,
-            },
-        },
-        'p2_units': {
-            'p2_zealot_001': {
-                'tag': 2000,
-                'unit_type_id': 73,
-                'unit_type_name': 'Zealot',
-                'x': 130.0,
-                'y': 130.0,
-                'z': 8.0,
-                'facing': 3.14,
-                'health': 100.0,
-                'health_max': 100.0,
-                'shields': 50.0,
-                'shields_max': 50.0,
-                'energy': 0.0,
-                'energy_max': 0.0,
-                'state': 'existing',
-                'build_progress': 1.0,
-                'is_flying': False,
-                'is_burrowed': False,
-                'is_hallucination': False,
-                'weapon_cooldown': 0.0,
-                'attack_upgrade_level': 0,
-                'armor_upgrade_level': 0,
-                'shield_upgrade_level': 0,
-                'radius': 0.5,
-                'cargo_space_taken': 0,
-                'cargo_space_max': 0,
-                'order_count': 1,
-            },
-        },
-        'p1_buildings': {
-            'building_5001': {
-                'tag': 5001,
-                'building_type': 21,
-                'x': 40.0,
-                'y': 40.0,
-                'z': 8.0,
-                'status': 'completed',
-                'progress': 100,
-                'started_loop': 0,
-                'completed_loop': 500,
-                'destroyed_loop': None,
-                'game_loop': game_loop,
-            },
-        },
-        'p2_buildings': {},
-        'p1_economy': {
-            'minerals': 150,
-            'vespene': 50,
-            'supply_used': 12,
-            'supply_cap': 15,
-            'workers': 6,
-            'idle_workers': 0,
-        },
-        'p2_economy': {
-            'minerals': 200,
-            'vespene': 75,
-            'supply_used': 10,
-            'supply_cap': 15,
-            'workers': 8,
-            'idle_workers': 1,
-        },
-        'p1_upgrades': {
-            'attack_level': 0,
-            'armor_level': 0,
-            'shield_level': 0,
-        },
-        'p2_upgrades': {
-            'attack_level': 1,
-            'armor_level': 0,
-            'shield_level': 0,
-        },
-        'messages': [],
-    }
+    state = _copy_state(_BASE_STATE_TEMPLATE)
+    state['game_loop'] = game_loop
+    state['p1_buildings']['building_5001']['game_loop'] = game_loop
+    return state
 
 
-def create_game_state_with_killed_unit() -> Dict[str, Any]:
+def create_game_state_with_killed_unit() -> GameStateDict:
     """Create a game state showing a killed unit."""
-    state = create_sample_game_state(game_loop=500)
+    state = create_sample_game_state_mutable(game_loop=500)
     state['p1_units']['p1_marine_002'] = {
         'tag': 1001,
-        'state': 'killed',
+        'state': UnitState.KILLED.value,
     }
     return state
 
 
-def create_game_state_with_new_unit() -> Dict[str, Any]:
+def create_game_state_with_new_unit() -> GameStateDict:
     """Create a game state showing a newly built unit."""
-    state = create_sample_game_state(game_loop=500)
-    state['p1_units']['p1_marine_002'] = {
-        'tag': 1001,
-        'unit_type_id': 48,
-        'unit_type_name': 'Marine',
-        'x': 32.0,
-        'y': 30.0,
-        'z': 8.0,
-        'facing': 0.0,
-        'health': 45.0,
-        'health_max': 45.0,
-        'shields': 0.0,
-        'shields_max': 0.0,
-        'energy': 0.0,
-        'energy_max': 0.0,
-        'state': 'built',  # Newly created
-        'build_progress': 1.0,
-        'is_flying': False,
-        'is_burrowed': False,
-        'is_hallucination': False,
-        'weapon_cooldown': 0.0,
-        'attack_upgrade_level': 0,
-        'armor_upgrade_level': 0,
-        'shield_upgrade_level': 0,
-        'radius': 0.5,
-        'cargo_space_taken': 0,
-        'cargo_space_max': 0,
-        'order_count': 0,
-    }
+    state = create_sample_game_state_mutable(game_loop=500)
+    state['p1_units']['p1_marine_002'] = replace(
+        _BASE_MARINE, tag=1001, x=32.0, state=UnitState.BUILT.value,  # Newly created
+    ).to_dict()
     return state
 
 
-def create_game_state_sequence() -> List[Dict[str, Any]]:
+def create_game_state_sequence() -> List[GameStateDict]:
     """Create a sequence of game states showing progression."""
-    states = []
+    return [_copy_state(state) for state in _game_state_sequence()]
 
-    # Frame 0: Initial state
-    states.append(create_sample_game_state(game_loop=0))
 
-    # Frame 500: Unit built
-    states.append(create_game_state_with_new_unit())
+@lru_cache(maxsize=None)
+def _game_state_sequence() -> Tuple[GameStateDict, ...]:
+    """Build the create_game_state_sequence frames once; callers get copies."""
+    return (
+        # Frame 0: Initial state
+        create_sample_game_state_mutable(game_loop=0),
 
-    # Frame 1000: Unit killed
-    states.append(create_game_state_with_killed_unit())
+        # Frame 500: Unit built
+        create_game_state_with_new_unit(),
 
-    return states
+        # Frame 1000: Unit killed
+        create_game_state_with_killed_unit(),
+    )
 
 
-def create_empty_game_state(game_loop: int = 0) -> Dict[str, Any]:
-    """Create an empty game state (game start)."""
-    return {
-        'game_loop': game_loop,
-        'p1_units': {},
-        'p2_units': {},
-        'p1_buildings': {},
-        'p2_buildings': {},
-        'p1_economy': {
-            'minerals': 50,
-            'vespene': 0,
-            'supply_used': 12,
-            'supply_cap': 15,
-            'workers': 12,
-            'idle_workers': 0,
-        },
-        'p2_economy': {
-            'minerals': 50,
-            'vespene': 0,
-            'supply_used': 12,
-            'supply_cap': 15,
-            'workers': 12,
-            'idle_workers': 0,
-        },
-        'p1_upgrades': {
-            'attack_level': 0,
-            'armor_level': 0,
-            'shield_level': 0,
-        },
-        'p2_upgrades': {
-            'attack_level': 0,
-            'armor_level': 0,
-            'shield_level': 0,
-        },
-        'messages': [],
-    }
+@lru_cache(maxsize=None)
+def create_empty_game_state(game_loop: int = 0) -> Mapping[str, Any]:
+    """Create an empty game state (game start), cached and read-only at every level."""
+    return _frozen(create_empty_game_state_mutable(game_loop))
 
 
-def create_game_state_with_messages() -> Dict[str, Any]:
+def create_empty_game_state_mutable(game_loop: int = 0) -> GameStateDict:
+    """Create a fresh, modifiable empty game state (game start)."""
+    state = _copy_state(_EMPTY_STATE_TEMPLATE)
+    state['game_loop'] = game_loop
+    return state
+
+
+def create_game_state_with_messages() -> GameStateDict:
     """Create a game state with chat messages."""
-    state = create_sample_game_state(game_loop=1000)
+    state = create_sample_game_state_mutable(game_loop=1000)
     state['messages'] = [
         {
             'game_loop': 1000,
@@ -241,138 +557,83 @@ def create_game_state_with_messages() -> Dict[str, Any]:
     return state
 
 
-def create_complex_game_state() -> Dict[str, Any]:
+def create_complex_game_state() -> GameStateDict:
     """
     Create a complex game state with multiple unit types.
 
     Useful for testing schema building and wide table conversion.
     """
+    return _copy_state(_COMPLEX_STATE_TEMPLATE)
+
+
+class NumericUnitView(MappingABC):
+    """Read-only dict-like view of one unit row in a numeric unit matrix."""
+
+    __slots__ = ('_matrix', '_row')
+
+    _COLUMN_INDEX = {name: i for i, name in enumerate(COMPLEX_UNIT_NUMERIC_COLUMNS)}
+
+    def __init__(self, matrix: np.ndarray, row: int):
+        self._matrix = matrix
+        self._row = row
+
+    def __getitem__(self, key: str) -> float:
+        return float(self._matrix[self._row, self._COLUMN_INDEX[key]])
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(COMPLEX_UNIT_NUMERIC_COLUMNS)
+
+    def __len__(self) -> int:
+        return len(COMPLEX_UNIT_NUMERIC_COLUMNS)
+
+
+def create_complex_game_state_numpy() -> Dict[str, Any]:
+    """
+    Create the numeric part of the complex game state as float32 matrices.
+
+    Rows follow the unit id lists; columns follow 'column_names'. The matrices
+    are shared and read-only. Wrap a row in NumericUnitView for dict-style
+    access.
+
+    Returns:
+        Dictionary with per-player unit matrices, unit ids and column names
+    """
     return {
-        'game_loop': 2000,
-        'p1_units': {
-            'p1_marine_001': {
-                'tag': 1001,
-                'unit_type_id': 48,
-                'unit_type_name': 'Marine',
-                'x': 30.0, 'y': 30.0, 'z': 8.0,
-                'health': 45.0, 'health_max': 45.0,
-                'shields': 0.0, 'shields_max': 0.0,
-                'energy': 0.0, 'energy_max': 0.0,
-                'state': 'existing',
-            },
-            'p1_marine_002': {
-                'tag': 1002,
-                'unit_type_id': 48,
-                'unit_type_name': 'Marine',
-                'x': 31.0, 'y': 30.0, 'z': 8.0,
-                'health': 40.0, 'health_max': 45.0,
-                'shields': 0.0, 'shields_max': 0.0,
-                'energy': 0.0, 'energy_max': 0.0,
-                'state': 'existing',
-            },
-            'p1_marauder_001': {
-                'tag': 1003,
-                'unit_type_id': 51,
-                'unit_type_name': 'Marauder',
-                'x': 32.0, 'y': 30.0, 'z': 8.0,
-                'health': 125.0, 'health_max': 125.0,
-                'shields': 0.0, 'shields_max': 0.0,
-                'energy': 0.0, 'energy_max': 0.0,
-                'state': 'existing',
-            },
-            'p1_scv_001': {
-                'tag': 1004,
-                'unit_type_id': 45,
-                'unit_type_name': 'SCV',
-                'x': 25.0, 'y': 25.0, 'z': 8.0,
-                'health': 45.0, 'health_max': 45.0,
-                'shields': 0.0, 'shields_max': 0.0,
-                'energy': 0.0, 'energy_max': 0.0,
-                'state': 'existing',
-            },
-        },
-        'p2_units': {
-            'p2_zealot_001': {
-                'tag': 2001,
-                'unit_type_id': 73,
-                'unit_type_name': 'Zealot',
-                'x': 130.0, 'y': 130.0, 'z': 8.0,
-                'health': 100.0, 'health_max': 100.0,
-                'shields': 50.0, 'shields_max': 50.0,
-                'energy': 0.0, 'energy_max': 0.0,
-                'state': 'existing',
-            },
-            'p2_zealot_002': {
-                'tag': 2002,
-                'unit_type_id': 73,
-                'unit_type_name': 'Zealot',
-                'x': 131.0, 'y': 130.0, 'z': 8.0,
-                'health': 80.0, 'health_max': 100.0,
-                'shields': 30.0, 'shields_max': 50.0,
-                'energy': 0.0, 'energy_max': 0.0,
-                'state': 'existing',
-            },
-            'p2_probe_001': {
-                'tag': 2003,
-                'unit_type_id': 84,
-                'unit_type_name': 'Probe',
-                'x': 125.0, 'y': 125.0, 'z': 8.0,
-                'health': 20.0, 'health_max': 20.0,
-                'shields': 20.0, 'shields_max': 20.0,
-                'energy': 0.0, 'energy_max': 0.0,
-                'state': 'existing',
-            },
-        },
-        'p1_buildings': {
-            'building_5001': {
-                'tag': 5001, 'building_type': 18,
-                'x': 28.0, 'y': 28.0, 'z': 8.0,
-                'status': 'completed', 'progress': 100,
-                'started_loop': 0, 'completed_loop': 100, 'destroyed_loop': None,
-                'game_loop': 2000,
-            },
-            'building_5002': {
-                'tag': 5002, 'building_type': 21,
-                'x': 35.0, 'y': 35.0, 'z': 8.0,
-                'status': 'completed', 'progress': 100,
-                'started_loop': 500, 'completed_loop': 1000, 'destroyed_loop': None,
-                'game_loop': 2000,
-            },
-        },
-        'p2_buildings': {
-            'building_6001': {
-                'tag': 6001, 'building_type': 59,
-                'x': 128.0, 'y': 128.0, 'z': 8.0,
-                'status': 'completed', 'progress': 100,
-                'started_loop': 0, 'completed_loop': 100, 'destroyed_loop': None,
-                'game_loop': 2000,
-            },
-        },
-        'p1_economy': {
-            'minerals': 500,
-            'vespene': 250,
-            'supply_used': 24,
-            'supply_cap': 30,
-            'workers': 16,
-            'idle_workers': 2,
-        },
-        'p2_economy': {
-            'minerals': 600,
-            'vespene': 300,
-            'supply_used': 22,
-            'supply_cap': 30,
-            'workers': 18,
-            'idle_workers': 1,
-        },
-        'p1_upgrades': {
-            'attack_level': 1,
-            'armor_level': 1,
-            'shield_level': 0,
-        },
-        'p2_upgrades': {
-            'attack_level': 2,
-            'armor_level': 1,
-            'shield_level': 1,
-        },
-        'messages': [],
+        'p1_unit_matrix': _COMPLEX_P1_UNIT_MATRIX,
+        'p1_unit_ids': [row[0] for row in _COMPLEX_P1_UNITS],
+        'p2_unit_matrix': _COMPLEX_P2_UNIT_MATRIX,
+        'p2_unit_ids': [row[0] for row in _COMPLEX_P2_UNITS],
+        'column_names': COMPLEX_UNIT_NUMERIC_COLUMNS,
     }
+
+
+# ============================================================================
+# Accessors
+# ============================================================================
+# Prebuilt itemgetter chains for the nested state lookups tests repeat; each
+# step runs in C instead of going through Python-level subscripting.
+
+def unit_accessor(units_key: str, unit_id: str, *attrs: str) -> Callable[[Mapping[str, Any]], Any]:
+    """
+    Build an accessor for a unit (or some of its fields) in a game state.
+
+    Args:
+        units_key: Units section, e.g. 'p1_units'
+        unit_id: Unit key within the section, e.g. 'p1_marine_001'
+        *attrs: Optional field names; one returns the value, several a tuple
+
+    Returns:
+        Callable taking a game state
+    """
+    get_units = itemgetter(units_key)
+    get_unit = itemgetter(unit_id)
+    if not attrs:
+        return lambda state: get_unit(get_units(state))
+    get_attrs = itemgetter(*attrs)
+    return lambda state: get_attrs(get_unit(get_units(state)))
+
+
+get_p1_marine = unit_accessor('p1_units', 'p1_marine_001')
+get_p1_marine_health = unit_accessor('p1_units', 'p1_marine_001', 'health')
+get_p1_marine_position = unit_accessor('p1_units', 'p1_marine_001', 'x', 'y')
+get_p2_zealot = unit_accessor('p2_units', 'p2_zealot_001')
@@ -4,17 +4,47 @@ Sample schema configurations for testing.
 Provides realistic schema definitions and column lists.
 """
 
-from typing import List, Dict, Any
-
-
-def create_minimal_schema_columns() -> List[str]:
+from __future__ import annotations
+
+from functools import lru_cache
+from types import MappingProxyType
+from typing import List, Dict, Any, Final, Mapping, Tuple
+
+
+# Column suffixes ('_<attr>') appended to entity prefixes like 'p1_marine_001'
+_BASIC_UNIT_ATTR_SUFFIXES: Final = tuple('_' + attr for attr in (
+    'x', 'y', 'z', 'health', 'health_max', 'shields', 'shields_max',
+    'energy', 'energy_max', 'state',
+))
+
+_UNIT_ATTR_SUFFIXES: Final = tuple('_' + attr for attr in (
+    'x', 'y', 'z', 'facing',
+    'health', 'health_max',
+    'shields', 'shields_max',
+    'energy', 'energy_max',
+    'state', 'build_progress',
+    'is_flying', 'is_burrowed', 'is_hallucination',
+    'weapon_cooldown',
+    'attack_upgrade_level', 'armor_upgrade_level', 'shield_upgrade_level',
+    'radius', 'cargo_space_taken', 'cargo_space_max', 'order_count',
+))
+
+_BUILDING_ATTR_SUFFIXES: Final = tuple('_' + attr for attr in (
+    'x', 'y', 'z',
+    'status', 'progress',
+    'started_loop', 'completed_loop', 'destroyed_loop',
+))
+
+
+@lru_cache(maxsize=None)
+def create_minimal_schema_columns() -> Tuple[str, ...]:
     """
     Create a minimal schema with base columns only.
 
     Returns:
-        List of column names
+        Tuple of column names (cached; copy with list() to modify)
     """
-    return [
+    return (
         # Base columns
         'game_loop',
         'timestamp_seconds',
@@ -44,25 +74,26 @@ def create_minimal_schema_columns() -> List[str]:
         'p2_upgrade_attack_level',
         'p2_upgrade_armor_level',
         'p2_upgrade_shield_level',
-    ]
+    )
 
 
-def create_schema_with_units() -> List[str]:
+def create_schema_with_units() -> Tuple[str, ...]:
     """
     Create a schema with units included.
 
     Returns:
-        List of column names including unit columns
+        Tuple of column names including unit columns (shared; copy with
+        list() to modify)
     """
-    columns = create_minimal_schema_columns()
+    return _SCHEMA_WITH_UNITS_COLUMNS
+
 
-    # Add unit columns for P1
-    unit_attrs = ['x', 'y', 'z', 'health', 'health_max', 'shields', 'shields_max',
-                  'energy', 'energy_max', 'state']
+def _build_schema_with_units() -> List[str]:
+    """Assemble the column list for create_schema_with_units."""
+    columns = list(create_minimal_schema_columns())
 
-    # Add marine columns
-    for attr in unit_attrs:
-        columns.append(f'p1_marine_001_{attr}')
+    # Add marine columns for P1
+    columns.extend(['p1_marine_001' + suffix for suffix in _BASIC_UNIT_ATTR_SUFFIXES])
 
     # Add unit count columns
     columns.append('p1_marine_count')
@@ -71,149 +102,157 @@ def create_schema_with_units() -> List[str]:
     return columns
 
 
-def create_full_schema() -> List[str]:
+# Static, so assembled once at import
+_SCHEMA_WITH_UNITS_COLUMNS: Final[Tuple[str, ...]] = tuple(_build_schema_with_units())
+
+
+def create_full_schema() -> Tuple[str, ...]:
     """
     Create a full schema with units, buildings, and all attributes.
 
     Returns:
-        Comprehensive list of column names
+        Comprehensive tuple of column names (shared; copy with list() to modify)
     """
-    columns = create_minimal_schema_columns()
-
-    # Unit attributes
-    unit_attrs = [
-        'x', 'y', 'z', 'facing',
-        'health', 'health_max',
-        'shields', 'shields_max',
-        'energy', 'energy_max',
-        'state', 'build_progress',
-        'is_flying', 'is_burrowed', 'is_hallucination',
-        'weapon_cooldown',
-        'attack_upgrade_level', 'armor_upgrade_level', 'shield_upgrade_level',
-        'radius', 'cargo_space_taken', 'cargo_space_max', 'order_count',
-    ]
+    return _FULL_SCHEMA_COLUMNS
 
-    # Add P1 units
-    for unit_id in ['marine_001', 'marine_002', 'scv_001']:
-        for attr in unit_attrs:
-            columns.append(f'p1_{unit_id}_{attr}')
-
-    # Add P2 units
-    for unit_id in ['zealot_001', 'probe_001']:
-        for attr in unit_attrs:
-            columns.append(f'p2_{unit_id}_{attr}')
-
-    # Building attributes
-    building_attrs = [
-        'x', 'y', 'z',
-        'status', 'progress',
-        'started_loop', 'completed_loop', 'destroyed_loop',
-    ]
 
-    # Add P1 buildings
-    for building_id in ['building_5001', 'building_5002']:
-        for attr in building_attrs:
-            columns.append(f'p1_{building_id}_{attr}')
+def _build_full_schema() -> List[str]:
+    """Assemble the column list for create_full_schema."""
+    columns = list(create_minimal_schema_columns())
 
-    # Add P2 buildings
-    for building_id in ['building_6001']:
-        for attr in building_attrs:
-            columns.append(f'p2_{building_id}_{attr}')
+    # Units
+    unit_prefixes = (
+        'p1_marine_001', 'p1_marine_002', 'p1_scv_001',
+        'p2_zealot_001', 'p2_probe_001',
+    )
+    columns.extend([prefix + suffix for prefix in unit_prefixes for suffix in _UNIT_ATTR_SUFFIXES])
+
+    # Buildings
+    building_prefixes = ('p1_building_5001', 'p1_building_5002', 'p2_building_6001')
+    columns.extend([
+        prefix + suffix for prefix in building_prefixes for suffix in _BUILDING_ATTR_SUFFIXES
+    ])
 
     # Unit counts
-    unit_types = ['marine', 'scv', 'marauder', 'zealot', 'probe', 'stalker']
-    for player in [1, 2]:
-        for unit_type in unit_types:
-            columns.append(f'p{player}_{unit_type}_count')
+    unit_types = ('marine', 'scv', 'marauder', 'zealot', 'probe', 'stalker')
+    columns.extend([
+        f'p{player}_{unit_type}_count' for player in (1, 2) for unit_type in unit_types
+    ])
 
     return columns
 
 
-def create_schema_documentation() -> Dict[str, Dict[str, Any]]:
+# Static, so frozen into sample_schemas_generated.py by
+# scripts/gen_schema_fixtures.py; assembled at import if that module is missing
+try:
+    from .sample_schemas_generated import _GENERATED_FULL_SCHEMA as _FULL_SCHEMA_COLUMNS
+except ImportError:
+    _FULL_SCHEMA_COLUMNS: Tuple[str, ...] = tuple(_build_full_schema())
+
+
+# Static column documentation; shared as a read-only view
+_SCHEMA_DOC_ENTRIES: Final[Dict[str, Dict[str, Any]]] = {
+    'game_loop': {
+        'description': 'Game loop number (22.4 loops per second)',
+        'type': 'int64',
+        'example': 1000,
+        'missing_value': None,
+    },
+    'timestamp_seconds': {
+        'description': 'Game time in seconds (game_loop / 22.4)',
+        'type': 'float64',
+        'example': 44.64,
+        'missing_value': None,
+    },
+    'p1_minerals': {
+        'description': 'Player 1 mineral count',
+        'type': 'int64',
+        'example': 250,
+        'missing_value': 0,
+    },
+    'p1_vespene': {
+        'description': 'Player 1 vespene gas count',
+        'type': 'int64',
+        'example': 100,
+        'missing_value': 0,
+    },
+    'p1_supply_used': {
+        'description': 'Player 1 supply/food used',
+        'type': 'int64',
+        'example': 45,
+        'missing_value': 0,
+    },
+    'p1_supply_cap': {
+        'description': 'Player 1 supply/food cap',
+        'type': 'int64',
+        'example': 46,
+        'missing_value': 0,
+    },
+    'p1_marine_001_x': {
+        'description': 'X-coordinate of player 1 marine #1',
+        'type': 'float64',
+        'example': 50.5,
+        'missing_value': 'NaN',
+    },
+    'p1_marine_001_y': {
+        'description': 'Y-coordinate of player 1 marine #1',
+        'type': 'float64',
+        'example': 30.2,
+        'missing_value': 'NaN',
+    },
+    'p1_marine_001_health': {
+        'description': 'Current health of player 1 marine #1',
+        'type': 'float64',
+        'example': 35.0,
+        'missing_value': 'NaN',
+    },
+    'p1_marine_001_state': {
+        'description': 'State of player 1 marine #1 (built/existing/killed)',
+        'type': 'string',
+        'example': 'existing',
+        'missing_value': 'NaN',
+    },
+    'p1_marine_count': {
+        'description': 'Total number of active marines for player 1',
+        'type': 'int64',
+        'example': 10,
+        'missing_value': 0,
+    },
+}
+_SCHEMA_DOC: Final[Mapping[str, Mapping[str, Any]]] = MappingProxyType({
+    column: MappingProxyType(entry) for column, entry in _SCHEMA_DOC_ENTRIES.items()
+})
+
+
+def create_schema_documentation() -> Mapping[str, Mapping[str, Any]]:
     """
     Create sample schema documentation.
 
+    Returns:
+        Read-only mapping of column names to metadata (shared instance)
+    """
+    return _SCHEMA_DOC
+
+
+def create_schema_documentation_copy() -> Dict[str, Dict[str, Any]]:
+    """
+    Create a modifiable copy of the sample schema documentation.
+
     Returns:
         Dictionary mapping column names to metadata
     """
-    return {
-        'game_loop': {
-            'description': 'Game loop number (22.4 loops per second)',
-            'type': 'int64',
-            'example': 1000,
-            'missing_value': None,
-        },
-        'timestamp_seconds': {
-            'description': 'Game time in seconds (game_loop / 22.4)',
-            'type': 'float64',
-            'example': 44.64,
-            'missing_value': None,
-        },
-        'p1_minerals': {
-            'description': 'Player 1 mineral count',
-            'type': 'int64',
-            'example': 250,
-            'missing_value': 0,
-        },
-        'p1_vespene': {
-            'description': 'Player 1 vespene gas count',
-            'type': 'int64',
-            'example': 100,
-            'missing_value': 0,
-        },
-        'p1_supply_used': {
-            'description': 'Player 1 supply/food used',
-            'type': 'int64',
-            'example': 45,
-            'missing_value': 0,
-        },
-        'p1_supply_cap': {
-            'description': 'Player 1 supply/food cap',
-            'type': 'int64',
-            'example': 46,
-            'missing_value': 0,
-        },
-        'p1_marine_001_x': {
-            'description': 'X-coordinate of player 1 marine #1',
-            'type': 'float64',
-            'example': 50.5,
-            'missing_value': 'NaN',
-        },
-        'p1_marine_001_y': {
-            'description': 'Y-coordinate of player 1 marine #1',
-            'type': 'float64',
-            'example': 30.2,
-            'missing_value': 'NaN',
-        },
-        'p1_marine_001_health': {
-            'description': 'Current health of player 1 marine #1',
-            'type': 'float64',
-            'example': 35.0,
-            'missing_value': 'NaN',
-        },
-        'p1_marine_001_state': {
-            'description': 'State of player 1 marine #1 (built/existing/killed)',
-            'type': 'string',
-            'example': 'existing',
-            'missing_value': 'NaN',
-        },
-        'p1_marine_count': {
-            'description': 'Total number of active marines for player 1',
-            'type': 'int64',
-            'example': 10,
-            'missing_value': 0,
-        },
-    }
-
-
-def create_schema_config() -> Dict[str, Any]:
+    return {column: dict(entry) for column, entry in _SCHEMA_DOC_ENTRIES.items()}
+
+
+@lru_cache(maxsize=None)
+def create_schema_config() -> Mapping[str, Any]:
     """
     Create a sample schema configuration.
 
     Returns:
-        Schema configuration dictionary
+        Schema configuration mapping (cached; read-only at every level)
     """
-    return {
+    return MappingProxyType({
         'version': '1.0.0',
         'game_version': '5.0.10',
         'extraction_date': '2024-01-25',
@@ -221,20 +260,20 @@ def create_schema_config() -> Dict[str, Any]:
         'base_columns': 14,
         'unit_columns': 100,
         'building_columns': 30,
-        'missing_value_indicators': {
+        'missing_value_indicators': MappingProxyType({
             'numeric': float('nan'),
             'string': None,
             'int': -1,
-        },
-        'data_types': {
+        }),
+        'data_types': MappingProxyType({
             'coordinates': 'float64',
             'vitals': 'float64',
             'resources': 'int64',
             'counts': 'int64',
             'states': 'string',
             'timestamps': 'int64',
-        },
-    }
+        }),
+    })
 
 
 def create_invalid_schema() -> List[str]:
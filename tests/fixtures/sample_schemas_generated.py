@@ -0,0 +1,179 @@
+"""
+Generated by scripts/gen_schema_fixtures.py -- do not edit by hand.
+
+Frozen output of create_full_schema() in sample_schemas.py.
+"""
+
+_GENERATED_FULL_SCHEMA = (
+    'game_loop',
+    'timestamp_seconds',
+    'p1_minerals',
+    'p1_vespene',
+    'p1_supply_used',
+    'p1_supply_cap',
+    'p1_workers',
+    'p1_idle_workers',
+    'p2_minerals',
+    'p2_vespene',
+    'p2_supply_used',
+    'p2_supply_cap',
+    'p2_workers',
+    'p2_idle_workers',
+    'p1_upgrade_attack_level',
+    'p1_upgrade_armor_level',
+    'p1_upgrade_shield_level',
+    'p2_upgrade_attack_level',
+    'p2_upgrade_armor_level',
+    'p2_upgrade_shield_level',
+    'p1_marine_001_x',
+    'p1_marine_001_y',
+    'p1_marine_001_z',
+    'p1_marine_001_facing',
+    'p1_marine_001_health',
+    'p1_marine_001_health_max',
+    'p1_marine_001_shields',
+    'p1_marine_001_shields_max',
+    'p1_marine_001_energy',
+    'p1_marine_001_energy_max',
+    'p1_marine_001_state',
+    'p1_marine_001_build_progress',
+    'p1_marine_001_is_flying',
+    'p1_marine_001_is_burrowed',
+    'p1_marine_001_is_hallucination',
+    'p1_marine_001_weapon_cooldown',
+    'p1_marine_001_attack_upgrade_level',
+    'p1_marine_001_armor_upgrade_level',
+    'p1_marine_001_shield_upgrade_level',
+    'p1_marine_001_radius',
+    'p1_marine_001_cargo_space_taken',
+    'p1_marine_001_cargo_space_max',
+    'p1_marine_001_order_count',
+    'p1_marine_002_x',
+    'p1_marine_002_y',
+    'p1_marine_002_z',
+    'p1_marine_002_facing',
+    'p1_marine_002_health',
+    'p1_marine_002_health_max',
+    'p1_marine_002_shields',
+    'p1_marine_002_shields_max',
+    'p1_marine_002_energy',
+    'p1_marine_002_energy_max',
+    'p1_marine_002_state',
+    'p1_marine_002_build_progress',
+    'p1_marine_002_is_flying',
+    'p1_marine_002_is_burrowed',
+    'p1_marine_002_is_hallucination',
+    'p1_marine_002_weapon_cooldown',
+    'p1_marine_002_attack_upgrade_level',
+    'p1_marine_002_armor_upgrade_level',
+    'p1_marine_002_shield_upgrade_level',
+    'p1_marine_002_radius',
+    'p1_marine_002_cargo_space_taken',
+    'p1_marine_002_cargo_space_max',
+    'p1_marine_002_order_count',
+    'p1_scv_001_x',
+    'p1_scv_001_y',
+    'p1_scv_001_z',
+    'p1_scv_001_facing',
+    'p1_scv_001_health',
+    'p1_scv_001_health_max',
+    'p1_scv_001_shields',
+    'p1_scv_001_shields_max',
+    'p1_scv_001_energy',
+    'p1_scv_001_energy_max',
+    'p1_scv_001_state',
+    'p1_scv_001_build_progress',
+    'p1_scv_001_is_flying',
+    'p1_scv_001_is_burrowed',
+    'p1_scv_001_is_hallucination',
+    'p1_scv_001_weapon_cooldown',
+    'p1_scv_001_attack_upgrade_level',
+    'p1_scv_001_armor_upgrade_level',
+    'p1_scv_001_shield_upgrade_level',
+    'p1_scv_001_radius',
+    'p1_scv_001_cargo_space_taken',
+    'p1_scv_001_cargo_space_max',
+    'p1_scv_001_order_count',
+    'p2_zealot_001_x',
+    'p2_zealot_001_y',
+    'p2_zealot_001_z',
+    'p2_zealot_001_facing',
+    'p2_zealot_001_health',
+    'p2_zealot_001_health_max',
+    'p2_zealot_001_shields',
+    'p2_zealot_001_shields_max',
+    'p2_zealot_001_energy',
+    'p2_zealot_001_energy_max',
+    'p2_zealot_001_state',
+    'p2_zealot_001_build_progress',
+    'p2_zealot_001_is_flying',
+    'p2_zealot_001_is_burrowed',
+    'p2_zealot_001_is_hallucination',
+    'p2_zealot_001_weapon_cooldown',
+    'p2_zealot_001_attack_upgrade_level',
+    'p2_zealot_001_armor_upgrade_level',
+    'p2_zealot_001_shield_upgrade_level',
+    'p2_zealot_001_radius',
+    'p2_zealot_001_cargo_space_taken',
+    'p2_zealot_001_cargo_space_max',
+    'p2_zealot_001_order_count',
+    'p2_probe_001_x',
+    'p2_probe_001_y',
+    'p2_probe_001_z',
+    'p2_probe_001_facing',
+    'p2_probe_001_health',
+    'p2_probe_001_health_max',
+    'p2_probe_001_shields',
+    'p2_probe_001_shields_max',
+    'p2_probe_001_energy',
+    'p2_probe_001_energy_max',
+    'p2_probe_001_state',
+    'p2_probe_001_build_progress',
+    'p2_probe_001_is_flying',
+    'p2_probe_001_is_burrowed',
+    'p2_probe_001_is_hallucination',
+    'p2_probe_001_weapon_cooldown',
+    'p2_probe_001_attack_upgrade_level',
+    'p2_probe_001_armor_upgrade_level',
+    'p2_probe_001_shield_upgrade_level',
+    'p2_probe_001_radius',
+    'p2_probe_001_cargo_space_taken',
+    'p2_probe_001_cargo_space_max',
+    'p2_probe_001_order_count',
+    'p1_building_5001_x',
+    'p1_building_5001_y',
+    'p1_building_5001_z',
+    'p1_building_5001_status',
+    'p1_building_5001_progress',
+    'p1_building_5001_started_loop',
+    'p1_building_5001_completed_loop',
+    'p1_building_5001_destroyed_loop',
+    'p1_building_5002_x',
+    'p1_building_5002_y',
+    'p1_building_5002_z',
+    'p1_building_5002_status',
+    'p1_building_5002_progress',
+    'p1_building_5002_started_loop',
+    'p1_building_5002_completed_loop',
+    'p1_building_5002_destroyed_loop',
+    'p2_building_6001_x',
+    'p2_building_6001_y',
+    'p2_building_6001_z',
+    'p2_building_6001_status',
+    'p2_building_6001_progress',
+    'p2_building_6001_started_loop',
+    'p2_building_6001_completed_loop',
+    'p2_building_6001_destroyed_loop',
+    'p1_marine_count',
+    'p1_scv_count',
+    'p1_marauder_count',
+    'p1_zealot_count',
+    'p1_probe_count',
+    'p1_stalker_count',
+    'p2_marine_count',
+    'p2_scv_count',
+    'p2_marauder_count',
+    'p2_zealot_count',
+    'p2_probe_count',
+    'p2_stalker_count',
+)
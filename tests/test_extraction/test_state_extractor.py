@@ -8,6 +8,15 @@ including units, buildings, economy, upgrades, and messages.
 import pytest
 from unittest.mock import Mock, patch
 from src_new.extraction.state_extractor import StateExtractor, UnitTracker, BuildingTracker
+from tests.fixtures.fake_units import make_units
+
+
+@pytest.fixture(scope='module')
+def shared_extractor():
+    """StateExtractor built once per module; tests reset() it before use."""
+    extractor = StateExtractor()
+    yield extractor
+    extractor.reset()
 
 
 @pytest.mark.unit
@@ -28,9 +37,10 @@ class TestStateExtractor:
         assert extractor.unit_tracker is not None
         assert extractor.building_tracker is not None
 
-    def test_extract_observation_structure(self, mock_observation):
+    def test_extract_observation_structure(self, shared_extractor, mock_observation):
         """Test that extract_observation returns correct structure."""
-        extractor = StateExtractor()
+        extractor = shared_extractor
+        extractor.reset()
 
         with patch.object(extractor, 'extract_units', return_value={}), \
              patch.object(extractor, 'extract_buildings', return_value={}), \
@@ -53,9 +63,10 @@ class TestStateExtractor:
             assert 'p2_upgrades' in state
             assert 'messages' in state
 
-    def test_extract_observation_calls_extractors(self, mock_observation):
+    def test_extract_observation_calls_extractors(self, shared_extractor, mock_observation):
         """Test that extract_observation calls all component extractors."""
-        extractor = StateExtractor()
+        extractor = shared_extractor
+        extractor.reset()
 
         # Mock the extractors
         with patch.object(extractor, 'extract_units', return_value={}) as mock_units, \
@@ -73,6 +84,20 @@ class TestStateExtractor:
             assert mock_upgrades.call_count == 2
             assert mock_messages.call_count == 1
 
+    def test_extract_observation_without_data_returns_empty_state(self, shared_extractor):
+        """Test that a frame with no observation data gets a fresh empty state."""
+        from src_new.extraction.state_extractor import EMPTY_ECONOMY, fresh_empty_state
+
+        first = shared_extractor.extract_observation(None, 100)
+        second = shared_extractor.extract_observation(Mock(observation=None), 100)
+
+        assert first == second == fresh_empty_state(100)
+        assert first['p1_economy'] == EMPTY_ECONOMY
+        first['p1_economy']['minerals'] = 50
+        first['p1_units']['unit_48_001'] = {}
+        assert second['p1_economy'] == EMPTY_ECONOMY
+        assert second['p1_units'] == {}
+
     def test_reset_clears_state(self):
         """Test that reset() clears all internal state."""
         extractor = StateExtractor()
@@ -113,6 +138,7 @@ class TestUnitTracker:
 
         assert unit_id == "unit_48_001"
         assert 1000 in tracker.unit_registry
+        assert tracker.unit_registry[1000] == (48, 1)
         assert tracker.unit_counters[48] == 2  # Next ID will be 2
 
     def test_assign_unit_id_existing_unit(self):
@@ -139,6 +165,68 @@ class TestUnitTracker:
         assert id2 == "unit_48_002"
         assert id3 == "unit_48_003"
 
+    def test_assign_unit_key_formats_to_unit_id(self):
+        """Test that integer unit keys map to the same IDs as assign_unit_id."""
+        tracker = UnitTracker()
+
+        key1 = tracker.assign_unit_key(tag=1000, unit_type=48)
+        key2 = tracker.assign_unit_key(tag=1001, unit_type=48)
+
+        assert tracker.assign_unit_key(tag=1000, unit_type=48) == key1
+        assert tracker.format_id(key1) == "unit_48_001"
+        assert tracker.format_id(key2) == "unit_48_002"
+        assert tracker.assign_unit_id(tag=1001, unit_type=48) == "unit_48_002"
+
+    def test_registry_grows_past_initial_capacity(self):
+        """Test that registry columns keep every unit when they grow."""
+        tracker = UnitTracker()
+        n = UnitTracker._INITIAL_CAPACITY + 10
+
+        ids = [tracker.assign_unit_id(tag=tag, unit_type=48) for tag in range(n)]
+
+        assert tracker.registered_tags.tolist() == list(range(n))
+        assert [tracker.format_id(key) for key in tracker.registered_keys.tolist()] == ids
+        assert tracker.assign_unit_id(tag=0, unit_type=48) == "unit_48_001"
+
+    def test_assign_unit_ids_bulk_matches_per_unit(self):
+        """Test that bulk assignment gives the same IDs as assigning one by one."""
+        import numpy as np
+
+        tags = [1000, 1001, 2000, 1000, 1002, 3000, 2001, 1001]
+        unit_types = [48, 48, 45, 48, 48, 48, 45, 48]
+
+        per_unit = UnitTracker()
+        per_unit.assign_unit_id(tag=1001, unit_type=48)  # Already registered
+        expected = [per_unit.assign_unit_id(tag, unit_type) for tag, unit_type in zip(tags, unit_types)]
+
+        bulk = UnitTracker()
+        bulk.assign_unit_id(tag=1001, unit_type=48)
+        ids = bulk.assign_unit_ids_bulk(np.array(tags), np.array(unit_types, dtype=np.int32))
+
+        assert ids == expected
+        assert ids[0] == "unit_48_002"
+        assert bulk.registered_tags.tolist() == per_unit.registered_tags.tolist()
+        assert bulk.registered_keys.tolist() == per_unit.registered_keys.tolist()
+        assert bulk.unit_counters == per_unit.unit_counters
+        assert bulk.unit_registry == per_unit.unit_registry
+        assert bulk.unit_registry[2001] == (45, 2)
+        assert bulk.assign_unit_id(tag=4000, unit_type=45) == "unit_45_003"
+
+    def test_registry_lookup_kernels_agree(self):
+        """Test that the NumPy and loop registry lookups return the same rows."""
+        import numpy as np
+        from src_new.extraction.state_extractor import _lookup_rows_loop, _lookup_rows_numpy
+
+        sorted_tags = np.array([3, 7, 10, 42], dtype=np.int64)
+        sorted_rows = np.array([2, 0, 3, 1], dtype=np.int64)
+        tags = np.array([42, 5, 3, 100, 10, 7], dtype=np.int64)
+
+        expected = [1, -1, 2, -1, 3, 0]
+        assert _lookup_rows_numpy(tags, sorted_tags, sorted_rows).tolist() == expected
+        assert _lookup_rows_loop(tags, sorted_tags, sorted_rows).tolist() == expected
+        empty = np.empty(0, dtype=np.int64)
+        assert _lookup_rows_loop(tags, empty, empty).tolist() == [-1] * 6
+
     def test_detect_state_new_unit(self):
         """Test detecting state for a new unit."""
         tracker = UnitTracker()
@@ -178,7 +266,7 @@ class TestUnitTracker:
         tracked = tracker.process_units([mock_unit], game_loop=0)
 
         assert len(tracked) == 1
-        unit_id = list(tracked.keys())[0]
+        unit_id = next(iter(tracked))
         assert tracked[unit_id]['state'] == 'built'
         assert tracked[unit_id]['tag'] == 1000
 
@@ -199,10 +287,50 @@ class TestUnitTracker:
 
         # Should have one entry for the killed unit
         assert len(tracked) == 1
-        unit_id = list(tracked.keys())[0]
+        unit_id = next(iter(tracked))
         assert tracked[unit_id]['state'] == 'killed'
         assert tracked[unit_id]['tag'] == 1000
 
+    def test_process_units_state_transitions(self):
+        """Test built/existing/killed states and stable IDs across frames."""
+        tracker = UnitTracker()
+
+        marine = Mock(tag=1000, unit_type=48, pos=Mock(x=30.0, y=30.0, z=8.0))
+        scv = Mock(tag=1001, unit_type=45, pos=Mock(x=25.0, y=25.0, z=8.0))
+
+        first = tracker.process_units([marine, scv], game_loop=0)
+        second = tracker.process_units([scv, marine], game_loop=100)
+        third = tracker.process_units([scv], game_loop=200)
+
+        assert {uid: u['state'] for uid, u in first.items()} == {
+            'unit_48_001': 'built', 'unit_45_001': 'built',
+        }
+        assert {uid: u['state'] for uid, u in second.items()} == {
+            'unit_48_001': 'existing', 'unit_45_001': 'existing',
+        }
+        assert third['unit_45_001']['state'] == 'existing'
+        assert third['unit_48_001'] == {'tag': 1000, 'state': 'killed', 'game_loop': 200}
+        assert tracker.previous_frame_tags == {1001}
+        with pytest.raises(AttributeError):
+            tracker.previous_frame_tags.add(1000)
+
+    def test_process_units_structured_array_matches_objects(self):
+        """Test that structured unit records track the same as unit objects."""
+        records = make_units(3, grid_width=2)
+        objects = [
+            Mock(tag=int(r['tag']), unit_type=int(r['unit_type']),
+                 pos=Mock(x=float(r['x']), y=float(r['y']), z=float(r['z'])))
+            for r in records
+        ]
+
+        from_records = UnitTracker()
+        from_objects = UnitTracker()
+
+        assert from_records.process_units(records, game_loop=0) == \
+            from_objects.process_units(objects, game_loop=0)
+        assert from_records.process_units(records[1:], game_loop=10) == \
+            from_objects.process_units(objects[1:], game_loop=10)
+
     def test_reset(self):
         """Test that reset clears all tracking state."""
         tracker = UnitTracker()
@@ -303,6 +431,21 @@ class TestBuildingTracker:
         assert tracked[building_id]['progress'] == 100
         assert tracked[building_id]['completed_loop'] == 1000
 
+    def test_process_buildings_reuses_out_dict(self):
+        """Test that a caller-supplied output dict is cleared and refilled."""
+        tracker = BuildingTracker()
+        out = {}
+
+        building = Mock(tag=5000, unit_type=21, pos=Mock(x=40.0, y=40.0, z=8.0),
+                        build_progress=0.5)
+
+        first = tracker.process_buildings([building], game_loop=0, out=out)
+        second = tracker.process_buildings([], game_loop=100, out=out)
+
+        assert first is out and second is out
+        assert list(out) == ['building_5000']
+        assert out['building_5000']['status'] == 'destroyed'
+
     def test_process_buildings_destruction(self):
         """Test detecting building destruction."""
         tracker = BuildingTracker()
@@ -324,6 +467,28 @@ class TestBuildingTracker:
         assert tracked[building_id]['status'] == 'destroyed'
         assert tracked[building_id]['destroyed_loop'] == 1000
 
+    def test_previous_frame_tags_snapshot_survives_later_frames(self):
+        """Test that previous_frame_tags hands out a copy the tracker never clears."""
+        tracker = BuildingTracker()
+        building = Mock(tag=5000, unit_type=21, pos=Mock(x=40.0, y=40.0, z=8.0), build_progress=1.0)
+
+        tracker.process_buildings([building], game_loop=0)
+        snapshot = tracker.previous_frame_tags
+        tracker.process_buildings([], game_loop=100)
+        tracker.process_buildings([], game_loop=200)
+
+        assert snapshot == {5000}
+        assert tracker.previous_frame_tags == set()
+
+        # Assigned sets are copied, not reused as frame buffers
+        assigned = {5000}
+        tracker.previous_frame_tags = assigned
+        tracked = tracker.process_buildings([], game_loop=300)
+        tracker.process_buildings([], game_loop=400)
+
+        assert tracked['building_5000']['status'] == 'destroyed'
+        assert assigned == {5000}
+
     def test_reset(self):
         """Test that reset clears all tracking state."""
         tracker = BuildingTracker()
@@ -368,10 +533,47 @@ class TestStateExtractorIntegration:
         assert states[2]['game_loop'] == 200
         assert states[3]['game_loop'] == 300
 
-    def test_extract_messages(self):
-        """Test extracting chat messages from observation."""
+    def test_extract_observations_matches_per_frame(self, mock_observation_sequence):
+        """Test that batch extraction matches extracting frame by frame."""
+        frames = [(obs, obs.observation.game_loop) for obs in mock_observation_sequence]
+
+        per_frame = StateExtractor()
+        expected = [per_frame.extract_observation(obs, loop) for obs, loop in frames]
+
+        states = StateExtractor().extract_observations(frames)
+
+        assert states == expected
+
+    def test_extract_observations_without_data_uses_empty_state(self, mock_observation_sequence):
+        """Test that batch extraction gives frames with no observation data an empty state."""
+        from src_new.extraction.state_extractor import fresh_empty_state
+
+        obs = mock_observation_sequence[0]
+        frames = [(obs, obs.observation.game_loop), (None, 50), (Mock(observation=None), 60)]
+
+        per_frame = StateExtractor()
+        expected = [per_frame.extract_observation(o, loop) for o, loop in frames]
+
+        states = StateExtractor().extract_observations(frames)
+
+        assert states == expected
+        assert states[1:] == [fresh_empty_state(50), fresh_empty_state(60)]
+
+    def test_extract_single_frame(self, mock_observation_frame):
+        """Test each frame of the sequence extracts on its own."""
         extractor = StateExtractor()
 
+        state = extractor.extract_observation(
+            mock_observation_frame, mock_observation_frame.observation.game_loop
+        )
+
+        assert state['game_loop'] == mock_observation_frame.observation.game_loop
+        assert len(state['messages']) == 0
+
+    def test_extract_messages(self, shared_extractor):
+        """Test extracting chat messages from observation."""
+        extractor = shared_extractor
+
         # Create observation with messages
         obs = Mock()
         obs.observation = Mock()
@@ -398,9 +600,9 @@ class TestStateExtractorIntegration:
         assert messages[1]['player_id'] == 2
         assert messages[1]['message'] == "u2"
 
-    def test_extract_no_messages(self, mock_observation):
+    def test_extract_no_messages(self, mock_observation, shared_extractor):
         """Test extracting when there are no messages."""
-        extractor = StateExtractor()
+        extractor = shared_extractor
 
         messages = extractor.extract_messages(mock_observation)
 
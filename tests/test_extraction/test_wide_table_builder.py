@@ -75,6 +75,70 @@ class TestWideTableBuilder:
         assert row['game_loop'] == 100
         assert row['p1_minerals'] == 50
 
+    def test_build_row_picks_up_new_schema_columns(self, builder, sample_extracted_state):
+        """Test that rows follow columns added to the schema after the first row."""
+        first = builder.build_row(sample_extracted_state)
+        assert 'p1_marauder_count' not in first
+
+        columns = list(builder.schema.get_column_list()) + ['p1_marauder_count']
+        builder.schema.get_column_list.return_value = columns
+
+        second = builder.build_row(sample_extracted_state)
+
+        assert 'p1_marauder_count' in second
+        assert list(second) == columns
+        assert 'p1_marauder_count' not in first
+
+    def test_section_fill_follows_schema_changes(self, builder, sample_extracted_state):
+        """Test that the generated economy/upgrade filler is regenerated with the schema."""
+        columns = [c for c in builder.schema.get_column_list() if c != 'p2_minerals']
+        builder.schema.get_column_list.return_value = columns
+
+        first = builder.build_row(sample_extracted_state)
+        assert 'p2_minerals' not in first
+
+        builder.schema.get_column_list.return_value = columns + ['p2_minerals']
+        second = builder.build_row(sample_extracted_state)
+
+        assert second['p2_minerals'] == sample_extracted_state['p2_economy']['minerals']
+        assert second['p1_minerals'] == sample_extracted_state['p1_economy']['minerals']
+
+    def test_compiled_row_builder_matches_generic_path(self, mock_schema, sample_schema_columns):
+        """Test that compile_row_builder() produces the same rows as the generic path."""
+        columns = list(sample_schema_columns) + [
+            'p1_marine_002_x', 'p1_marine_002_state',
+            'p1_building_5001_status', 'p1_building_5001_progress',
+        ]
+        mock_schema.get_column_list.return_value = columns
+        marine = {'x': 30.0, 'y': 31.0, 'health': 45.0, 'state': 'existing'}
+        state = {
+            'game_loop': 100,
+            'p1_units': {
+                'marine_001': marine,
+                'marine_002': {'state': 'killed'},
+                'marine_003': dict(marine, x=33.0),  # Not compiled
+            },
+            'p1_buildings': {'building_5001': {'status': 'building', 'progress': 40}},
+        }
+
+        generic = WideTableBuilder(mock_schema).build_row(state)
+        compiled_builder = WideTableBuilder(mock_schema)
+        compiled_builder.compile_row_builder(
+            {'p1': ['marine_001', 'marine_002'], 'p2': ['zealot_001']},
+            {'p1': ['building_5001']},
+        )
+        compiled = compiled_builder.build_row(state)
+
+        assert list(compiled) == list(generic)
+        for col in generic:
+            assert compiled[col] == generic[col] or (
+                np.isnan(compiled[col]) and np.isnan(generic[col])
+            ), col
+        assert compiled['p1_marine_001_x'] == 30.0
+        assert compiled['p1_marine_002_state'] == 'killed'
+        assert np.isnan(compiled['p1_marine_002_x'])
+        assert compiled['p1_building_5001_progress'] == 40
+
     def test_add_unit_to_row(self, builder):
         """Test adding unit data to row."""
         row = {}
@@ -274,6 +338,108 @@ class TestWideTableBuilder:
         assert rows[0]['game_loop'] == 0
         assert rows[4]['game_loop'] == 400
 
+    def test_build_rows_batch_timestamps_match_build_row(self, builder):
+        """Test that batch timestamps match the per-row conversion."""
+        states = [{'game_loop': loop} for loop in (0, 1, 224, 22400, 123457)]
+
+        rows = builder.build_rows_batch(states)
+
+        assert [r['timestamp_seconds'] for r in rows] == [
+            builder.build_row(state)['timestamp_seconds'] for state in states
+        ]
+        assert rows[3]['timestamp_seconds'] == pytest.approx(1000.0)
+
+    def test_build_rows_batch_skips_state_without_game_loop(self, builder):
+        """Test that a state with game_loop=None is logged and skipped, not emitted with NaN."""
+        states = [{'game_loop': 0}, {'game_loop': None}, {'game_loop': 224}]
+
+        rows = builder.build_rows_batch(states)
+
+        assert [r['game_loop'] for r in rows] == [0, 224]
+        assert rows[1]['timestamp_seconds'] == pytest.approx(10.0)
+
+        with pytest.raises(TypeError):
+            builder.build_rows_batch_columnar(states)
+
+    def test_build_rows_batch_columnar_matches_rows(self, builder, sample_schema_columns):
+        """Test that columnar batch values match the row-by-row build."""
+        states = [
+            {'game_loop': i * 100,
+             'p1_units': {'marine_001': {'x': 30.0 + i, 'state': 'existing'}},
+             'p1_economy': {'minerals': i * 50},
+             'p2_upgrades': {'attack_level': i}}
+            for i in range(3)
+        ]
+
+        columns = builder.build_rows_batch_columnar(states)
+        rows = builder.build_rows_batch(states)
+
+        assert list(columns) == list(sample_schema_columns)
+        assert columns['game_loop'] == [0, 100, 200]
+        assert columns['p1_minerals'] == [0, 50, 100]
+        assert columns['p1_marine_001_x'] == [30.0, 31.0, 32.0]
+        # NaN != NaN, so compare with missing values replaced by None
+        for col, values in columns.items():
+            actual = [v if v == v else None for v in values]
+            expected = [row[col] if row[col] == row[col] else None for row in rows]
+            assert actual == expected, col
+
+    def test_build_rows_batch_parallel_matches_columnar(self, sample_extracted_state):
+        """Test that building in worker processes gives the in-process columns."""
+        schema = SchemaManager()
+        for unit_id, unit in sample_extracted_state['p1_units'].items():
+            schema.add_unit_columns('p1', unit_id, unit)
+        builder = WideTableBuilder(schema)
+        states = [dict(sample_extracted_state, game_loop=loop) for loop in range(0, 70, 10)]
+
+        parallel = builder.build_rows_batch_parallel(states, workers=2)
+        expected = builder.build_rows_batch_columnar(states)
+
+        assert list(parallel) == list(expected)
+        assert parallel['game_loop'] == list(range(0, 70, 10))
+        for col, values in expected.items():
+            assert len(parallel[col]) == len(states)
+            assert all(
+                a == b or (a != a and b != b) for a, b in zip(parallel[col], values)
+            ), col
+
+    def test_iter_rows_batch_is_lazy(self, builder):
+        """Test that iter_rows_batch builds rows on demand and skips bad states."""
+        consumed = []
+
+        def states():
+            for loop in (0, 100, 200):
+                consumed.append(loop)
+                # The loop-100 state is malformed and should be skipped
+                yield {'game_loop': loop, 'p1_units': {} if loop != 100 else None}
+
+        rows = builder.iter_rows_batch(states())
+        first = next(rows)
+
+        assert first['game_loop'] == 0
+        assert consumed == [0]
+        assert [row['game_loop'] for row in rows] == [200]
+
+    def test_build_record_batch(self, builder, sample_schema_columns):
+        """Test building rows straight into an Arrow record batch."""
+        states = [
+            {'game_loop': i * 100,
+             'p1_units': {'marine_001': {'x': 30.0 + i, 'state': 'existing'}},
+             'p1_economy': {'minerals': i * 50}}
+            for i in range(3)
+        ]
+
+        batch = builder.build_record_batch(states)
+
+        assert batch.num_rows == 3
+        assert batch.schema.names == list(sample_schema_columns)
+        assert batch.column('game_loop').to_pylist() == [0, 100, 200]
+        assert batch.column('p1_minerals').to_pylist() == [0, 50, 100]
+        assert batch.column('p1_marine_001_x').to_pylist() == [30.0, 31.0, 32.0]
+        assert batch.column('p1_marine_001_state').to_pylist() == ['existing'] * 3
+        # Missing values become nulls
+        assert batch.column('p2_minerals').null_count == 3
+
     def test_build_rows_batch_handles_errors(self, builder, caplog):
         """Test that build_rows_batch continues on errors."""
         states = [
@@ -0,0 +1,58 @@
+"""
+Tests for the shared test fixtures.
+
+Guards checked-in generated fixture data against drifting from the
+builders it was generated from, and cached fixtures against being
+modified by the tests that share them.
+"""
+
+import pytest
+
+from tests.fixtures.sample_game_states import create_empty_game_state, create_sample_game_state
+from tests.fixtures.sample_schemas import (
+    _build_full_schema,
+    create_full_schema,
+    create_schema_config,
+    create_schema_with_units,
+)
+from tests.fixtures.sample_schemas_generated import _GENERATED_FULL_SCHEMA
+
+
+@pytest.mark.unit
+class TestGeneratedFixtures:
+    """Test suite for generated fixture modules."""
+
+    def test_generated_full_schema_is_up_to_date(self):
+        """Test that sample_schemas_generated.py matches _build_full_schema()."""
+        assert _GENERATED_FULL_SCHEMA == tuple(_build_full_schema()), (
+            "tests/fixtures/sample_schemas_generated.py is out of date; "
+            "rerun scripts/gen_schema_fixtures.py"
+        )
+        assert create_full_schema() == _GENERATED_FULL_SCHEMA
+
+
+@pytest.mark.unit
+class TestCachedFixtures:
+    """Test suite for cached, shared fixture builders."""
+
+    def test_cached_game_states_are_read_only_at_every_level(self):
+        """Test that nested sections of cached game states cannot be modified."""
+        state = create_sample_game_state()
+
+        with pytest.raises(TypeError):
+            state['p1_units']['p1_marine_001']['health'] = 0.0
+        with pytest.raises(TypeError):
+            create_empty_game_state()['p1_economy']['minerals'] = 0
+        with pytest.raises(AttributeError):
+            state['messages'].append({})
+
+        assert create_sample_game_state() is state
+
+    def test_cached_schema_fixtures_are_read_only(self):
+        """Test that cached schema config and column fixtures cannot be modified."""
+        with pytest.raises(TypeError):
+            create_schema_config()['data_types']['states'] = 'category'
+        with pytest.raises(TypeError):
+            create_schema_config()['missing_value_indicators']['int'] = 0
+
+        assert isinstance(create_schema_with_units(), tuple)
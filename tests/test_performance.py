@@ -5,9 +5,21 @@ Tests performance characteristics, memory usage, and scalability.
 """
 
 import pytest
-import time
-import sys
-from unittest.mock import Mock, patch
+import numpy as np
+from time import perf_counter_ns as _pc
+from types import MappingProxyType
+from typing import Any, Mapping, Sequence
+
+from tests.fixtures.fake_units import make_units
+
+
+# Read-only empty sections shared by generated states
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+_EMPTY_LIST: Sequence[Any] = ()
+_BASE_ECONOMY = MappingProxyType({
+    'minerals': 50, 'vespene': 0, 'supply_used': 12, 'supply_cap': 15,
+    'workers': 6, 'idle_workers': 0,
+})
 
 
 @pytest.mark.slow
@@ -21,30 +33,22 @@ class TestPerformance:
 
         tracker = UnitTracker()
 
-        # Create 1000 mock units
-        mock_units = []
-        for i in range(1000):
-            unit = Mock()
-            unit.tag = i
-            unit.unit_type = 48
-            unit.pos = Mock(x=float(i % 100), y=float(i // 100), z=8.0)
-            mock_units.append(unit)
+        # Create 1000 units
+        units = make_units(1000)
 
         # Measure processing time
-        start_time = time.time()
-        tracker.process_units(mock_units, game_loop=0)
-        elapsed = time.time() - start_time
+        t0 = _pc()
+        tracker.process_units(units, game_loop=0)
+        elapsed_ns = _pc() - t0
 
         # Should process 1000 units quickly (< 100ms)
-        assert elapsed < 0.1, f"UnitTracker too slow: {elapsed:.3f}s for 1000 units"
+        assert elapsed_ns < 100_000_000, f"UnitTracker too slow: {elapsed_ns / 1e9:.3f}s for 1000 units"
 
-    def test_wide_table_builder_performance(self):
+    def test_wide_table_builder_performance(self, base_schema_mut, bench_clock):
         """Test WideTableBuilder performance with large state."""
-        from src_new.extraction.schema_manager import SchemaManager
         from src_new.extraction.wide_table_builder import WideTableBuilder
 
-        schema = SchemaManager()
-        schema.add_base_columns()
+        schema = base_schema_mut
 
         # Add many unit columns
         for i in range(100):
@@ -76,14 +80,13 @@ class TestPerformance:
         }
 
         # Measure build time
-        start_time = time.time()
-        row = builder.build_row(state)
-        elapsed = time.time() - start_time
+        elapsed_ns = bench_clock(lambda: builder.build_row(state))
 
         # Should build row quickly (< 50ms)
-        assert elapsed < 0.05, f"WideTableBuilder too slow: {elapsed:.3f}s"
+        assert elapsed_ns < 50_000_000, f"WideTableBuilder too slow: {elapsed_ns / 1e9:.3f}s"
 
-    def test_validation_performance(self, create_mock_parquet):
+    @pytest.mark.parametrize('compression', [None, 'snappy'])
+    def test_validation_performance(self, create_mock_parquet, bench_clock, compression):
         """Test validation performance on large parquet."""
         from src_new.utils.validation import OutputValidator
 
@@ -94,42 +97,56 @@ class TestPerformance:
             'p1_minerals': [50 + i for i in range(1000)],
             'p1_vespene': [i for i in range(1000)],
             'p1_supply_used': [12 + (i % 88) for i in range(1000)],
-            'p1_supply_cap': [15 + (i % 85) for i in range(1000)],
+            'p1_supply_cap': [15 + (i % 88) for i in range(1000)],  # Always >= supply_used
         }
-        parquet = create_mock_parquet('large.parquet', data)
+        parquet = create_mock_parquet('large.parquet', data, compression=compression)
 
         validator = OutputValidator()
 
         # Measure validation time
-        start_time = time.time()
+        elapsed_ns = bench_clock(lambda: validator.validate_game_state_parquet(parquet))
         report = validator.validate_game_state_parquet(parquet)
-        elapsed = time.time() - start_time
 
         # Should validate quickly (< 500ms)
-        assert elapsed < 0.5, f"Validation too slow: {elapsed:.3f}s for 1000 rows"
+        assert elapsed_ns < 500_000_000, f"Validation too slow: {elapsed_ns / 1e9:.3f}s for 1000 rows"
+        assert report['valid'] is True
+
+    def test_metadata_validation_performance(self, create_mock_parquet, bench_clock):
+        """Test footer-based validation performance on large parquet."""
+        from src_new.utils.validation import OutputValidator
+
+        data = {
+            'game_loop': list(range(0, 100000, 10)),  # 10000 rows
+            'timestamp_seconds': [i / 22.4 for i in range(0, 100000, 10)],
+            'p1_minerals': [50 + i for i in range(10000)],
+            'p1_vespene': [i for i in range(10000)],
+        }
+        parquet = create_mock_parquet('large_metadata.parquet', data)
+
+        validator = OutputValidator()
+
+        elapsed_ns = bench_clock(lambda: validator.validate_game_state_metadata(parquet))
+        report = validator.validate_game_state_metadata(parquet)
+
+        # Should validate from the footer quickly (< 50ms)
+        assert elapsed_ns < 50_000_000, f"Metadata validation too slow: {elapsed_ns / 1e9:.3f}s for 10000 rows"
         assert report['valid'] is True
 
     def test_schema_building_performance(self):
         """Test SchemaManager performance with many columns."""
         from src_new.extraction.schema_manager import SchemaManager
 
-        schema = SchemaManager()
-
         # Measure time to add many columns
-        start_time = time.time()
-        schema.add_base_columns()
+        t0 = _pc()
+        schema = SchemaManager()
         for player in [1, 2]:
-            schema.add_economy_columns(f'p{player}')
-            schema.add_upgrade_columns(f'p{player}')
-
             # Add 100 units per player
-            for i in range(100):
-                schema.add_unit_columns(f'p{player}', 'Marine', f'{i:03d}')
+            schema.add_unit_columns_bulk(f'p{player}', 'Marine', range(100))
 
-        elapsed = time.time() - start_time
+        elapsed_ns = _pc() - t0
 
-        # Should build schema quickly
-        assert elapsed < 1.0, f"Schema building too slow: {elapsed:.3f}s"
+        # Should build schema quickly (< 1s)
+        assert elapsed_ns < 1_000_000_000, f"Schema building too slow: {elapsed_ns / 1e9:.3f}s"
 
         # Verify schema size
         columns = schema.get_column_list()
@@ -137,65 +154,58 @@ class TestPerformance:
 
     def test_memory_usage_unit_tracker(self):
         """Test memory usage of UnitTracker with many units."""
+        # sys.getsizeof only sees the container, not the keys/values it holds
+        asizeof = pytest.importorskip('pympler.asizeof').asizeof
         from src_new.extraction.state_extractor import UnitTracker
 
         tracker = UnitTracker()
 
         # Track 10000 units
-        for i in range(10000):
-            tracker.assign_unit_id(tag=i, unit_type=48)
+        tracker.assign_unit_ids_bulk(np.arange(10000), np.full(10000, 48, dtype=np.int32))
 
-        # Check memory usage is reasonable
-        registry_size = sys.getsizeof(tracker.unit_registry)
-        counters_size = sys.getsizeof(tracker.unit_counters)
-        total_size = registry_size + counters_size
+        # Check memory usage is reasonable (registry dict, id list, tag/key
+        # arrays and counters, with everything they reference)
+        total_size = asizeof(tracker)
 
         # Should use < 10MB for 10000 units
         assert total_size < 10 * 1024 * 1024, f"UnitTracker uses too much memory: {total_size / 1024 / 1024:.2f}MB"
 
     @pytest.mark.slow
-    def test_batch_row_building_performance(self):
+    def test_batch_row_building_performance(self, base_schema, bench_clock):
         """Test performance of building multiple rows."""
-        from src_new.extraction.schema_manager import SchemaManager
         from src_new.extraction.wide_table_builder import WideTableBuilder
 
-        schema = SchemaManager()
-        schema.add_base_columns()
-        schema.add_economy_columns('p1')
-        schema.add_economy_columns('p2')
-
-        builder = WideTableBuilder(schema)
+        builder = WideTableBuilder(base_schema)
 
-        # Create 1000 states
+        # Create 1000 states; the empty sections are shared read-only
+        # singletons (a write from the builder would raise)
         states = []
         for i in range(1000):
+            economy = {**_BASE_ECONOMY, 'minerals': 50 + i, 'vespene': i}
             state = {
                 'game_loop': i * 10,
-                'p1_units': {},
-                'p2_units': {},
-                'p1_buildings': {},
-                'p2_buildings': {},
-                'p1_economy': {'minerals': 50 + i, 'vespene': i, 'supply_used': 12, 'supply_cap': 15,
-                              'workers': 6, 'idle_workers': 0},
-                'p2_economy': {'minerals': 50 + i, 'vespene': i, 'supply_used': 12, 'supply_cap': 15,
-                              'workers': 6, 'idle_workers': 0},
-                'p1_upgrades': {},
-                'p2_upgrades': {},
-                'messages': [],
+                'p1_units': _EMPTY,
+                'p2_units': _EMPTY,
+                'p1_buildings': _EMPTY,
+                'p2_buildings': _EMPTY,
+                'p1_economy': economy,
+                'p2_economy': economy,
+                'p1_upgrades': _EMPTY,
+                'p2_upgrades': _EMPTY,
+                'messages': _EMPTY_LIST,
             }
             states.append(state)
 
         # Measure batch building time
-        start_time = time.time()
-        rows = builder.build_rows_batch(states)
-        elapsed = time.time() - start_time
+        elapsed_ns = bench_clock(lambda: builder.build_rows_batch_columnar(states))
+        columns = builder.build_rows_batch_columnar(states)
 
         # Should process 1000 states quickly (< 1 second)
-        assert elapsed < 1.0, f"Batch building too slow: {elapsed:.3f}s for 1000 states"
-        assert len(rows) == 1000
+        assert elapsed_ns < 1_000_000_000, f"Batch building too slow: {elapsed_ns / 1e9:.3f}s for 1000 states"
+        assert len(columns['game_loop']) == 1000
 
         # Calculate throughput
-        throughput = len(rows) / elapsed
+        throughput = len(columns['game_loop']) / (elapsed_ns / 1e9)
         print(f"\nBatch building throughput: {throughput:.0f} rows/second")
 
 
@@ -214,19 +224,12 @@ class TestScalability:
             tracker = UnitTracker()
 
             # Create units
-            mock_units = []
-            for i in range(size):
-                unit = Mock()
-                unit.tag = i
-                unit.unit_type = 48
-                unit.pos = Mock(x=float(i), y=float(i), z=8.0)
-                mock_units.append(unit)
+            units = make_units(size)
 
             # Measure time
-            start_time = time.time()
-            tracker.process_units(mock_units, game_loop=0)
-            elapsed = time.time() - start_time
-            times.append(elapsed)
+            t0 = _pc()
+            tracker.process_units(units, game_loop=0)
+            times.append(_pc() - t0)
 
         # Check that doubling size roughly doubles time (within 3x tolerance)
         # times[1] / times[0] should be close to sizes[1] / sizes[0]
@@ -236,7 +239,7 @@ class TestScalability:
         # Allow 3x tolerance for variation
         assert ratio_time < ratio_size * 3, "UnitTracker does not scale linearly"
 
-    def test_wide_table_builder_scales_with_columns(self):
+    def test_wide_table_builder_scales_with_columns(self, bench_clock):
         """Test that WideTableBuilder scales with column count."""
         from src_new.extraction.schema_manager import SchemaManager
         from src_new.extraction.wide_table_builder import WideTableBuilder
@@ -265,11 +268,8 @@ class TestScalability:
                 'messages': [],
             }
 
-            start_time = time.time()
-            builder.build_row(state)
-            elapsed = time.time() - start_time
-            times.append(elapsed)
+            times.append(bench_clock(lambda: builder.build_row(state)))
 
-        # All times should be reasonably fast
+        # All times should be reasonably fast (< 100ms)
         for t in times:
-            assert t < 0.1, f"WideTableBuilder too slow: {t:.3f}s"
+            assert t < 100_000_000, f"WideTableBuilder too slow: {t / 1e9:.3f}s"
@@ -7,6 +7,8 @@ Tests validation of extracted parquet files for quality assurance.
 import pytest
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
 from pathlib import Path
 from src_new.utils.validation import OutputValidator
 
@@ -17,9 +19,9 @@ from src_new.utils.validation import OutputValidator
 class TestOutputValidator:
     """Test suite for OutputValidator class."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def validator(self):
-        """Create OutputValidator instance."""
+        """Create OutputValidator instance (default pool, no report cache; shared by the class)."""
         return OutputValidator()
 
     @pytest.fixture
@@ -43,6 +45,45 @@ class TestOutputValidator:
         """Test OutputValidator initializes correctly."""
         assert validator is not None
 
+    def test_checks_allocate_from_the_validator_memory_pool(self, create_mock_parquet_buffer):
+        """Test that the checks' Arrow allocations use the pool given to the validator."""
+        pool = pa.proxy_memory_pool(pa.default_memory_pool())
+        validator = OutputValidator(memory_pool=pool)
+
+        report = validator.validate_game_state_parquet(create_mock_parquet_buffer({
+            'game_loop': [0, 100, 200],
+            'timestamp_seconds': [0.0, 4.46, 8.93],
+            'p1_minerals': [50, 150, 250],
+            'p1_building_5001_progress': [0.0, 50.0, 100.0],
+        }))
+
+        assert report['valid'] is True
+        assert validator.memory_pool is pool
+        assert pool.max_memory() > 0
+
+    def test_path_validations_allocate_from_the_validator_memory_pool(self, valid_parquet):
+        """Test that file and multi-file validations keep using the validator's pool."""
+        def validator_with_pool():
+            pool = pa.proxy_memory_pool(pa.default_memory_pool())
+            return OutputValidator(memory_pool=pool, cache_reports=True), pool
+
+        validator, pool = validator_with_pool()
+        assert validator.validate_game_state_parquet(valid_parquet)['valid'] is True
+        assert pool.max_memory() > 0
+
+        # A cache hit still goes through the same instance
+        assert validator.validate_game_state_parquet(valid_parquet)['valid'] is True
+
+        validator, pool = validator_with_pool()
+        reports = validator.validate_many([valid_parquet, valid_parquet], workers=2)
+        assert [r['valid'] for r in reports] == [True, True]
+        assert pool.max_memory() > 0
+
+        validator, pool = validator_with_pool()
+        reports = validator.validate_many([valid_parquet], quick=False)
+        assert [r['valid'] for r in reports] == [True]
+        assert pool.max_memory() > 0
+
     def test_validate_nonexistent_file(self, validator, tmp_path):
         """Test validating a file that doesn't exist."""
         nonexistent = tmp_path / "nonexistent.parquet"
@@ -76,14 +117,14 @@ class TestOutputValidator:
         assert report['checks']['row_count'] is False
         assert 'empty' in str(report['errors']).lower()
 
-    def test_detect_duplicate_game_loops(self, validator, create_mock_parquet):
+    def test_detect_duplicate_game_loops(self, validator, create_mock_parquet_buffer):
         """Test detecting duplicate game_loop values."""
         duplicate_data = {
             'game_loop': [0, 100, 100, 200],  # Duplicate at 100
             'timestamp_seconds': [0.0, 4.46, 4.46, 8.93],
             'p1_minerals': [50, 150, 150, 250],
         }
-        parquet = create_mock_parquet('duplicate_loops.parquet', duplicate_data)
+        parquet = create_mock_parquet_buffer(duplicate_data)
 
         report = validator.validate_game_state_parquet(parquet)
 
@@ -91,7 +132,49 @@ class TestOutputValidator:
         assert report['checks']['no_duplicate_game_loops'] is False
         assert any('duplicate' in err.lower() for err in report['errors'])
 
-    def test_detect_negative_resources(self, validator, create_mock_parquet):
+    def test_detect_duplicate_game_loops_with_nulls(self, validator):
+        """Test that repeated null game_loops count as duplicates, as in pandas."""
+        table = pa.table({
+            'game_loop': pa.array([0, None, None, 100], type=pa.int64()),
+            'timestamp_seconds': [0.0, 2.0, 2.0, 4.46],
+        })
+
+        report = validator.validate_game_state_table(table)
+
+        assert report['checks']['no_duplicate_game_loops'] is False
+        assert "Found 1 duplicate game_loop values" in report['errors']
+
+    def test_detect_nan_in_base_columns(self, validator):
+        """Test that NaN (not only null) timestamps are reported."""
+        table = pa.table({
+            'game_loop': [0, 100, 200],
+            'timestamp_seconds': [0.0, float('nan'), 8.93],
+        })
+
+        report = validator.validate_game_state_table(table)
+
+        assert report['checks']['no_nan_in_base_columns'] is False
+        assert "Base column timestamp_seconds has NaN values" in report['errors']
+
+    def test_nan_rate_counts_nulls_and_nan_together(self, validator):
+        """Test that nulls and NaN values both count towards a column's NaN rate."""
+        table = pa.table({
+            'game_loop': [0, 100],
+            'timestamp_seconds': [0.0, 4.46],
+            'p1_marine_001_x': pa.array([None, float('nan')], type=pa.float64()),
+            'p1_marine_001_state': pa.array([None, None], type=pa.string()),
+            'p1_marine_002_x': pa.array([None, 3.0], type=pa.float64()),
+        })
+        report = {'errors': [], 'warnings': [], 'checks': {}}
+
+        validator._check_nan_patterns(table, report)
+
+        assert report['warnings'] == [
+            "2 columns have >95% NaN values (might be expected for rare units)"
+        ]
+        assert report['checks']['no_nan_in_base_columns'] is True
+
+    def test_detect_negative_resources(self, validator, create_mock_parquet_buffer):
         """Test detecting negative resource values."""
         invalid_data = {
             'game_loop': [0, 100, 200],
@@ -101,7 +184,7 @@ class TestOutputValidator:
             'p1_supply_used': [12, 15, 18],
             'p1_supply_cap': [15, 23, 23],
         }
-        parquet = create_mock_parquet('negative_resources.parquet', invalid_data)
+        parquet = create_mock_parquet_buffer(invalid_data)
 
         report = validator.validate_game_state_parquet(parquet)
 
@@ -109,7 +192,46 @@ class TestOutputValidator:
         assert report['checks']['resource_validity'] is False
         assert any('negative' in err.lower() for err in report['errors'])
 
-    def test_detect_supply_violation(self, validator, create_mock_parquet):
+    def test_resource_checks_count_per_column_and_skip_missing(self, validator):
+        """Test resource counts per column, with missing (NA) values ignored."""
+        df = pd.DataFrame({
+            'game_loop': [0, 100, 200],
+            'timestamp_seconds': [0.0, 4.46, 8.93],
+            'p1_minerals': pd.array([-5, None, -1], dtype='Int64'),
+            'p2_vespene': [0, -50, 100],
+            'p2_supply_used': pd.array([12, None, 30], dtype='Int64'),
+            'p2_supply_cap': [15, 23, 23],
+        })
+        report = {'errors': [], 'checks': {}}
+
+        validator._check_resource_validity(pa.Table.from_pandas(df), report)
+
+        assert report['checks']['resource_validity'] is False
+        assert report['errors'] == [
+            "Resource constraint violation: Player 1 has negative minerals in 2 rows",
+            "Resource constraint violation: Player 2 has negative vespene in 1 rows",
+            "Resource constraint violation: Player 2 has supply_used > supply_cap in 1 rows",
+        ]
+
+    def test_numeric_block_narrows_integers_when_safe(self, validator):
+        """Test that resource blocks use int32 only when no value is lost."""
+        table = pa.table({
+            'small': [0, -5, 200],
+            'large': [0, 1, 2**40],
+            'nullable': pa.array([1, None, 3], type=pa.int64()),
+        })
+
+        narrow = validator._numeric_block(table, ['small'])
+        wide = validator._numeric_block(table, ['small', 'large'])
+        with_nulls = validator._numeric_block(table, ['small', 'nullable'])
+
+        assert narrow.dtype == np.int32
+        assert wide.dtype == np.int64
+        assert wide[2, 1] == 2**40
+        assert with_nulls.dtype == np.float64
+        assert np.isnan(with_nulls[1, 1])
+
+    def test_detect_supply_violation(self, validator, create_mock_parquet_buffer):
         """Test detecting supply_used > supply_cap."""
         invalid_data = {
             'game_loop': [0, 100],
@@ -119,20 +241,20 @@ class TestOutputValidator:
             'p1_supply_used': [12, 25],  # Exceeds cap
             'p1_supply_cap': [15, 23],
         }
-        parquet = create_mock_parquet('supply_violation.parquet', invalid_data)
+        parquet = create_mock_parquet_buffer(invalid_data)
 
         report = validator.validate_game_state_parquet(parquet)
 
         assert report['valid'] is False
         assert any('supply' in err.lower() for err in report['errors'])
 
-    def test_detect_missing_required_columns(self, validator, create_mock_parquet):
+    def test_detect_missing_required_columns(self, validator, create_mock_parquet_buffer):
         """Test detecting missing required columns."""
         incomplete_data = {
             'game_loop': [0, 100, 200],
             # Missing timestamp_seconds
         }
-        parquet = create_mock_parquet('missing_columns.parquet', incomplete_data)
+        parquet = create_mock_parquet_buffer(incomplete_data)
 
         report = validator.validate_game_state_parquet(parquet)
 
@@ -140,7 +262,26 @@ class TestOutputValidator:
         assert report['checks']['required_columns'] is False
         assert any('missing' in err.lower() for err in report['errors'])
 
-    def test_check_building_progress_monotonic(self, validator, create_mock_parquet):
+    def test_footer_failures_skip_data_reads(self, validator, create_mock_parquet_buffer, monkeypatch):
+        """Test that empty files and missing base columns fail before any column is read."""
+        def fail_read(*args, **kwargs):
+            raise AssertionError("column data read")
+
+        monkeypatch.setattr(pq.ParquetFile, 'read', fail_read)
+
+        missing = validator.validate_game_state_parquet(
+            create_mock_parquet_buffer({'game_loop': [0, 0, 100]})
+        )
+        empty = validator.validate_game_state_parquet(
+            create_mock_parquet_buffer({'game_loop': [], 'timestamp_seconds': []})
+        )
+
+        assert missing['errors'] == ["Missing required columns: ['timestamp_seconds']"]
+        assert missing['checks'] == {'row_count': True, 'required_columns': False}
+        assert empty['errors'] == ["Parquet file is empty (0 rows)"]
+        assert empty['info']['num_rows'] == 0
+
+    def test_check_building_progress_monotonic(self, validator, create_mock_parquet_buffer):
         """Test checking building progress is monotonically increasing."""
         # Valid monotonic progress
         valid_data = {
@@ -148,26 +289,254 @@ class TestOutputValidator:
             'timestamp_seconds': [0.0, 4.46, 8.93, 13.39],
             'p1_building_5001_progress': [0, 25, 75, 100],  # Monotonic
         }
-        valid_parquet = create_mock_parquet('monotonic_progress.parquet', valid_data)
+        valid_parquet = create_mock_parquet_buffer(valid_data)
 
         report = validator.validate_game_state_parquet(valid_parquet)
 
         assert report['checks'].get('building_progress_monotonic', True) is True
 
-    def test_detect_nonmonotonic_building_progress(self, validator, create_mock_parquet):
+    def test_detect_nonmonotonic_building_progress(self, validator, create_mock_parquet_buffer):
         """Test detecting building progress that decreases."""
         invalid_data = {
             'game_loop': [0, 100, 200, 300],
             'timestamp_seconds': [0.0, 4.46, 8.93, 13.39],
             'p1_building_5001_progress': [0, 50, 30, 100],  # Decreases from 50 to 30
         }
-        invalid_parquet = create_mock_parquet('nonmonotonic_progress.parquet', invalid_data)
+        invalid_parquet = create_mock_parquet_buffer(invalid_data)
 
         report = validator.validate_game_state_parquet(invalid_parquet)
 
         assert report['valid'] is False
         assert report['checks']['building_progress_monotonic'] is False
 
+    def test_building_progress_checks_every_column(self, validator):
+        """Test per-column progress issues, with missing values ignored."""
+        df = pd.DataFrame({
+            'p1_building_5001_progress': [0.0, 50.0, 30.0, 10.0],
+            'p1_building_5002_progress': [10.0, None, 5.0, 120.0],
+            'p2_building_6001_progress': pd.array([0, 40, None, 100], dtype='Int64'),
+        })
+        report = {'errors': [], 'checks': {}}
+
+        validator._check_building_progress_monotonic(df, report)
+
+        assert report['errors'] == [
+            "Building progress violation: p1_building_5001_progress decreases 2 times (should be monotonic)",
+            "Building progress violation: p1_building_5002_progress has values outside range [0, 100]",
+        ]
+
+    def test_detect_unit_count_mismatch(self, validator):
+        """Test that count columns are compared against their own unit columns only."""
+        df = pd.DataFrame({
+            'p1_marine_count': [1, 2, 2],
+            'p1_marine_001_x': [10.0, 11.0, 12.0],
+            'p1_marine_002_x': [None, 20.0, 21.0],
+            'p1_marine_002_health': [None, 45.0, 45.0],
+            'p2_zergling_count': [3, 3, 3],
+            'p2_zergling_001_x': [1.0, 1.0, 1.0],
+            'p2_zerglingx_001_x': [1.0, 1.0, 1.0],
+        })
+        report = {'warnings': [], 'checks': {}}
+
+        validator._check_unit_count_consistency(df, report)
+
+        assert report['checks']['unit_count_consistency'] is False
+        assert report['warnings'] == [
+            "Unit count mismatch: p2_zergling_count mismatches individual unit columns in 3/3 rows",
+        ]
+
+    def test_progress_scan_forms_agree(self):
+        """Test the loop (numba) and NumPy progress scans give the same results."""
+        from src_new.utils.validation import _scan_progress_loop, _scan_progress_numpy
+
+        nan = np.nan
+        progress = np.array([
+            [0.0, 10.0, nan, -1.0],
+            [50.0, nan, 40.0, 0.0],
+            [30.0, 5.0, 100.0, 0.0],
+            [10.0, 120.0, nan, 0.0],
+        ])
+
+        for scan in (_scan_progress_loop, _scan_progress_numpy):
+            out_of_range, decreases = scan(progress)
+            assert out_of_range.tolist() == [False, True, False, True]
+            assert decreases.tolist() == [2, 0, 0, 0]
+
+        out_of_range, decreases = _scan_progress_loop(np.empty((0, 2)))
+        assert out_of_range.tolist() == [False, False]
+        assert decreases.tolist() == [0, 0]
+
+    def test_validate_metadata_valid_parquet(self, validator, valid_parquet):
+        """Test footer-based validation of a correct parquet file."""
+        report = validator.validate_game_state_metadata(valid_parquet)
+
+        assert report['valid'] is True
+        assert report['checks']['row_count'] is True
+        assert report['checks']['required_columns'] is True
+        assert report['checks']['no_duplicate_game_loops'] is True
+        assert report['checks']['resource_validity'] is True
+        assert report['info']['num_rows'] == 5
+        assert report['stats']['game_loop_range'] == (0, 400)
+
+    def test_validate_metadata_matches_full_validation(self, validator, create_mock_parquet):
+        """Test that footer-based validation reports the same resource errors."""
+        invalid_data = {
+            'game_loop': [0, 100, 100],
+            'timestamp_seconds': [0.0, 4.46, 4.46],
+            'p1_minerals': [50, -100, 150],
+            'p1_vespene': [0, 50, 100],
+            'p1_supply_used': [12, 25, 18],
+            'p1_supply_cap': [15, 23, 23],
+        }
+        parquet = create_mock_parquet('invalid_metadata.parquet', invalid_data)
+
+        quick = validator.validate_game_state_metadata(parquet)
+        full = validator.validate_game_state_parquet(parquet)
+
+        assert quick['valid'] is False
+        assert quick['checks']['no_duplicate_game_loops'] is False
+        assert quick['checks']['resource_validity'] is False
+        assert sorted(quick['errors']) == sorted(full['errors'])
+
+    def test_validate_many(self, validator, valid_parquet, create_mock_parquet):
+        """Test validating several files in parallel, quick and full, in input order."""
+        bad = create_mock_parquet('bad_many.parquet', {
+            'game_loop': [0, 100, 100],
+            'timestamp_seconds': [0.0, 4.46, 4.46],
+            'p1_minerals': [50, -100, 150],
+        })
+        paths = [valid_parquet, bad]
+
+        quick = validator.validate_many(paths, workers=2)
+        full = validator.validate_many(paths, quick=False, workers=2)
+        serial = validator.validate_many(paths, quick=False, workers=1)
+
+        assert [r['file_path'] for r in quick] == [str(p) for p in paths]
+        assert [r['valid'] for r in quick] == [True, False]
+        assert [r['valid'] for r in full] == [True, False]
+        assert sorted(quick[1]['errors']) == sorted(full[1]['errors'])
+        assert [r['errors'] for r in full] == [r['errors'] for r in serial]
+
+    def test_validate_table_matches_parquet(self, validator, create_mock_parquet):
+        """Test that validating an in-memory table gives the parquet file's results."""
+        invalid_data = {
+            'game_loop': [0, 100, 100],
+            'timestamp_seconds': [0.0, 4.46, 4.46],
+            'p1_minerals': [50, -100, 150],
+            'p1_supply_used': [12, 25, 18],
+            'p1_supply_cap': [15, 23, 23],
+        }
+        parquet = create_mock_parquet('invalid_table.parquet', invalid_data)
+
+        in_memory = validator.validate_game_state_table(pa.table(invalid_data))
+        from_file = validator.validate_game_state_parquet(parquet)
+
+        assert in_memory['valid'] is False
+        assert in_memory['file_path'] == '<in-memory table>'
+        assert in_memory['errors'] == from_file['errors']
+        assert in_memory['checks'] == from_file['checks']
+        assert in_memory['info']['num_rows'] == 3
+        assert 'file_size_kb' not in in_memory['info']
+
+    def test_validation_is_memoized_per_file_version(self, create_mock_parquet, monkeypatch):
+        """Test that a caching validator reuses copies of passing reports for unchanged files."""
+        validator = OutputValidator(cache_reports=True)
+        data = {'game_loop': [0, 100], 'timestamp_seconds': [0.0, 4.46]}
+        parquet = create_mock_parquet('memo.parquet', data)
+
+        calls = []
+        validate_source = validator._validate_game_state_source
+
+        def counting(*args):
+            calls.append(args)
+            return validate_source(*args)
+
+        monkeypatch.setattr(validator, '_validate_game_state_source', counting)
+
+        first = validator.validate_game_state_parquet(parquet)
+        first['errors'].append('mutated by caller')
+        second = validator.validate_game_state_parquet(parquet)
+
+        assert len(calls) == 1
+        assert second['errors'] == []
+        assert second['file_path'] == str(parquet)
+
+        # Rewriting the file (new size) invalidates the entry; failing
+        # reports are not cached
+        create_mock_parquet('memo.parquet', {**data, 'game_loop': [0, 0]})
+        assert validator.validate_game_state_parquet(parquet)['valid'] is False
+        assert validator.validate_game_state_parquet(parquet)['valid'] is False
+        assert len(calls) == 3
+
+    def test_validation_is_not_memoized_by_default(self, create_mock_parquet, monkeypatch):
+        """Test that validators re-read files unless created with cache_reports=True."""
+        validator = OutputValidator()
+        parquet = create_mock_parquet('memo_off.parquet', {
+            'game_loop': [0, 100], 'timestamp_seconds': [0.0, 4.46],
+        })
+
+        calls = []
+        validate_source = validator._validate_game_state_source
+        monkeypatch.setattr(
+            validator, '_validate_game_state_source',
+            lambda *args: calls.append(args) or validate_source(*args),
+        )
+
+        validator.validate_game_state_parquet(parquet)
+        validator.validate_game_state_parquet(parquet)
+
+        assert len(calls) == 2
+
+    def test_validate_buffer_matches_file(self, validator, valid_parquet, create_mock_parquet_buffer):
+        """Test that a parquet buffer validates like the same file on disk."""
+        buffer = create_mock_parquet_buffer(pq.read_table(valid_parquet))
+
+        from_buffer = validator.validate_game_state_parquet(buffer)
+        from_file = validator.validate_game_state_parquet(valid_parquet)
+
+        assert from_buffer['valid'] is True
+        assert from_buffer['file_path'] == '<in-memory buffer>'
+        assert from_buffer['checks'] == from_file['checks']
+        assert from_buffer['info']['file_size_kb'] == len(buffer.getvalue()) / 1024
+
+    def test_validate_parquet_reads_only_checked_columns(self, validator, create_mock_parquet):
+        """Test that unread columns still count towards NaN rates via the footer."""
+        data = {
+            'game_loop': [0, 100, 200],
+            'timestamp_seconds': [0.0, 4.46, 8.93],
+            'p1_marine_count': [1, 1, 1],
+            'p1_marine_001_x': [10.0, 11.0, 12.0],
+            'p1_marine_001_health': pa.array([None, None, None], type=pa.float64()),
+            'p1_stalker_001_x': pa.array([None, None, None], type=pa.float64()),
+        }
+        parquet = create_mock_parquet('wide.parquet', data)
+
+        columns = validator._columns_to_read(list(data))
+        from_file = validator.validate_game_state_parquet(parquet)
+        in_memory = validator.validate_game_state_table(pa.table(data))
+
+        assert columns == ['game_loop', 'timestamp_seconds', 'p1_marine_count', 'p1_marine_001_x']
+        assert "2 columns have >95% NaN values (might be expected for rare units)" in from_file['warnings']
+        assert from_file['warnings'] == in_memory['warnings']
+        assert from_file['stats']['total_columns'] == 6
+
+    def test_unread_columns_of_stored_nan_count_towards_nan_rates(self, validator, create_mock_parquet):
+        """Test that NaN stored as non-null values in unread columns is still counted."""
+        nan = float('nan')
+        data = {
+            'game_loop': [0, 100, 200],
+            'timestamp_seconds': [0.0, 4.46, 8.93],
+            'p1_stalker_001_x': pa.array([nan, nan, nan], type=pa.float64()),
+        }
+        parquet = create_mock_parquet('stored_nan.parquet', data)
+
+        from_file = validator.validate_game_state_parquet(parquet)
+        in_memory = validator.validate_game_state_table(pa.table(data))
+
+        assert 'p1_stalker_001_x' not in validator._columns_to_read(list(data))
+        assert "1 columns have >95% NaN values (might be expected for rare units)" in from_file['warnings']
+        assert from_file['warnings'] == in_memory['warnings']
+
     def test_validate_messages_parquet(self, validator, create_mock_parquet):
         """Test validating messages parquet."""
         messages_data = {
@@ -199,6 +568,18 @@ class TestOutputValidator:
         assert report['checks']['has_messages'] is False
         assert 'acceptable' in str(report['warnings']).lower()
 
+    def test_validate_messages_missing_columns(self, validator, create_mock_parquet):
+        """Test that every missing messages column is reported."""
+        parquet = create_mock_parquet('messages_missing_columns.parquet', {
+            'game_loop': pa.array([], type=pa.int64()),
+        })
+
+        report = validator.validate_messages_parquet(parquet)
+
+        assert report['valid'] is False
+        assert report['checks']['required_columns'] is False
+        assert "Missing required columns: ['message', 'player_id']" in report['errors']
+
     def test_validate_messages_missing_file(self, validator, tmp_path):
         """Test validating missing messages file (optional)."""
         nonexistent = tmp_path / "missing_messages.parquet"
@@ -9,7 +9,9 @@ Usage:
     python verify_installation.py
 """
 
+import os
 import sys
+from importlib.metadata import PackageNotFoundError, version
 from pathlib import Path
 
 
@@ -47,7 +49,12 @@ def check_python_version():
 
 
 def check_dependencies():
-    """Check required packages."""
+    """
+    Check required packages.
+
+    Versions are read from the installed distribution metadata, so the
+    packages themselves (pysc2 in particular) are not imported.
+    """
     packages = {
         'pandas': '2.0.0',
         'pyarrow': '12.0.0',
@@ -60,10 +67,8 @@ def check_dependencies():
 
     for package, min_version in packages.items():
         try:
-            mod = __import__(package)
-            version = getattr(mod, '__version__', 'unknown')
-            results.append((package, True, f"{package} {version}"))
-        except ImportError:
+            results.append((package, True, f"{package} {version(package)}"))
+        except PackageNotFoundError:
             results.append((package, False, f"{package} not installed\nInstall: pip install {package}"))
             all_ok = False
 
@@ -82,30 +87,49 @@ def check_sc2_installation():
         return False, f"SC2 not found: {e}\nInstall from: https://starcraft2.com/"
 
 
+# Pipeline files checked by check_pipeline_structure (relative to the
+# project root), and the directories that hold them
+REQUIRED_FILES = (
+    'src_new/__init__.py',
+    'src_new/extraction/state_extractor.py',
+    'src_new/extraction/wide_table_builder.py',
+    'src_new/extraction/schema_manager.py',
+    'src_new/extraction/parquet_writer.py',
+    'src_new/pipeline/extraction_pipeline.py',
+    'src_new/pipeline/parallel_processor.py',
+    'src_new/utils/validation.py',
+    'tests/conftest.py',
+    'run_tests.py',
+)
+_REQUIRED_DIRS = frozenset(os.path.dirname(file_path) for file_path in REQUIRED_FILES)
+
+# Per-player extractor dictionaries a StateExtractor must hold
+QUICK_TEST_COMPONENTS = frozenset({
+    'unit_extractors',
+    'building_extractors',
+    'economy_extractors',
+    'upgrade_extractors',
+})
+
+
 def check_pipeline_structure():
     """Check pipeline files exist."""
-    required_files = [
-        'src_new/__init__.py',
-        'src_new/extraction/state_extractor.py',
-        'src_new/extraction/wide_table_builder.py',
-        'src_new/extraction/schema_manager.py',
-        'src_new/extraction/parquet_writer.py',
-        'src_new/pipeline/extraction_pipeline.py',
-        'src_new/pipeline/parallel_processor.py',
-        'src_new/utils/validation.py',
-        'tests/conftest.py',
-        'run_tests.py',
-    ]
-
-    missing = []
-    found = []
-
-    for file_path in required_files:
-        path = Path(file_path)
-        if path.exists():
-            found.append(file_path)
-        else:
-            missing.append(file_path)
+    required_files = REQUIRED_FILES
+
+    # List each containing directory once instead of stat-ing every file
+    present = set()
+    for directory in _REQUIRED_DIRS:
+        try:
+            with os.scandir(directory or '.') as entries:
+                present.update(
+                    f"{directory}/{entry.name}" if directory else entry.name
+                    for entry in entries if entry.is_file()
+                )
+        except OSError:
+            continue
+
+    found = [file_path for file_path in required_files if file_path in present]
+    missing = [file_path for file_path in required_files if file_path not in present]
 
     all_ok = len(missing) == 0
 
@@ -154,11 +178,10 @@ def run_quick_test():
         # Try to create extractor
         extractor = StateExtractor()
 
-        # Check it has the right components
-        assert hasattr(extractor, 'unit_extractor')
-        assert hasattr(extractor, 'building_extractor')
-        assert hasattr(extractor, 'economy_extractor')
-        assert hasattr(extractor, 'upgrade_extractor')
+        # Check it has the right components (one set difference against the
+        # instance attributes)
+        missing = QUICK_TEST_COMPONENTS.difference(vars(extractor))
+        assert not missing, f"StateExtractor missing components: {sorted(missing)}"
 
         return True, "StateExtractor instantiates correctly"
     except Exception as e: